@@ -68,26 +68,41 @@ class UserProfile(models.Model):
         cnt = ServiceRequest.objects.filter(status='P', assignee=self.user).count()
         return cnt
 
+    def get_team_memberships(self):
+        """
+        사용자의 팀 소속 목록 (가입 순). 인스턴스 단위로 한 번만 조회해 보관합니다.
+        request.user.profile 은 요청마다 새로 로드되므로 요청 범위 캐시로 동작하며,
+        여러 사용자를 다룰 때는 prefetch_team_memberships 로 한 번에 채울 수 있습니다.
+        """
+        memberships = getattr(self, '_team_memberships_cache', None)
+        if memberships is None:
+            from teams.models import TeamMembership
+            memberships = list(
+                TeamMembership.objects.filter(user_id=self.user_id).select_related('team').order_by('pk')
+            )
+            self._team_memberships_cache = memberships
+        return memberships
+
+    def clear_team_membership_cache(self):
+        self.__dict__.pop('_team_memberships_cache', None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.clear_team_membership_cache()
+        super().refresh_from_db(*args, **kwargs)
+
+    def _primary_membership(self):
+        memberships = self.get_team_memberships()
+        # 팀장인 팀이 있으면 우선, 그 외에는 첫 번째 팀
+        for membership in memberships:
+            if membership.role == 'leader':
+                return membership
+        return memberships[0] if memberships else None
+
     @property
     def primary_team(self):
         """사용자의 주요 팀 반환 (첫 번째 팀 또는 팀장인 팀)"""
-        from teams.models import TeamMembership
-        
-        # 팀장인 팀이 있으면 우선 반환
-        leader_membership = TeamMembership.objects.filter(
-            user=self.user, 
-            role='leader'
-        ).select_related('team').first()
-        
-        if leader_membership:
-            return leader_membership.team
-        
-        # 그 외에는 첫 번째 팀 반환
-        first_membership = TeamMembership.objects.filter(
-            user=self.user
-        ).select_related('team').first()
-        
-        return first_membership.team if first_membership else None
+        membership = self._primary_membership()
+        return membership.team if membership else None
 
     @property
     def team_names(self):
@@ -101,21 +116,42 @@ class UserProfile(models.Model):
     @property
     def current_team_role(self):
         """현재 주요 팀에서의 역할 반환"""
-        from teams.models import TeamMembership
-        team = TeamMembership.objects.filter(
-            user=self.user, 
-            team=self.primary_team
-        ).select_related('team').first()
-        
-        if team:
-            return team.role
+        membership = self._primary_membership()
+        if membership:
+            return membership.role
         return self.team_role  # 기본값으로 모델 필드 값 반환
 
 
     @property
     def department_display(self):
         """부서 정보 대신 팀 정보 반환 (하위 호환성)"""
-        return self.primary_team.name if self.primary_team else "미배정"
+        team = self.primary_team
+        return team.name if team else "미배정"
+
+
+def prefetch_team_memberships(users):
+    """
+    여러 사용자의 팀 소속을 한 번의 쿼리로 조회해 각 프로필에 채웁니다.
+    이후 primary_team / current_team_role / department_display 는 추가 쿼리 없이 동작합니다.
+    users 는 프로필이 select_related 된 User 목록을 권장합니다.
+    """
+    from teams.models import TeamMembership
+
+    profiles = {}
+    for user in users:
+        profile = getattr(user, 'profile', None)
+        if profile is not None:
+            profiles[user.pk] = profile
+    if not profiles:
+        return
+
+    memberships_by_user = {user_id: [] for user_id in profiles}
+    memberships = TeamMembership.objects.filter(user_id__in=profiles).select_related('team').order_by('pk')
+    for membership in memberships:
+        memberships_by_user[membership.user_id].append(membership)
+    for user_id, profile in profiles.items():
+        profile._team_memberships_cache = memberships_by_user[user_id]
+
 
 # User 생성 시 자동으로 UserProfile 생성
 @receiver(post_save, sender=User)
@@ -9,7 +9,7 @@ from django.urls import reverse
 from django.utils import timezone
 from django.contrib.auth import login
 from django.contrib.auth.views import LoginView
-from .models import UserProfile
+from .models import UserProfile, prefetch_team_memberships
 from .forms import UserProfileForm, UserUpdateForm, UserCreationFormWithProfile, TeamCreationForm, FirstLoginPasswordChangeForm
 from teams.models import Team, TeamMembership
 from common.message_views import send_kakao_message
@@ -211,6 +211,9 @@ def user_list(request):
     paginator = Paginator(users, 20)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    # 목록에 표시할 주요 팀을 사용자별로 조회하지 않도록 한 번에 조회
+    page_obj.object_list = list(page_obj.object_list)
+    prefetch_team_memberships(page_obj.object_list)
     
     # 필터 옵션을 위한 데이터
     teams = Team.objects.all()
@@ -1,5 +1,6 @@
 """Service layer for miscellaneous application features."""
 
 from .report_review import review_last_4_weeks, generate_writing_guide
+from .review_batch import run_review_batch
 
-__all__ = ["review_last_4_weeks", "generate_writing_guide"]
+__all__ = ["review_last_4_weeks", "generate_writing_guide", "run_review_batch"]
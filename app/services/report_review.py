@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.utils.html import strip_tags
+from django.db.models import BooleanField, ExpressionWrapper, Q
 
 from worklog.models import Worklog
 from reports.models import ReportReview
 
+from common.text_normalize import html_to_text
 from common.gemini_utils import (
     get_gemini_client,
     get_gemini_generation_config,
@@ -49,12 +52,21 @@ class WeekWindow:
     week_start: date
 
 
-def review_last_4_weeks(user: User, as_of: Optional[date] = None) -> Dict[str, Any]:
+def review_last_4_weeks(
+    user: User,
+    as_of: Optional[date] = None,
+    raise_errors: bool = False,
+    force_refresh: bool = False,
+) -> Dict[str, Any]:
     """Run Gemini-based audit for the user's latest four weeks of worklogs.
 
     Args:
         user: Authenticated user requesting their own report review.
         as_of: Optional anchor date; defaults to today when omitted.
+        raise_errors: Re-raise the retryable exceptions from
+            ``get_handled_exceptions`` instead of returning the fallback, so
+            batch callers can retry with backoff.
+        force_refresh: Skip the Gemini response cache and regenerate.
 
     Returns:
         Parsed JSON dictionary produced by Gemini. Falls back to a guarded
@@ -63,7 +75,9 @@ def review_last_4_weeks(user: User, as_of: Optional[date] = None) -> Dict[str, A
 
     anchor = as_of or date.today()
     weeks = _compute_weeks(anchor)
-    entries = _collect_worklogs(user, weeks)
+    worklog_map = _load_worklog_map(user, weeks)
+    entries = _collect_worklogs(worklog_map, weeks)
+    input_digest = compute_input_digest(worklog_map, weeks)
     logger.debug("Collected %s weeks for review", len(entries))
 
     prompt = _build_prompt(user, entries, anchor)
@@ -85,8 +99,12 @@ def review_last_4_weeks(user: User, as_of: Optional[date] = None) -> Dict[str, A
             model=model_name,
             contents=full_prompt,
             config=_generation_config(),
+            force_refresh=force_refresh,
         )
     except tuple(get_handled_exceptions()) as exc:  # type: ignore[arg-type]
+        if raise_errors:
+            logger.warning("Gemini request failed for user=%s: %s", user.pk, exc)
+            raise
         logger.exception("Gemini request failed: %s", exc)
         return _fallback_result(str(exc))
     except Exception as exc:  # pragma: no cover - defensive
@@ -105,7 +123,9 @@ def review_last_4_weeks(user: User, as_of: Optional[date] = None) -> Dict[str, A
         fallback = _fallback_result("malformed_json")
         fallback["raw"] = raw_text
         payload = fallback
-    
+        # 실패한 리뷰는 입력 해시를 남기지 않아 --stale 재실행 대상에 포함되도록 함
+        input_digest = ''
+
     # 리뷰 결과를 데이터베이스에 저장
     try:
         review_year, review_week, _ = anchor.isocalendar()
@@ -115,6 +135,7 @@ def review_last_4_weeks(user: User, as_of: Optional[date] = None) -> Dict[str, A
             week_number=review_week,
             defaults={
                 'review_content': payload,
+                'input_digest': input_digest,
                 'notification_sent': False  # 새 리뷰가 생성되었으므로 알림 미발송 상태로 설정
             }
         )
@@ -138,31 +159,87 @@ def _compute_weeks(anchor: date) -> List[WeekWindow]:
     return windows
 
 
-def _clean_html(text: Optional[str]) -> str:
-    if not text:
-        return ""
-    import re
-    import html
-    # 줄바꿈 태그를 실제 개행문자로 변환
-    text = re.sub(r'<(?:br|/p|/div)>', '\n', text, flags=re.IGNORECASE)
-    # 나머지 태그 제거 및 HTML 엔티티 복원
-    text = strip_tags(text)
-    text = html.unescape(text)
-    # 가독성을 위해 연속된 개행은 하나로 줄임
-    text = re.sub(r'\n\s*\n+', '\n', text)
-    return text.strip()
+def _worklog_window_queryset(windows: Sequence[WeekWindow]):
+    years = {window.year for window in windows}
+    week_numbers = {window.week_number for window in windows}
+    return (
+        Worklog.objects.filter(year__in=years, week_number__in=week_numbers)
+        .only("author_id", "year", "week_number", "this_week_work", "next_week_plan", "updated_at")
+        .order_by()
+    )
+
+
+def _load_worklog_map(user: User, windows: Iterable[WeekWindow]) -> Dict[Tuple[int, int], Worklog]:
+    queryset = _worklog_window_queryset(list(windows)).filter(author=user)
+    return {(worklog.year, worklog.week_number): worklog for worklog in queryset}
 
 
-def _collect_worklogs(user: User, windows: Iterable[WeekWindow]) -> List[Dict[str, Any]]:
-    window_list = list(windows)
-    years = {window.year for window in window_list}
-    week_numbers = {window.week_number for window in window_list}
+def compute_input_digest(
+    worklog_map: Dict[Tuple[int, int], Worklog], windows: Iterable[WeekWindow]
+) -> str:
+    """Return a SHA-256 digest of the raw worklog text in the review window.
 
-    queryset = (
-        Worklog.objects.filter(author=user, year__in=years, week_number__in=week_numbers)
-        .only("year", "week_number", "this_week_work", "next_week_plan")
+    The digest changes whenever a worklog in one of the four weeks is added,
+    removed or edited, which marks the stored review as stale.
+    """
+    hasher = hashlib.sha256()
+    for window in windows:
+        worklog = worklog_map.get((window.year, window.week_number))
+        if worklog is None:
+            part = f"{window.year}-{window.week_number}:-"
+        else:
+            part = f"{window.year}-{window.week_number}:{worklog.this_week_work}\x1f{worklog.next_week_plan}"
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x1e")
+    return hasher.hexdigest()
+
+
+def find_reviews_to_refresh(user_ids: Iterable[int], as_of: date) -> Tuple[Set[int], Set[int]]:
+    """Split ``user_ids`` into users with a missing review and users with a stale one.
+
+    Uses one query for the four-week worklog window and one for the existing
+    reviews of the anchor week. Failed (fallback) reviews are always stale.
+    Reviews saved before digests were recorded are treated as stale only when
+    a worklog in the window changed after them.
+    """
+    user_ids = set(user_ids)
+    windows = _compute_weeks(as_of)
+    review_year, review_week, _ = as_of.isocalendar()
+
+    worklogs_by_user: Dict[int, Dict[Tuple[int, int], Worklog]] = defaultdict(dict)
+    for worklog in _worklog_window_queryset(windows).filter(author_id__in=user_ids):
+        worklogs_by_user[worklog.author_id][(worklog.year, worklog.week_number)] = worklog
+
+    reviews = ReportReview.objects.filter(
+        user_id__in=user_ids, year=review_year, week_number=review_week
+    ).only("user_id", "input_digest", "updated_at").annotate(
+        failed=ExpressionWrapper(Q(review_content__has_key="error"), output_field=BooleanField())
     )
-    worklog_map = {(worklog.year, worklog.week_number): worklog for worklog in queryset}
+    review_map = {review.user_id: review for review in reviews}
+
+    missing: Set[int] = set()
+    stale: Set[int] = set()
+    for user_id in user_ids:
+        review = review_map.get(user_id)
+        if review is None:
+            missing.add(user_id)
+            continue
+        worklog_map = worklogs_by_user.get(user_id, {})
+        if review.failed:
+            # AI 점검 실패(_fallback_result)로 저장된 리뷰는 항상 다시 생성
+            stale.add(user_id)
+        elif review.input_digest:
+            if review.input_digest != compute_input_digest(worklog_map, windows):
+                stale.add(user_id)
+        elif any(worklog.updated_at > review.updated_at for worklog in worklog_map.values()):
+            stale.add(user_id)
+    return missing, stale
+
+
+def _collect_worklogs(
+    worklog_map: Dict[Tuple[int, int], Worklog], windows: Iterable[WeekWindow]
+) -> List[Dict[str, Any]]:
+    window_list = list(windows)
 
     entries: List[Dict[str, Any]] = []
     for window in window_list:
@@ -173,8 +250,8 @@ def _collect_worklogs(user: User, windows: Iterable[WeekWindow]) -> List[Dict[st
                 "week_number": window.week_number,
                 "week_start": window.week_start,
                 "week_end": window.week_start + timedelta(days=6),
-                "this_week_work": _clean_html(worklog.this_week_work) if worklog else "",
-                "next_week_plan": _clean_html(worklog.next_week_plan) if worklog else "",
+                "this_week_work": html_to_text(worklog.this_week_work) if worklog else "",
+                "next_week_plan": html_to_text(worklog.next_week_plan) if worklog else "",
                 "has_worklog": worklog is not None,
             }
         )
@@ -435,9 +512,9 @@ def _build_guide_prompt(user: User, worklogs: Sequence[Worklog]) -> str:
             title = f"- {worklog.year}년 {worklog.week_number}주차 ({worklog.week_start_date.isoformat()} ~ {worklog.week_end_date.isoformat()})"
             lines.append(title)
             lines.append("  - 금주 실적:")
-            lines.append(f"    {_clean_html(worklog.this_week_work) or '(내용 없음)'}")
+            lines.append(f"    {html_to_text(worklog.this_week_work) or '(내용 없음)'}")
             lines.append("  - 차주 계획:")
-            lines.append(f"    {_clean_html(worklog.next_week_plan) or '(내용 없음)'}")
+            lines.append(f"    {html_to_text(worklog.next_week_plan) or '(내용 없음)'}")
             lines.append("")
 
     lines.extend(
@@ -517,4 +594,9 @@ def generate_writing_guide(user: User) -> Dict[str, Any]:
         logger.exception("Malformed JSON from Gemini for guide: %s", raw_text)
         return {"error": "AI가 잘못된 형식의 응답을 반환했습니다."}
 
-__all__ = ["review_last_4_weeks", "generate_writing_guide"]
+__all__ = [
+    "review_last_4_weeks",
+    "generate_writing_guide",
+    "compute_input_digest",
+    "find_reviews_to_refresh",
+]
@@ -0,0 +1,197 @@
+"""Concurrent batch runner for AI weekly report reviews."""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from common.gemini_utils import get_handled_exceptions
+from common.rate_limiter import TokenBucket
+
+from .report_review import review_last_4_weeks
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReviewJobResult:
+    """Outcome of generating one user's review (including retries)."""
+
+    user_id: int
+    username: str
+    success: bool
+    attempts: int
+    latency: float
+    error: str = ""
+
+
+@dataclass
+class ReviewBatchSummary:
+    """Aggregated outcome of a review batch run."""
+
+    results: List[ReviewJobResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    concurrency: int = 1
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for result in self.results if result.success)
+
+    @property
+    def fail_count(self) -> int:
+        return len(self.results) - self.success_count
+
+    @property
+    def retry_count(self) -> int:
+        return sum(result.attempts - 1 for result in self.results)
+
+    @property
+    def throughput_per_minute(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.results) / self.elapsed * 60
+
+    def latency_percentiles(self, percentiles: Sequence[int] = (50, 90, 95, 99)) -> Dict[str, float]:
+        latencies = sorted(result.latency for result in self.results)
+        stats = {f"p{p}": _percentile(latencies, p) for p in percentiles}
+        stats["max"] = latencies[-1] if latencies else 0.0
+        return stats
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _review_with_retry(
+    user: User,
+    as_of: Optional[date],
+    bucket: TokenBucket,
+    max_retries: int,
+    backoff_seconds: float,
+    force_refresh: bool = False,
+) -> ReviewJobResult:
+    handled_exceptions = tuple(get_handled_exceptions())
+    started = time.monotonic()
+    attempts = 0
+    error = ""
+
+    while True:
+        attempts += 1
+        bucket.acquire()
+        try:
+            result = review_last_4_weeks(
+                user, as_of=as_of, raise_errors=True, force_refresh=force_refresh
+            )
+        except handled_exceptions as exc:  # type: ignore[misc]
+            error = str(exc) or exc.__class__.__name__
+            if attempts > max_retries:
+                logger.error("Review for user=%s failed after %s attempts: %s", user.pk, attempts, exc)
+                break
+            delay = backoff_seconds * (2 ** (attempts - 1))
+            delay += random.uniform(0, backoff_seconds)
+            logger.warning(
+                "Retrying review for user=%s in %.1fs (attempt %s/%s): %s",
+                user.pk, delay, attempts, max_retries + 1, exc,
+            )
+            time.sleep(delay)
+            continue
+        except Exception as exc:
+            logger.exception("Unexpected error while reviewing user=%s", user.pk)
+            error = str(exc) or exc.__class__.__name__
+            break
+
+        error = result.get("error") or ""
+        break
+
+    return ReviewJobResult(
+        user_id=user.pk,
+        username=user.username,
+        success=not error,
+        attempts=attempts,
+        latency=time.monotonic() - started,
+        error=error,
+    )
+
+
+def run_review_batch(
+    users: Iterable[User],
+    as_of: Optional[date] = None,
+    concurrency: Optional[int] = None,
+    rate_per_minute: Optional[float] = None,
+    burst: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_seconds: Optional[float] = None,
+    on_result: Optional[Callable[[ReviewJobResult], None]] = None,
+    force_refresh: bool = False,
+) -> ReviewBatchSummary:
+    """Generate AI reviews for ``users`` with bounded concurrency.
+
+    Calls are paced by a shared token bucket so the wall-clock time follows the
+    Gemini quota instead of a fixed delay. Retryable API errors are retried
+    with exponential backoff. ``on_result`` is invoked on the calling thread as
+    each user finishes; an exception raised from it stops the batch after the
+    in-flight users complete. ``force_refresh`` bypasses the Gemini response cache.
+    Unspecified options fall back to the ``REVIEW_BATCH_*`` settings.
+    """
+    concurrency = max(concurrency or getattr(settings, "REVIEW_BATCH_CONCURRENCY", 4), 1)
+    if rate_per_minute is None:
+        rate_per_minute = getattr(settings, "REVIEW_BATCH_RATE_PER_MINUTE", 20)
+    if burst is None:
+        burst = getattr(settings, "REVIEW_BATCH_BURST", concurrency)
+    if max_retries is None:
+        max_retries = getattr(settings, "REVIEW_BATCH_MAX_RETRIES", 3)
+    if backoff_seconds is None:
+        backoff_seconds = getattr(settings, "REVIEW_BATCH_BACKOFF_SECONDS", 2.0)
+
+    bucket = TokenBucket(rate_per_minute, capacity=burst)
+    user_list = list(users)
+    summary = ReviewBatchSummary(concurrency=concurrency)
+    started = time.monotonic()
+
+    def collect(result: ReviewJobResult) -> None:
+        summary.results.append(result)
+        if on_result:
+            on_result(result)
+
+    if concurrency == 1:
+        for user in user_list:
+            collect(_review_with_retry(user, as_of, bucket, max_retries, backoff_seconds, force_refresh))
+    else:
+        def worker(user: User) -> ReviewJobResult:
+            try:
+                return _review_with_retry(
+                    user, as_of, bucket, max_retries, backoff_seconds, force_refresh
+                )
+            finally:
+                # 스레드별 DB 커넥션이 남지 않도록 정리
+                connection.close()
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="review-batch")
+        try:
+            futures = [executor.submit(worker, user) for user in user_list]
+            for future in as_completed(futures):
+                collect(future.result())
+        finally:
+            # on_result 에서 예외(작업 취소 등)가 발생하면 아직 시작하지 않은 사용자는 건너뜀
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    summary.elapsed = time.monotonic() - started
+    return summary
+
+
+__all__ = ["ReviewJobResult", "ReviewBatchSummary", "run_review_batch"]
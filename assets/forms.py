@@ -147,3 +147,4 @@ class RegularInspectionForm(forms.ModelForm):
 
 class ExcelUploadForm(forms.Form):
     excel_file = forms.FileField(label='엑셀 파일 선택')
+    dry_run = forms.BooleanField(label='미리보기 (저장하지 않음)', required=False)
@@ -4,9 +4,9 @@ Helper utilities for creating AssetHistory records
 from .models import AssetHistory
 
 
-def create_asset_history(asset_type, asset, action, user=None, comment='', **kwargs):
+def build_asset_history(asset_type, asset, action, user=None, comment='', **kwargs):
     """
-    Create an AssetHistory record
+    Build an unsaved AssetHistory record (for bulk_create_asset_history)
     
     Args:
         asset_type: 'SYSTEM', 'CONTRACT', 'HARDWARE', or 'SOFTWARE'
@@ -17,7 +17,7 @@ def create_asset_history(asset_type, asset, action, user=None, comment='', **kwa
         **kwargs: Additional fields (related_system, related_contract, changed_fields, etc.)
     
     Returns:
-        AssetHistory instance
+        Unsaved AssetHistory instance
     """
     history_data = {
         'asset_type': asset_type,
@@ -39,4 +39,40 @@ def create_asset_history(asset_type, asset, action, user=None, comment='', **kwa
     # Add any additional fields
     history_data.update(kwargs)
     
-    return AssetHistory.objects.create(**history_data)
+    return AssetHistory(**history_data)
+
+
+def create_asset_history(asset_type, asset, action, user=None, comment='', **kwargs):
+    """
+    Create an AssetHistory record (same arguments as build_asset_history)
+
+    Returns:
+        AssetHistory instance
+    """
+    history = build_asset_history(asset_type, asset, action, user=user, comment=comment, **kwargs)
+    history.save()
+    return history
+
+
+def bulk_create_asset_history(histories):
+    """Save several unsaved AssetHistory records in one INSERT"""
+    histories = list(histories)
+    if not histories:
+        return []
+    return AssetHistory.objects.bulk_create(histories)
+
+
+def build_update_histories(asset_type, assets, user=None, comment=''):
+    """
+    Build UPDATE histories for assets changed in memory since they were loaded
+    (FieldSnapshotMixin), e.g. before a bulk_update that bypasses save signals.
+    Assets without changes are skipped. Call reset_field_snapshot() after saving.
+    """
+    histories = []
+    for asset in assets:
+        changes = asset.get_field_changes()
+        if changes:
+            histories.append(
+                build_asset_history(asset_type, asset, 'UPDATE', user=user, comment=comment, changed_fields=changes)
+            )
+    return histories
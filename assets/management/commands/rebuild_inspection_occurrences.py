@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from assets.services import rebuild_inspection_occurrences
+
+
+class Command(BaseCommand):
+    help = '정기점검 월별 현황(InspectionOccurrence)을 계약/점검 내역으로부터 전체 다시 계산합니다'
+
+    def handle(self, *args, **options):
+        count = rebuild_inspection_occurrences()
+        self.stdout.write(self.style.SUCCESS(f'정기점검 월별 현황 {count}건 재생성 완료'))
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:45
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# assets.services.compute_inspection_occurrences 의 마이그레이션 시점 사본.
+# 이후 서비스 코드가 바뀌어도 이 마이그레이션은 그대로 동작하도록 복사해 둡니다.
+def _parse_inspection_month(value):
+    try:
+        year, month = (int(part) for part in value.split('-', 1))
+    except (AttributeError, ValueError):
+        return None
+    return (year, month) if 1 <= month <= 12 else None
+
+
+def compute_inspection_occurrences(contracts, active_links, inspections):
+    active = defaultdict(set)
+    for contract_id, system_id in active_links:
+        active[contract_id].add(system_id)
+    inspected = defaultdict(set)
+    inspected_months = defaultdict(set)
+    for contract_id, inspection_month, system_id in inspections:
+        year_month = _parse_inspection_month(inspection_month)
+        if year_month and system_id in active[contract_id]:
+            inspected[(contract_id, *year_month)].add(system_id)
+            inspected_months[contract_id].add(year_month)
+
+    rows = []
+    for contract_id, start_date, end_date, schedule in contracts:
+        scheduled_months = set(schedule or [])
+        period = set()
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            period.add((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        for year, month in sorted(period | inspected_months[contract_id]):
+            rows.append({
+                'contract_id': contract_id,
+                'year': year,
+                'month': month,
+                'is_within_period': (year, month) in period,
+                'is_planned': (year, month) in period and month in scheduled_months,
+                'inspected_count': len(inspected.get((contract_id, year, month), ())),
+            })
+    return rows
+
+
+def build_occurrences(apps, schema_editor):
+    Contract = apps.get_model('assets', 'Contract')
+    RegularInspection = apps.get_model('assets', 'RegularInspection')
+    InspectionOccurrence = apps.get_model('assets', 'InspectionOccurrence')
+
+    contracts = Contract.objects.filter(is_regular_inspection=True)
+    rows = compute_inspection_occurrences(
+        contracts.values_list('id', 'start_date', 'end_date', 'inspection_schedule'),
+        Contract.systems.through.objects.filter(contract__in=contracts, system__status='OPER').values_list('contract_id', 'system_id'),
+        RegularInspection.objects.filter(contract__in=contracts).values_list('contract_id', 'inspection_month', 'system_id'),
+    )
+    InspectionOccurrence.objects.bulk_create([InspectionOccurrence(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0016_systemattachment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InspectionOccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(verbose_name='연도')),
+                ('month', models.IntegerField(verbose_name='월')),
+                ('is_within_period', models.BooleanField(default=True, verbose_name='계약기간 내')),
+                ('is_planned', models.BooleanField(default=False, verbose_name='점검 예정')),
+                ('inspected_count', models.IntegerField(default=0, verbose_name='점검된 운영 시스템 수')),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inspection_occurrences', to='assets.contract', verbose_name='계약')),
+            ],
+            options={
+                'verbose_name': '정기점검 월별 현황',
+                'verbose_name_plural': '정기점검 월별 현황 목록',
+                'indexes': [models.Index(fields=['year', 'month'], name='assets_insp_year_86b105_idx')],
+                'unique_together': {('contract', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(build_occurrences, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,85 @@
+import copy
+
 from django.db import models
+from django.db.models.fields.files import FieldFile
 from django.contrib.auth.models import User
 
-class System(models.Model):
+
+def _snapshot_value(value):
+    """비교용 값. 파일은 경로 문자열로, JSON 등 가변 값은 복사해서 보관"""
+    if isinstance(value, FieldFile):
+        return value.name
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class FieldSnapshotMixin:
+    """
+    DB 에서 읽을 때(from_db)의 필드 값을 보관해, 저장 전 변경 필드를 다시 조회하지 않고 계산합니다.
+    자산 이력 시그널과 일괄 수정 이력(history_utils.build_update_histories)에서 사용합니다.
+    """
+    SNAPSHOT_EXCLUDE = ('created_at', 'updated_at')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.reset_field_snapshot()
+        return instance
+
+    def reset_field_snapshot(self, fields=None):
+        """현재 값을 기준 스냅샷으로 삼습니다. fields 를 주면 해당 필드만 갱신 (지연 로딩 필드는 제외)"""
+        if fields is None or not self.has_field_snapshot():
+            self._field_snapshot = {}
+            self._snapshot_related = {}
+            fields = None
+        deferred = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred or field.name in self.SNAPSHOT_EXCLUDE:
+                continue
+            if fields is None or field.name in fields or field.attname in fields:
+                self._field_snapshot[field.attname] = _snapshot_value(self.__dict__[field.attname])
+                # select_related 등으로 이미 읽어 둔 외래키 대상은 변경 시 이전 값 표시에 재사용
+                if field.is_relation and field.is_cached(self):
+                    self._snapshot_related[field.attname] = field.get_cached_value(self)
+
+    def has_field_snapshot(self):
+        return getattr(self, '_field_snapshot', None) is not None
+
+    def get_field_changes(self):
+        """
+        스냅샷 대비 변경된 필드를 {필드명: {'old', 'new'}} (문자열) 로 반환합니다. 변경이 없으면 None.
+        조회는 외래키 값이 바뀌었고 이전 대상을 미리 읽어 두지 않은 경우(표시 이름용)에만 발생합니다.
+        """
+        changes = {}
+        for field in self._meta.concrete_fields:
+            if field.attname not in self._field_snapshot:
+                continue
+            old_value = self._field_snapshot[field.attname]
+            if old_value == _snapshot_value(getattr(self, field.attname)):
+                continue
+            new_value = getattr(self, field.name)
+            if field.is_relation and old_value is not None:
+                related = self._snapshot_related.get(field.attname)
+                if related is None or related.pk != old_value:
+                    related = field.related_model._base_manager.filter(pk=old_value).first()
+                old_value = related
+            changes[field.name] = {
+                'old': str(old_value) if old_value is not None else None,
+                'new': str(new_value) if new_value is not None else None,
+            }
+        return changes or None
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.reset_field_snapshot(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self.reset_field_snapshot(fields)
+
+
+class System(FieldSnapshotMixin, models.Model):
     """시스템 자산 정보"""
     STATUS_CHOICES = (
         ('DEV', '개발중'),
@@ -53,7 +131,7 @@ class System(models.Model):
         ordering = ['name']
 
 
-class Contract(models.Model):
+class Contract(FieldSnapshotMixin, models.Model):
     """계약 정보 (구축, 유지보수 등)"""
     TYPE_CHOICES = (
         ('BUILD', '구축'),
@@ -127,7 +205,7 @@ class SystemAttachment(models.Model):
         ordering = ['-uploaded_at']
 
 
-class Hardware(models.Model):
+class Hardware(FieldSnapshotMixin, models.Model):
     """하드웨어 자산 정보"""
     STATUS_CHOICES = (
         ('OPER', '운영중'),
@@ -157,7 +235,7 @@ class Hardware(models.Model):
         ordering = ['name']
 
 
-class Software(models.Model):
+class Software(FieldSnapshotMixin, models.Model):
     """소프트웨어 자산 정보"""
     STATUS_CHOICES = (
         ('OPER', '운영중'),
@@ -299,6 +377,34 @@ class RegularInspection(models.Model):
         ordering = ['-inspection_date', '-created_at']
 
 
+class InspectionOccurrence(models.Model):
+    """
+    정기점검 월별 현황 (계약 x 연월). 정기점검 대상 계약의 기간 내 월과 기간 밖이지만 점검 내역이 있는 월을 보관하며,
+    계약/연결 시스템/정기점검/시스템 상태 변경 시 assets.services.refresh_inspection_occurrences 로 다시 계산합니다.
+    """
+    contract = models.ForeignKey(Contract, on_delete=models.CASCADE, related_name='inspection_occurrences', verbose_name='계약')
+    year = models.IntegerField(verbose_name='연도')
+    month = models.IntegerField(verbose_name='월')
+    is_within_period = models.BooleanField(default=True, verbose_name='계약기간 내')
+    is_planned = models.BooleanField(default=False, verbose_name='점검 예정')
+    inspected_count = models.IntegerField(default=0, verbose_name='점검된 운영 시스템 수')
+
+    @property
+    def is_done(self):
+        return self.inspected_count > 0
+
+    def __str__(self):
+        return f"{self.contract} {self.year}-{self.month:02d}"
+
+    class Meta:
+        verbose_name = '정기점검 월별 현황'
+        verbose_name_plural = '정기점검 월별 현황 목록'
+        unique_together = ('contract', 'year', 'month')
+        indexes = [
+            models.Index(fields=['year', 'month']),
+        ]
+
+
 class RegularInspectionAttachment(models.Model):
     """정기점검 첨부파일"""
     inspection = models.ForeignKey(RegularInspection, on_delete=models.CASCADE, related_name='attachments', verbose_name='정기점검')
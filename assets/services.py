@@ -0,0 +1,516 @@
+"""
+자산 서비스
+- 토폴로지 그래프: AssetTopologyView 의 Cytoscape 노드/엣지를 계약·하드웨어·소프트웨어별 M2M 조회 없이
+  연결 테이블(through)을 한 번씩 읽어 구성하고, 상태 필터별로 직렬화한 JSON 을 캐시합니다.
+  자산 저장/삭제와 M2M 변경 시그널(assets.signals)에서 세대(generation) 키를 올려 한 번에 무효화합니다.
+- 시스템 엑셀 일괄 등록/수정(SystemBulkUpdateView): 담당자 이름 색인과 기존 시스템을 한 번씩 읽고
+  컬럼 매핑은 pandas 로 일괄 처리한 뒤 bulk_create/bulk_update 와 이력 일괄 저장을 한 트랜잭션으로 수행합니다.
+- 정기점검 월별 현황(InspectionOccurrence): 계약 x 연월 단위로 점검 예정/점검된 시스템 수를 미리 계산해 두고,
+  정기점검 대시보드는 이 표를 SQL 로 집계합니다. 계약/연결/점검/시스템 상태 변경 시그널에서 해당 계약만 다시 계산합니다.
+"""
+import datetime
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from search.services import index_instances
+
+from .history_utils import build_asset_history, bulk_create_asset_history
+from .models import Contract, Hardware, InspectionOccurrence, RegularInspection, Software, System
+
+logger = logging.getLogger(__name__)
+
+TOPOLOGY_GENERATION_KEY = 'assets:topology:generation'
+TOPOLOGY_KEY = 'assets:topology:{generation}:{hide}:{statuses}'
+
+
+def _node(node_id: str, label: str, node_type: str, status=None, display_status=None) -> Dict:
+    return {
+        'data': {
+            'id': node_id,
+            'label': label,
+            'type': node_type,
+            'status': status,
+            'display_status': display_status,
+        }
+    }
+
+
+def _edge(edge_id: str, source: str, target: str, edge_type: str) -> Dict:
+    return {'data': {'id': edge_id, 'source': source, 'target': target, 'type': edge_type}}
+
+
+def _linked_assets(model, system_ids, status_field: str):
+    """시스템과 연결된 자산을 기본 정렬 순서로, 자산별 연결 시스템 ID 목록과 함께 반환합니다."""
+    through = model.systems.through
+    owner_field = f'{model._meta.model_name}_id'
+    links = defaultdict(list)
+    for owner_id, system_id in through.objects.filter(system_id__in=system_ids).values_list(owner_field, 'system_id'):
+        links[owner_id].append(system_id)
+    assets = model.objects.filter(pk__in=links).only('id', 'name', status_field).order_by(*model._meta.ordering, 'pk')
+    return list(assets), links
+
+
+def build_topology(statuses: Iterable[str], hide_unconnected: bool = False) -> Tuple[List[Dict], List[Dict]]:
+    """
+    상태 필터에 해당하는 시스템과 연결된 계약/하드웨어/소프트웨어의 (nodes, edges).
+    노드 순서는 계약 → 하드웨어 → 소프트웨어 → 시스템이며, 각 자산의 시스템 엣지는 시스템명 순입니다.
+    """
+    system_qs = System.objects.only('id', 'name', 'status')
+    statuses = list(statuses)
+    if statuses:
+        system_qs = system_qs.filter(status__in=statuses)
+    systems = list(system_qs)
+    system_ids = system_qs.values('pk')
+    system_rank = {system.pk: index for index, system in enumerate(systems)}
+
+    nodes: List[Dict] = []
+    edges: List[Dict] = []
+    connected_systems = set()
+
+    def link_edges(prefix: str, asset_id: int, linked_ids: List[int], edge_type: str) -> None:
+        for system_id in sorted(linked_ids, key=system_rank.__getitem__):
+            edges.append(_edge(f'edge_{prefix}_{asset_id}_sys_{system_id}', f'{prefix}_{asset_id}', f'sys_{system_id}', edge_type))
+            connected_systems.add(system_id)
+
+    # 계약 노드, 시스템 링크, 연관계약 링크
+    contracts, contract_links = _linked_assets(Contract, system_ids, 'contract_type')
+    contract_order = {contract.pk: index for index, contract in enumerate(contracts)}
+    related = defaultdict(set)
+    if len(contracts) > 1:
+        relation_qs = Contract.related_contracts.through.objects.filter(
+            from_contract_id__in=contract_order, to_contract_id__in=contract_order
+        ).values_list('from_contract_id', 'to_contract_id')
+        for from_id, to_id in relation_qs:
+            related[from_id].add(to_id)
+
+    for contract in contracts:
+        nodes.append(_node(f'con_{contract.pk}', contract.name, 'contract', contract.contract_type, contract.get_contract_type_display()))
+        link_edges('con', contract.pk, contract_links[contract.pk], 'contract_link')
+        # 양방향 관계는 나중에 나오는 계약에서 앞서 나온 계약으로 한 번만 연결
+        for other_id in sorted(related[contract.pk], key=contract_order.__getitem__):
+            if contract_order[other_id] < contract_order[contract.pk]:
+                low, high = sorted((contract.pk, other_id))
+                edges.append(_edge(f'con_{low}_rel_con_{high}', f'con_{contract.pk}', f'con_{other_id}', 'related_contract'))
+
+    hardwares, hardware_links = _linked_assets(Hardware, system_ids, 'status')
+    for hardware in hardwares:
+        nodes.append(_node(f'hw_{hardware.pk}', hardware.name, 'hardware', hardware.status, hardware.get_status_display()))
+        link_edges('hw', hardware.pk, hardware_links[hardware.pk], 'hardware_link')
+
+    softwares, software_links = _linked_assets(Software, system_ids, 'status')
+    for software in softwares:
+        nodes.append(_node(f'sw_{software.pk}', software.name, 'software', software.status, software.get_status_display()))
+        link_edges('sw', software.pk, software_links[software.pk], 'software_link')
+
+    for system in systems:
+        if not hide_unconnected or system.pk in connected_systems:
+            nodes.append(_node(f'sys_{system.pk}', system.name, 'system', system.status, system.get_status_display()))
+
+    return nodes, edges
+
+
+def _generation() -> int:
+    generation = cache.get(TOPOLOGY_GENERATION_KEY)
+    if generation is None:
+        generation = 1
+        cache.add(TOPOLOGY_GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def get_topology_json(statuses: Iterable[str], hide_unconnected: bool = False) -> Dict[str, str]:
+    """{'nodes_json', 'edges_json'} — 상태 필터/미연결 숨김 조합별로 캐시된 직렬화 결과"""
+    statuses = sorted(set(statuses))
+    key = TOPOLOGY_KEY.format(generation=_generation(), hide=int(hide_unconnected), statuses=','.join(statuses))
+    payload = cache.get(key)
+    if payload is None:
+        nodes, edges = build_topology(statuses, hide_unconnected)
+        payload = {'nodes_json': json.dumps(nodes), 'edges_json': json.dumps(edges)}
+        cache.set(key, payload, timeout=settings.ASSET_TOPOLOGY_CACHE_TTL)
+    return payload
+
+
+def invalidate_topology() -> None:
+    try:
+        cache.incr(TOPOLOGY_GENERATION_KEY)
+    except ValueError:
+        cache.set(TOPOLOGY_GENERATION_KEY, 2, timeout=None)
+    except Exception as e:
+        logger.warning("Asset topology cache invalidation failed: %s", e)
+
+
+# --- 시스템 엑셀 일괄 등록/수정 ---
+
+SYSTEM_STATUS_BY_LABEL = {'개발중': 'DEV', '운영중': 'OPER', '중단': 'SUSP', '폐기': 'DISC'}
+SYSTEM_TYPE_BY_LABEL = {'일반': 'SAM', '보안': 'SEC', 'SAM': 'SAM', 'SEC': 'SEC'}
+SYSTEM_IMPORT_FIELDS = ['name', 'system_type', 'description', 'status', 'manager', 'updated_at']
+EMPTY_CELLS = {'', 'nan', 'None'}
+
+
+class SystemImportError(Exception):
+    """필수 컬럼 누락 등 파일 전체를 처리할 수 없는 경우"""
+
+
+@dataclass
+class SystemImportRow:
+    row_number: int  # 엑셀 행 번호 (헤더가 1행)
+    code: str
+    name: str
+    action: str  # 'create' | 'update' | 'unchanged' | 'error'
+    changes: Optional[Dict] = None
+    error: str = ''
+
+
+@dataclass
+class SystemImportResult:
+    rows: List[SystemImportRow] = field(default_factory=list)
+    dry_run: bool = False
+
+    def _count(self, action: str) -> int:
+        return sum(1 for row in self.rows if row.action == action)
+
+    @property
+    def created_count(self) -> int:
+        return self._count('create')
+
+    @property
+    def updated_count(self) -> int:
+        return self._count('update')
+
+    @property
+    def unchanged_count(self) -> int:
+        return self._count('unchanged')
+
+    @property
+    def errors(self) -> List[SystemImportRow]:
+        return [row for row in self.rows if row.action == 'error']
+
+
+def build_manager_index() -> Dict[str, User]:
+    """
+    엑셀 담당자 값 → 사용자. 우선순위는 로그인 ID, 한글 성+이름, 계정 성+이름 순이며
+    같은 이름이 여럿이면 먼저 가입한 사용자를 사용합니다. (쿼리 1회)
+    """
+    by_username, by_name_ko, by_name = {}, {}, {}
+    for user in User.objects.select_related('profile').order_by('pk'):
+        by_username[user.username] = user
+        profile = getattr(user, 'profile', None)
+        if profile is not None:
+            by_name_ko.setdefault(f"{profile.last_name_ko or ''}{profile.first_name_ko or ''}", user)
+        by_name.setdefault(f"{user.last_name or ''}{user.first_name or ''}", user)
+    by_name_ko.pop('', None)
+    by_name.pop('', None)
+    return {**by_name, **by_name_ko, **by_username}
+
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].astype(str).str.strip().where(df[column].notna(), '')
+
+
+def _next_code_numbers(prefixes: Iterable[str], sheet_codes: Iterable[str]) -> Dict[str, int]:
+    """접두어별 다음 자동 채번 번호. System.save() 와 같은 규칙에 엑셀에 이미 적힌 코드까지 고려합니다."""
+    def number(code: str) -> int:
+        try:
+            return int(code.split('-')[1])
+        except (IndexError, ValueError):
+            return 0
+
+    next_numbers = {}
+    for prefix in set(prefixes):
+        last_code = System.objects.filter(code__startswith=f"{prefix}-").order_by('-code').values_list('code', flat=True).first()
+        used = [number(code) for code in sheet_codes if code.startswith(f"{prefix}-")]
+        next_numbers[prefix] = max([number(last_code or '')] + used) + 1
+    return next_numbers
+
+
+def _field_errors(system: System) -> str:
+    """길이/선택값 등 필드 검증 오류 메시지. 담당자는 조회 결과로만 채우므로 검증(행별 쿼리)에서 제외"""
+    try:
+        system.clean_fields(exclude=['manager'])
+    except ValidationError as e:
+        return ' '.join(
+            f"{System._meta.get_field(name).verbose_name}: {' '.join(messages)}" for name, messages in e.message_dict.items()
+        )
+    return ''
+
+
+def import_systems(df: pd.DataFrame, user: Optional[User] = None, dry_run: bool = False) -> SystemImportResult:
+    """
+    시스템 엑셀 시트를 시스템코드 기준으로 신규 등록/수정합니다.
+    코드가 없으면 구분별로 자동 채번하고, 시스템명이 없거나 코드가 중복되었거나 필드 검증(길이 등)에 실패한 행은 오류로 건너뜁니다.
+    dry_run 이면 저장 없이 행별 처리 예정 결과만 반환합니다.
+    """
+    if '시스템명' not in df.columns:
+        raise SystemImportError("필수 컬럼이 누락되었습니다: ['시스템명']")
+
+    sheet = pd.DataFrame({
+        'row_number': df.index + 2,
+        'code': _text_column(df, '시스템코드'),
+        'name': _text_column(df, '시스템명'),
+        'description': _text_column(df, '설명'),
+        'status': _text_column(df, '상태').map(SYSTEM_STATUS_BY_LABEL).fillna('OPER'),
+        'system_type': _text_column(df, '구분').map(SYSTEM_TYPE_BY_LABEL).fillna('SAM'),
+        'manager': _text_column(df, '담당자'),
+    })
+    sheet.loc[sheet['code'].isin(EMPTY_CELLS), 'code'] = ''
+    sheet.loc[sheet['name'].isin(EMPTY_CELLS), 'name'] = ''
+    sheet['duplicate'] = (sheet['code'] != '') & sheet['code'].duplicated()
+
+    managers = build_manager_index() if (~sheet['manager'].isin(EMPTY_CELLS)).any() else {}
+    codes = [code for code in sheet['code'].unique() if code]
+    existing = {system.code: system for system in System.objects.filter(code__in=codes).select_related('manager')}
+    next_numbers = _next_code_numbers(
+        sheet.loc[sheet['code'] == '', 'system_type'], [code for code in codes if code not in existing]
+    )
+
+    result = SystemImportResult(dry_run=dry_run)
+    to_create, to_update = [], []
+    now = timezone.now()
+    for row in sheet.itertuples(index=False):
+        row_number = int(row.row_number)
+        if not row.name:
+            result.rows.append(SystemImportRow(row_number, row.code, row.name, 'error', error='시스템명이 비어 있습니다.'))
+            continue
+        if row.duplicate:
+            result.rows.append(SystemImportRow(row_number, row.code, row.name, 'error', error='같은 시스템코드가 앞 행에 있습니다.'))
+            continue
+
+        values = {
+            'name': row.name,
+            'system_type': row.system_type,
+            'description': row.description,
+            'status': row.status,
+            'manager': managers.get(row.manager),
+        }
+        system = existing.get(row.code)
+        if system is None:
+            system = System(code=row.code, **values)
+            error = _field_errors(system)
+            if error:
+                result.rows.append(SystemImportRow(row_number, row.code, row.name, 'error', error=error))
+                continue
+            if not system.code:
+                system.code = f"{row.system_type}-{next_numbers[row.system_type]:03d}"
+                next_numbers[row.system_type] += 1
+            to_create.append(system)
+            result.rows.append(SystemImportRow(row_number, system.code, row.name, 'create'))
+            continue
+
+        for name, value in values.items():
+            setattr(system, name, value)
+        error = _field_errors(system)
+        if error:
+            result.rows.append(SystemImportRow(row_number, row.code, row.name, 'error', error=error))
+            continue
+        changes = system.get_field_changes()
+        if changes:
+            system.updated_at = now
+            to_update.append((system, changes))
+        result.rows.append(SystemImportRow(row_number, row.code, row.name, 'update' if changes else 'unchanged', changes))
+
+    if dry_run:
+        return result
+
+    updated = [system for system, _ in to_update]
+    with transaction.atomic():
+        System.objects.bulk_create(to_create)
+        System.objects.bulk_update(updated, SYSTEM_IMPORT_FIELDS, batch_size=500)
+        bulk_create_asset_history(
+            [build_asset_history('SYSTEM', system, 'CREATE', user=user, comment='엑셀 일괄 등록') for system in to_create]
+            + [
+                build_asset_history('SYSTEM', system, 'UPDATE', user=user, comment='엑셀 일괄 수정', changed_fields=changes)
+                for system, changes in to_update
+            ]
+        )
+        # bulk_create/bulk_update 는 저장 시그널을 보내지 않으므로 직접 무효화/재계산/재색인
+        saved = to_create + updated
+
+        def after_commit():
+            invalidate_topology()
+            index_instances(saved)
+
+        transaction.on_commit(after_commit)
+        status_changed = [system.pk for system, changes in to_update if 'status' in changes]
+        if status_changed:
+            refresh_inspection_occurrences(contracts_inspected_on(status_changed))
+
+    for system in to_create + updated:
+        system.reset_field_snapshot()
+    return result
+
+
+# --- 정기점검 월별 현황 ---
+
+def _parse_inspection_month(value: str) -> Optional[Tuple[int, int]]:
+    try:
+        year, month = (int(part) for part in value.split('-', 1))
+    except (AttributeError, ValueError):
+        return None
+    return (year, month) if 1 <= month <= 12 else None
+
+
+def compute_inspection_occurrences(contracts, active_links, inspections) -> List[Dict]:
+    """
+    InspectionOccurrence 행 값 목록 (조회 결과 튜플만 받는 순수 계산)
+    - contracts: (계약 ID, 시작일, 종료일, 점검 예정 월 목록)
+    - active_links: 운영중(OPER) 시스템 연결 (계약 ID, 시스템 ID)
+    - inspections: 정기점검 (계약 ID, 'YYYY-MM', 시스템 ID)
+    계약 기간 내 모든 월과, 기간 밖이라도 운영중 시스템 점검 내역이 있는 월을 만듭니다.
+    """
+    active = defaultdict(set)
+    for contract_id, system_id in active_links:
+        active[contract_id].add(system_id)
+    inspected = defaultdict(set)
+    inspected_months = defaultdict(set)
+    for contract_id, inspection_month, system_id in inspections:
+        year_month = _parse_inspection_month(inspection_month)
+        if year_month and system_id in active[contract_id]:
+            inspected[(contract_id, *year_month)].add(system_id)
+            inspected_months[contract_id].add(year_month)
+
+    rows = []
+    for contract_id, start_date, end_date, schedule in contracts:
+        scheduled_months = set(schedule or [])
+        period = set()
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            period.add((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        months = period | inspected_months[contract_id]
+        for year, month in sorted(months):
+            rows.append({
+                'contract_id': contract_id,
+                'year': year,
+                'month': month,
+                'is_within_period': (year, month) in period,
+                'is_planned': (year, month) in period and month in scheduled_months,
+                'inspected_count': len(inspected.get((contract_id, year, month), ())),
+            })
+    return rows
+
+
+def _write_occurrences(contracts_qs, delete_qs) -> int:
+    rows = compute_inspection_occurrences(
+        contracts_qs.values_list('id', 'start_date', 'end_date', 'inspection_schedule'),
+        Contract.systems.through.objects.filter(contract__in=contracts_qs, system__status='OPER').values_list('contract_id', 'system_id'),
+        RegularInspection.objects.filter(contract__in=contracts_qs).values_list('contract_id', 'inspection_month', 'system_id'),
+    )
+    with transaction.atomic():
+        delete_qs.delete()
+        InspectionOccurrence.objects.bulk_create([InspectionOccurrence(**row) for row in rows], batch_size=1000)
+    return len(rows)
+
+
+def refresh_inspection_occurrences(contract_ids: Iterable[int]) -> None:
+    """지정한 계약들의 월별 현황을 다시 계산합니다. 정기점검 대상이 아닌 계약은 현황을 지웁니다."""
+    contract_ids = {contract_id for contract_id in contract_ids if contract_id}
+    if not contract_ids:
+        return
+    _write_occurrences(
+        Contract.objects.filter(pk__in=contract_ids, is_regular_inspection=True).order_by(),
+        InspectionOccurrence.objects.filter(contract_id__in=contract_ids),
+    )
+
+
+def rebuild_inspection_occurrences() -> int:
+    """전체 월별 현황을 다시 만들고 행 수를 반환합니다."""
+    return _write_occurrences(Contract.objects.filter(is_regular_inspection=True).order_by(), InspectionOccurrence.objects.all())
+
+
+def contracts_inspected_on(system_ids: Iterable[int]) -> set:
+    """해당 시스템의 점검 내역이 있는 계약 ID. 시스템 상태/연결 변경은 이 계약들의 점검 수에만 영향을 줍니다."""
+    return set(RegularInspection.objects.filter(system_id__in=list(system_ids)).values_list('contract_id', flat=True).distinct())
+
+
+def build_inspection_dashboard(year: int, selected_month: Optional[int] = None, today: Optional[datetime.date] = None) -> Dict:
+    """정기점검 대시보드 컨텍스트 (연도 목록/통계/계약별 12개월 현황). 계약 수와 무관하게 쿼리 5회"""
+    today = today or datetime.date.today()
+    occurrences = InspectionOccurrence.objects.filter(year=year)
+    done = Q(inspected_count__gt=0)
+    totals = occurrences.aggregate(
+        total=Count('pk', filter=Q(is_planned=True)),
+        done=Count('pk', filter=Q(is_planned=True) & done),
+        contracts=Count('contract', filter=Q(is_within_period=True), distinct=True),
+        month_total=Count('pk', filter=Q(is_planned=True, month=selected_month or 0)),
+        month_done=Count('pk', filter=Q(is_planned=True, month=selected_month or 0) & done),
+    )
+
+    listed = occurrences.filter(is_within_period=True)
+    if selected_month:
+        listed = occurrences.filter(is_planned=True, month=selected_month)
+    contracts = list(
+        Contract.objects.filter(pk__in=listed.values('contract_id'))
+        .select_related('manager__profile')
+        .annotate(target_system_count=Count('systems', filter=Q(systems__status='OPER')))
+        .order_by(*Contract._meta.ordering)  # 집계 쿼리에는 Meta.ordering 이 적용되지 않음
+    )
+    contract_ids = [contract.pk for contract in contracts]
+    by_month = {
+        (occurrence.contract_id, occurrence.month): occurrence
+        for occurrence in occurrences.filter(contract_id__in=contract_ids)
+    }
+    inspections = defaultdict(list)
+    for inspection in RegularInspection.objects.filter(
+        contract_id__in=contract_ids, inspection_month__startswith=f"{year}-"
+    ).select_related('system'):
+        inspections[(inspection.contract_id, inspection.inspection_month)].append(inspection)
+
+    dashboard_data = []
+    for contract in contracts:
+        months = []
+        for month in range(1, 13):
+            occurrence = by_month.get((contract.pk, month))
+            is_done = bool(occurrence and occurrence.is_done)
+            months.append({
+                'month': month,
+                'is_planned': bool(occurrence and occurrence.is_planned),
+                'is_done': is_done,
+                'is_all_done': is_done,  # 최소 하나 이상 점검 시 완료 간주
+                'inspections': inspections.get((contract.pk, f"{year}-{month:02d}"), []),
+                'inspected_count': occurrence.inspected_count if occurrence else 0,
+                'total_count': contract.target_system_count,
+                'is_within_period': bool(occurrence and occurrence.is_within_period),
+            })
+        dashboard_data.append({
+            'contract': contract,
+            'months': months,
+            'target_system_count': contract.target_system_count,
+        })
+
+    context = {
+        'year_range': list(
+            InspectionOccurrence.objects.filter(is_within_period=True, year__lte=today.year)
+            .order_by('-year').values_list('year', flat=True).distinct()
+        ),
+        'month_range': range(1, 13),
+        'selected_year': year,
+        'selected_month': selected_month,
+        'dashboard_data': dashboard_data,
+        'stats': {
+            'total': totals['total'],
+            'done': totals['done'],
+            'undone': totals['total'] - totals['done'],
+            'total_systems': totals['contracts'],
+            'progress_rate': round(totals['done'] / totals['total'] * 100, 1) if totals['total'] else 0,
+        },
+    }
+    if selected_month:
+        context['monthly_stats'] = {
+            'total': totals['month_total'],
+            'done': totals['month_done'],
+            'undone': totals['month_total'] - totals['month_done'],
+        }
+    return context
@@ -1,7 +1,8 @@
-from django.db.models.signals import pre_save, post_save, m2m_changed
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
 from django.dispatch import receiver
-from .models import System, Contract, Hardware, Software
-from .history_utils import create_asset_history
+from .models import System, Contract, Hardware, Software, RegularInspection
+from .history_utils import build_asset_history, bulk_create_asset_history, create_asset_history
+from .services import contracts_inspected_on, invalidate_topology, refresh_inspection_occurrences
 from common.middleware import get_current_user
 
 def get_changed_fields(old_instance, new_instance):
@@ -31,17 +32,24 @@ def get_changed_fields(old_instance, new_instance):
             
     return changes if changes else None
 
+def capture_field_changes(model, instance):
+    """
+    Store the fields about to change on ``instance._field_changes`` for post_save.
+    Instances loaded from the DB are diffed against their load-time snapshot
+    (FieldSnapshotMixin) without a query; others fall back to re-reading the row.
+    """
+    if not instance.pk:
+        instance._field_changes = None
+    elif instance.has_field_snapshot():
+        instance._field_changes = instance.get_field_changes()
+    else:
+        instance._field_changes = get_changed_fields(model.objects.filter(pk=instance.pk).first(), instance)
+
 # --- System Signals ---
 
 @receiver(pre_save, sender=System)
 def track_system_old_state(sender, instance, **kwargs):
-    if instance.pk:
-        try:
-            instance._old_instance = System.objects.get(pk=instance.pk)
-        except System.DoesNotExist:
-            instance._old_instance = None
-    else:
-        instance._old_instance = None
+    capture_field_changes(sender, instance)
 
 @receiver(post_save, sender=System)
 def log_system_changes(sender, instance, created, **kwargs):
@@ -53,8 +61,8 @@ def log_system_changes(sender, instance, created, **kwargs):
             user=get_current_user(),
             comment='시스템 생성'
         )
-    elif hasattr(instance, '_old_instance') and instance._old_instance:
-        changes = get_changed_fields(instance._old_instance, instance)
+    else:
+        changes = getattr(instance, '_field_changes', None)
         if changes:
             create_asset_history(
                 asset_type='SYSTEM',
@@ -69,13 +77,7 @@ def log_system_changes(sender, instance, created, **kwargs):
 
 @receiver(pre_save, sender=Contract)
 def track_contract_old_state(sender, instance, **kwargs):
-    if instance.pk:
-        try:
-            instance._old_instance = Contract.objects.get(pk=instance.pk)
-        except Contract.DoesNotExist:
-            instance._old_instance = None
-    else:
-        instance._old_instance = None
+    capture_field_changes(sender, instance)
 
 @receiver(post_save, sender=Contract)
 def log_contract_changes(sender, instance, created, **kwargs):
@@ -87,8 +89,8 @@ def log_contract_changes(sender, instance, created, **kwargs):
             user=get_current_user(),
             comment='계약 생성'
         )
-    elif hasattr(instance, '_old_instance') and instance._old_instance:
-        changes = get_changed_fields(instance._old_instance, instance)
+    else:
+        changes = getattr(instance, '_field_changes', None)
         if changes:
             create_asset_history(
                 asset_type='CONTRACT',
@@ -105,94 +107,99 @@ def log_contract_system_changes(sender, instance, action, reverse, model, pk_set
     if action not in ['post_add', 'post_remove']:
         return
 
+    user = get_current_user()
+    histories = []
+
     if reverse:
         # instance is System, pk_set contains Contract IDs
         contracts = Contract.objects.filter(pk__in=pk_set)
         for contract in contracts:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='CONTRACT',
                 asset=contract,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=instance,
                 comment=f"시스템 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Also log to System
             sys_action = 'CONTRACT_ADD' if action == 'post_add' else 'CONTRACT_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=instance,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_contract=contract,
                 comment=f"계약 {contract.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
     else:
         # instance is Contract, pk_set contains System IDs
         systems = System.objects.filter(pk__in=pk_set)
         for system in systems:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='CONTRACT',
                 asset=instance,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=system,
                 comment=f"시스템 {system.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Also log to System
             sys_action = 'CONTRACT_ADD' if action == 'post_add' else 'CONTRACT_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=system,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_contract=instance,
                 comment=f"계약 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
+
+    bulk_create_asset_history(histories)
+
 
 @receiver(m2m_changed, sender=Contract.related_contracts.through)
 def log_contract_link_changes(sender, instance, action, reverse, model, pk_set, **kwargs):
     if action not in ['post_add', 'post_remove']:
         return
-        
+
+    user = get_current_user()
+    histories = []
+
     targets = Contract.objects.filter(pk__in=pk_set)
     for target in targets:
         history_action = 'LINK_CONTRACT_ADD' if action == 'post_add' else 'LINK_CONTRACT_REMOVE'
         
         # Log for source contract
-        create_asset_history(
+        histories.append(build_asset_history(
             asset_type='CONTRACT',
             asset=instance,
             action=history_action,
-            user=get_current_user(),
+            user=user,
             related_contract=target,
             comment=f"연관계약 {target.name} {'연결' if action == 'post_add' else '해제'}"
-        )
+        ))
         
         # Log for target contract
-        create_asset_history(
+        histories.append(build_asset_history(
             asset_type='CONTRACT',
             asset=target,
             action=history_action,
-            user=get_current_user(),
+            user=user,
             related_contract=instance,
             comment=f"연관계약 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-        )
+        ))
+
+    bulk_create_asset_history(histories)
 
 
 # --- Hardware Signals ---
 
 @receiver(pre_save, sender=Hardware)
 def track_hardware_old_state(sender, instance, **kwargs):
-    if instance.pk:
-        try:
-            instance._old_instance = Hardware.objects.get(pk=instance.pk)
-        except Hardware.DoesNotExist:
-            instance._old_instance = None
-    else:
-        instance._old_instance = None
+    capture_field_changes(sender, instance)
 
 @receiver(post_save, sender=Hardware)
 def log_hardware_changes(sender, instance, created, **kwargs):
@@ -204,8 +211,8 @@ def log_hardware_changes(sender, instance, created, **kwargs):
             user=get_current_user(),
             comment='하드웨어 생성'
         )
-    elif hasattr(instance, '_old_instance') and instance._old_instance:
-        changes = get_changed_fields(instance._old_instance, instance)
+    else:
+        changes = getattr(instance, '_field_changes', None)
         if changes:
             create_asset_history(
                 asset_type='HARDWARE',
@@ -221,65 +228,64 @@ def log_hardware_system_changes(sender, instance, action, reverse, model, pk_set
     if action not in ['post_add', 'post_remove']:
         return
 
+    user = get_current_user()
+    histories = []
+
     if reverse:
         # instance is System, pk_set contains Hardware IDs
         hardwares = Hardware.objects.filter(pk__in=pk_set)
         for hardware in hardwares:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='HARDWARE',
                 asset=hardware,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=instance,
                 comment=f"시스템 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Log to System
             sys_action = 'HARDWARE_ADD' if action == 'post_add' else 'HARDWARE_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=instance,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_hardware=hardware,
                 comment=f"하드웨어 {hardware.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
     else:
         # instance is Hardware, pk_set contains System IDs
         systems = System.objects.filter(pk__in=pk_set)
         for system in systems:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='HARDWARE',
                 asset=instance,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=system,
                 comment=f"시스템 {system.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Log to System
             sys_action = 'HARDWARE_ADD' if action == 'post_add' else 'HARDWARE_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=system,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_hardware=instance,
                 comment=f"하드웨어 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
+
+    bulk_create_asset_history(histories)
 
 
 # --- Software Signals ---
 
 @receiver(pre_save, sender=Software)
 def track_software_old_state(sender, instance, **kwargs):
-    if instance.pk:
-        try:
-            instance._old_instance = Software.objects.get(pk=instance.pk)
-        except Software.DoesNotExist:
-            instance._old_instance = None
-    else:
-        instance._old_instance = None
+    capture_field_changes(sender, instance)
 
 @receiver(post_save, sender=Software)
 def log_software_changes(sender, instance, created, **kwargs):
@@ -291,8 +297,8 @@ def log_software_changes(sender, instance, created, **kwargs):
             user=get_current_user(),
             comment='소프트웨어 생성'
         )
-    elif hasattr(instance, '_old_instance') and instance._old_instance:
-        changes = get_changed_fields(instance._old_instance, instance)
+    else:
+        changes = getattr(instance, '_field_changes', None)
         if changes:
             create_asset_history(
                 asset_type='SOFTWARE',
@@ -308,49 +314,113 @@ def log_software_system_changes(sender, instance, action, reverse, model, pk_set
     if action not in ['post_add', 'post_remove']:
         return
 
+    user = get_current_user()
+    histories = []
+
     if reverse:
         # instance is System, pk_set contains Software IDs
         softwares = Software.objects.filter(pk__in=pk_set)
         for software in softwares:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SOFTWARE',
                 asset=software,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=instance,
                 comment=f"시스템 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Log to System
             sys_action = 'SOFTWARE_ADD' if action == 'post_add' else 'SOFTWARE_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=instance,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_software=software,
                 comment=f"소프트웨어 {software.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
     else:
         # instance is Software, pk_set contains System IDs
         systems = System.objects.filter(pk__in=pk_set)
         for system in systems:
             history_action = 'SYSTEM_ADD' if action == 'post_add' else 'SYSTEM_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SOFTWARE',
                 asset=instance,
                 action=history_action,
-                user=get_current_user(),
+                user=user,
                 related_system=system,
                 comment=f"시스템 {system.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
             # Log to System
             sys_action = 'SOFTWARE_ADD' if action == 'post_add' else 'SOFTWARE_REMOVE'
-            create_asset_history(
+            histories.append(build_asset_history(
                 asset_type='SYSTEM',
                 asset=system,
                 action=sys_action,
-                user=get_current_user(),
+                user=user,
                 related_software=instance,
                 comment=f"소프트웨어 {instance.name} {'연결' if action == 'post_add' else '해제'}"
-            )
+            ))
+
+    bulk_create_asset_history(histories)
+
+
+# --- Topology Cache ---
+
+@receiver(post_save, sender=System)
+@receiver(post_save, sender=Contract)
+@receiver(post_save, sender=Hardware)
+@receiver(post_save, sender=Software)
+@receiver(post_delete, sender=System)
+@receiver(post_delete, sender=Contract)
+@receiver(post_delete, sender=Hardware)
+@receiver(post_delete, sender=Software)
+def invalidate_topology_on_asset_change(sender, instance, **kwargs):
+    """자산 이름/상태 변경이나 삭제 시 토폴로지 캐시 무효화"""
+    invalidate_topology()
+
+@receiver(m2m_changed, sender=Contract.systems.through)
+@receiver(m2m_changed, sender=Contract.related_contracts.through)
+@receiver(m2m_changed, sender=Hardware.systems.through)
+@receiver(m2m_changed, sender=Software.systems.through)
+def invalidate_topology_on_link_change(sender, instance, action, **kwargs):
+    """시스템 연결/연관계약 변경 시 토폴로지 캐시 무효화"""
+    if action in ['post_add', 'post_remove', 'post_clear']:
+        invalidate_topology()
+
+
+# --- Inspection Occurrences ---
+
+INSPECTION_CONTRACT_FIELDS = {'start_date', 'end_date', 'inspection_schedule', 'is_regular_inspection'}
+
+@receiver(post_save, sender=Contract)
+def refresh_occurrences_on_contract_change(sender, instance, created, **kwargs):
+    """계약 기간/점검 예정 월/정기점검 여부가 바뀌면 해당 계약의 월별 현황 재계산"""
+    changes = getattr(instance, '_field_changes', None) or {}
+    if (created and instance.is_regular_inspection) or INSPECTION_CONTRACT_FIELDS & changes.keys():
+        refresh_inspection_occurrences([instance.pk])
+
+@receiver(post_save, sender=System)
+def refresh_occurrences_on_system_status(sender, instance, created, **kwargs):
+    """운영중 여부가 바뀌면 이 시스템을 점검한 계약의 점검 수 재계산"""
+    changes = getattr(instance, '_field_changes', None) or {}
+    if not created and 'status' in changes:
+        refresh_inspection_occurrences(contracts_inspected_on([instance.pk]))
+
+@receiver(post_save, sender=RegularInspection)
+@receiver(post_delete, sender=RegularInspection)
+def refresh_occurrences_on_inspection(sender, instance, **kwargs):
+    refresh_inspection_occurrences([instance.contract_id])
+
+@receiver(m2m_changed, sender=Contract.systems.through)
+def refresh_occurrences_on_contract_systems(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ['post_add', 'post_remove', 'post_clear']:
+        return
+    if not reverse:
+        refresh_inspection_occurrences([instance.pk])
+    elif pk_set:
+        refresh_inspection_occurrences(pk_set)
+    else:
+        refresh_inspection_occurrences(contracts_inspected_on([instance.pk]))
@@ -9,13 +9,13 @@ from django.core.paginator import Paginator
 from .models import System, Contract, Hardware, Software, AssetHistory, ContractAttachment, SystemAttachment, RegularInspection, RegularInspectionAttachment
 from .forms import SystemForm, ContractForm, HardwareForm, SoftwareForm, RegularInspectionForm, ExcelUploadForm
 from .history_utils import create_asset_history
+from .services import SystemImportError, build_inspection_dashboard, get_topology_json, import_systems
 import os
 import pandas as pd
 from django.contrib import messages
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db.models.functions import Concat
-from accounts.models import UserProfile
+from common.xlsx_export import XlsxColumn, xlsx_response
 
 class SystemListView(LoginRequiredMixin, ListView):
     model = System
@@ -121,115 +121,36 @@ class SystemUpdateView(LoginRequiredMixin, UpdateView):
         return response
 
 class SystemBulkUpdateView(LoginRequiredMixin, View):
-    """Excel 기반 시스템 일괄 업데이트"""
+    """Excel 기반 시스템 일괄 업데이트 (미리보기 선택 시 저장 없이 처리 예정 결과 표시)"""
     def post(self, request):
         form = ExcelUploadForm(request.POST, request.FILES)
-        if form.is_valid():
-            excel_file = request.FILES['excel_file']
-            try:
-                df = pd.read_excel(excel_file)
-                
-                # 필수 컬럼 확인
-                required_cols = ['시스템명']
-                if not all(col in df.columns for col in required_cols):
-                    messages.error(request, f"필수 컬럼이 누락되었습니다: {required_cols}")
-                    return redirect('assets:system_list')
-
-                updated_count = 0
-                created_count = 0
-                errors = []
-
-                for index, row in df.iterrows():
-                    code = str(row.get('시스템코드', '')).strip()
-                    if code == 'nan': code = ''
-                    
-                    name = str(row['시스템명']).strip()
-                    desc = str(row.get('설명', '')).strip()
-                    status_name = str(row.get('상태', '운영중')).strip()
-                    manager_name = str(row.get('담당자', '')).strip()
-                    type_name = str(row.get('구분', '일반')).strip()
-                    
-                    # 상태 매핑
-                    status_map = {'개발중': 'DEV', '운영중': 'OPER', '중단': 'SUSP', '폐기': 'DISC'}
-                    status = status_map.get(status_name, 'OPER')
-
-                    # 구분 매핑
-                    type_map = {'일반': 'SAM', '보안': 'SEC', 'SAM': 'SAM', 'SEC': 'SEC'}
-                    system_type = type_map.get(type_name, 'SAM')
-
-                    # 담당자 찾기
-                    manager = None
-                    if manager_name and manager_name not in ['nan', 'None']:
-                        # 1. username 검색
-                        manager = User.objects.filter(username=manager_name).first()
-                        
-                        # 2. 한국어 이름 검색 (UserProfile 활용)
-                        if not manager:
-                            profile = UserProfile.objects.annotate(
-                                full_name=Concat('last_name_ko', 'first_name_ko')
-                            ).filter(full_name=manager_name).first()
-                            
-                            if not profile:
-                                profile = UserProfile.objects.annotate(
-                                    full_name=Concat('user__last_name', 'user__first_name')
-                                ).filter(full_name=manager_name).first()
-                            
-                            if profile:
-                                manager = profile.user
-
-                    try:
-                        if code:
-                            system, created = System.objects.update_or_create(
-                                code=code,
-                                defaults={
-                                    'name': name,
-                                    'system_type': system_type,
-                                    'description': desc,
-                                    'status': status,
-                                    'manager': manager,
-                                }
-                            )
-                        else:
-                            # 코드가 없으면 신규 생성 (save()에서 자동 채번)
-                            system = System.objects.create(
-                                name=name,
-                                system_type=system_type,
-                                description=desc,
-                                status=status,
-                                manager=manager,
-                            )
-                            created = True
-                        
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
-                            
-                        # 이력 남기기
-                        create_asset_history(
-                            asset_type='SYSTEM',
-                            asset=system,
-                            action='CREATE' if created else 'UPDATE',
-                            user=request.user,
-                            comment=f"엑셀 일괄 {'등록' if created else '수정'}"
-                        )
-                    except Exception as e:
-                        errors.append(f"Row {index+2} ({code}): {str(e)}")
-
-                msg = f"일괄 업데이트 완료: 신규 {created_count}건, 수정 {updated_count}건"
-                if errors:
-                    msg += f" (에러 {len(errors)}건)"
-                    messages.warning(request, msg)
-                    for err in errors[:5]: # 최대 5개만 표시
-                        messages.error(request, err)
-                else:
-                    messages.success(request, msg)
-
-            except Exception as e:
-                messages.error(request, f"파일 처리 중 오류 발생: {str(e)}")
-        else:
+        if not form.is_valid():
             messages.error(request, "유효하지 않은 파일 형식입니다.")
-            
+            return redirect('assets:system_list')
+
+        try:
+            df = pd.read_excel(request.FILES['excel_file'])
+            result = import_systems(df, user=request.user, dry_run=form.cleaned_data['dry_run'])
+        except SystemImportError as e:
+            messages.error(request, str(e))
+            return redirect('assets:system_list')
+        except Exception as e:
+            messages.error(request, f"파일 처리 중 오류 발생: {str(e)}")
+            return redirect('assets:system_list')
+
+        if result.dry_run:
+            return render(request, 'assets/system_import_preview.html', {'result': result})
+
+        msg = f"일괄 업데이트 완료: 신규 {result.created_count}건, 수정 {result.updated_count}건"
+        if result.unchanged_count:
+            msg += f", 변경 없음 {result.unchanged_count}건"
+        if result.errors:
+            msg += f" (에러 {len(result.errors)}건)"
+            messages.warning(request, msg)
+            for row in result.errors[:5]:  # 최대 5개만 표시
+                messages.error(request, f"Row {row.row_number} ({row.code}): {row.error}")
+        else:
+            messages.success(request, msg)
         return redirect('assets:system_list')
 
 class SystemExportView(LoginRequiredMixin, View):
@@ -247,45 +168,34 @@ class SystemExportView(LoginRequiredMixin, View):
         if my_system:
             queryset = queryset.filter(manager=request.user)
             
-        # 데이터 프레임 생성용 리스트
-        data = []
         status_map_rev = {'DEV': '개발중', 'OPER': '운영중', 'SUSP': '중단', 'DISC': '폐기'}
         type_map_rev = {'SAM': '일반', 'SEC': '보안'}
-        
-        for sys in queryset:
-            manager_display = ""
-            if sys.manager:
-                manager_display = sys.manager.profile.display_name if hasattr(sys.manager, 'profile') else sys.manager.username
-                
-            data.append({
-                '시스템명': sys.name,
-                '시스템코드': sys.code,
-                '구분': type_map_rev.get(sys.system_type, '일반'),
-                '설명': sys.description,
-                '담당자': manager_display,
-                '상태': status_map_rev.get(sys.status, '운영중'),
-            })
-            
-        df = pd.DataFrame(data)
-        
-        # Excel 파일 생성
-        import io
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Systems')
-            
-        output.seek(0)
-        
-        from django.utils import timezone
+
+        def rows():
+            # 전체 목록을 메모리에 올리지 않도록 iterator 로 순회하며 한 행씩 기록
+            for sys in queryset.iterator(chunk_size=500):
+                manager_display = ""
+                if sys.manager:
+                    manager_display = sys.manager.profile.display_name if hasattr(sys.manager, 'profile') else sys.manager.username
+                yield (
+                    sys.name,
+                    sys.code,
+                    type_map_rev.get(sys.system_type, '일반'),
+                    sys.description,
+                    manager_display,
+                    status_map_rev.get(sys.status, '운영중'),
+                )
+
+        columns = [
+            XlsxColumn('시스템명', 30),
+            XlsxColumn('시스템코드', 15),
+            XlsxColumn('구분', 8),
+            XlsxColumn('설명', 50),
+            XlsxColumn('담당자', 15),
+            XlsxColumn('상태', 8),
+        ]
         filename = f"ITMS_Systems_{timezone.now().strftime('%Y%m%d_%H%M')}.xlsx"
-        
-        response = HttpResponse(
-            output.read(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        return response
+        return xlsx_response(filename, 'Systems', columns, rows())
 
 class RegularInspectionDashboardView(LoginRequiredMixin, ListView):
     """정기점검 관리 대시보드"""
@@ -294,7 +204,7 @@ class RegularInspectionDashboardView(LoginRequiredMixin, ListView):
     context_object_name = 'contracts'
 
     def get_queryset(self):
-        return Contract.objects.filter(is_regular_inspection=True).prefetch_related('systems', 'inspections')
+        return Contract.objects.filter(is_regular_inspection=True)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -303,146 +213,9 @@ class RegularInspectionDashboardView(LoginRequiredMixin, ListView):
         year = int(self.request.GET.get('year', today.year))
         month_param = self.request.GET.get('month')
         selected_month = int(month_param) if month_param and month_param.isdigit() else None
-        
-        contracts = self.get_queryset()
-        
-        # 올해 기간을 포함하고 정기점검 대상인 계약 건수 계산
-        total_regular_contracts_count = Contract.objects.filter(
-            is_regular_inspection=True,
-            start_date__year__lte=year,
-            end_date__year__gte=year,
-        ).distinct().count()
-        
-        # 년도에 해당하는 계약만 1차 필터링
-        
-        all_regular_contracts = self.get_queryset()
-        years_set = set()
-        current_year = today.year
-        
-        for ctr in all_regular_contracts:
-            start_y = ctr.start_date.year
-            end_y = ctr.end_date.year
-            # 계약 기간 내의 연도 중 현재 연도 이하인 것들만 추가
-            for y in range(start_y, min(end_y, current_year) + 1):
-                years_set.add(y)
-        
-        # 정렬된 리스트로 변환 (내림차순)
-        context['year_range'] = sorted(list(years_set), reverse=True)
-        context['month_range'] = range(1, 13)
-        context['selected_year'] = year
-        context['selected_month'] = selected_month
-        
-        # 연 기준 필터링된 계약들
-        contracts = contracts.filter(
-            start_date__year__lte=year,
-            end_date__year__gte=year
-        )
-
-        dashboard_data = []
-        yearly_total_planned = 0
-        yearly_done_planned = 0
-        yearly_undone_planned = 0
-        
-        # 월별 필터용 카운트
-        monthly_total_planned = 0
-        monthly_done_planned = 0
-        monthly_undone_planned = 0
-
-        for contract in contracts:
-            months_data = []
-            contract_matches_filter = False
-            contract_has_active_month = False 
-            
-            # 계약의 운영중인 시스템 미리 추출 (쿼리 최소화)
-            active_systems = [s for s in contract.systems.all() if s.status == 'OPER']
-            active_systems_count = len(active_systems)
-            
-            # 실제 점검 스케줄 (계약 필드 그대로 사용)
-            scheduled_months = set(contract.inspection_schedule or [])
-            
-            for m in range(1, 13):
-                # 해당 월이 계약 기간 내에 있는지 확인
-                month_start = datetime.date(year, m, 1)
-                if m == 12:
-                    month_end = datetime.date(year, 12, 31)
-                else:
-                    month_end = datetime.date(year, m + 1, 1) - datetime.timedelta(days=1)
-                
-                # 계약 기간과 겹치는지 확인
-                is_within_period = not (contract.end_date < month_start or contract.start_date > month_end)
-                if is_within_period:
-                    contract_has_active_month = True
-                
-                is_planned = is_within_period and m in scheduled_months
-                
-                # 해당 월의 점검 내역 확인
-                month_str = f"{year}-{m:02d}"
-                actual_inspections = contract.inspections.filter(inspection_month=month_str)
-                
-                # 운영중인 시스템 중 점검된 수
-                inspected_systems_count = actual_inspections.filter(system__in=active_systems).values('system').distinct().count()
-                is_all_done = inspected_systems_count > 0 # 최소 하나 이상 점검 시 완료 간주
-                
-                # 연간 통계 누적 (계획된 달인 경우만)
-                if is_planned:
-                    yearly_total_planned += 1
-                    if is_all_done:
-                        yearly_done_planned += 1
-                    else:
-                        yearly_undone_planned += 1
-
-                # 선택된 월 필터링 및 월 통계 누적
-                if selected_month and m == selected_month and is_planned:
-                    contract_matches_filter = True
-                    monthly_total_planned += 1
-                    if is_all_done:
-                        monthly_done_planned += 1
-                    else:
-                        monthly_undone_planned += 1
-
-                months_data.append({
-                    'month': m,
-                    'is_planned': is_planned,
-                    'is_done': inspected_systems_count > 0,
-                    'is_all_done': is_all_done,
-                    'inspections': actual_inspections,
-                    'inspected_count': inspected_systems_count,
-                    'total_count': active_systems_count,
-                    'is_within_period': is_within_period,
-                })
-            
-            # 리스트 표시 여부 결정 (계약 기간이 해당 연도와 겹치는 경우만)
-            if contract_has_active_month:
-                if not selected_month or contract_matches_filter:
-                    dashboard_data.append({
-                        'contract': contract,
-                        'months': months_data,
-                        'target_system_count': active_systems_count,
-                    })
-            
-        context['dashboard_data'] = dashboard_data
-        
-        # 진척도 계산 (연 기준)
-        yearly_progress_rate = 0
-        if yearly_total_planned > 0:
-            yearly_progress_rate = round((yearly_done_planned / yearly_total_planned) * 100, 1)
-
-        context['stats'] = {
-            'total': yearly_total_planned,
-            'done': yearly_done_planned,
-            'undone': yearly_undone_planned,
-            'total_systems': total_regular_contracts_count,
-            'progress_rate': yearly_progress_rate,
-        }
-        
-        # 월별 필터가 있는 경우 별도의 월 통계 제공
-        if selected_month:
-            context['monthly_stats'] = {
-                'total': monthly_total_planned,
-                'done': monthly_done_planned,
-                'undone': monthly_undone_planned,
-            }
 
+        # 월별 현황(InspectionOccurrence)을 SQL 로 집계
+        context.update(build_inspection_dashboard(year, selected_month, today))
         return context
 
 class ContractListView(LoginRequiredMixin, ListView):
@@ -1096,116 +869,8 @@ class AssetTopologyView(LoginRequiredMixin, View):
         if not request.GET.get('status') and not request.GET.get('hide_unconnected'):
             status_filter = ['OPER']
 
-        system_qs = System.objects.all()
-        if status_filter:
-            system_qs = system_qs.filter(status__in=status_filter)
-        
-        systems = system_qs
-        contracts = Contract.objects.prefetch_related('systems', 'related_contracts')
-        hardwares = Hardware.objects.prefetch_related('systems')
-        softwares = Software.objects.prefetch_related('systems')
-
-        nodes = []
-        edges = []
-        added_node_ids = set()
-        system_nodes_with_edges = set()
-
-        def add_node(id, label, type, status=None, display_status=None):
-            if id not in added_node_ids:
-                nodes.append({
-                    'data': {
-                        'id': id,
-                        'label': label,
-                        'type': type,
-                        'status': status,
-                        'display_status': display_status
-                    }
-                })
-                added_node_ids.add(id)
-
-        # 계약 노드 및 시스템 링크 준비
-        contract_edges = []
-        for c in contracts:
-            c_systems = c.systems.filter(id__in=systems.values_list('id', flat=True))
-            if c_systems.exists():
-                add_node(f'con_{c.id}', c.name, 'contract', c.contract_type, c.get_contract_type_display())
-                for s in c_systems:
-                    contract_edges.append({
-                        'data': {
-                            'id': f'edge_con_{c.id}_sys_{s.id}',
-                            'source': f'con_{c.id}',
-                            'target': f'sys_{s.id}',
-                            'type': 'contract_link'
-                        }
-                    })
-                    system_nodes_with_edges.add(f'sys_{s.id}')
-            
-            # 연관계약 링크 (필터링된 시스템과 연결된 계약들 간의 관계만 표시)
-            for rc in c.related_contracts.all():
-                if f'con_{c.id}' in added_node_ids and f'con_{rc.id}' in added_node_ids:
-                    src_id = min(c.id, rc.id)
-                    tgt_id = max(c.id, rc.id)
-                    edge_id = f"con_{src_id}_rel_con_{tgt_id}"
-                    if not any(e['data']['id'] == edge_id for e in contract_edges):
-                        contract_edges.append({
-                            'data': {
-                                'id': edge_id,
-                                'source': f'con_{c.id}',
-                                'target': f'con_{rc.id}',
-                                'type': 'related_contract'
-                            }
-                        })
-
-        # 하드웨어 노드 및 시스템 링크 준비
-        hw_edges = []
-        for h in hardwares:
-            h_systems = h.systems.filter(id__in=systems.values_list('id', flat=True))
-            if h_systems.exists():
-                add_node(f'hw_{h.id}', h.name, 'hardware', h.status, h.get_status_display())
-                for s in h_systems:
-                    hw_edges.append({
-                        'data': {
-                            'id': f'edge_hw_{h.id}_sys_{s.id}',
-                            'source': f'hw_{h.id}',
-                            'target': f'sys_{s.id}',
-                            'type': 'hardware_link'
-                        }
-                    })
-                    system_nodes_with_edges.add(f'sys_{s.id}')
-
-        # 소프트웨어 노드 및 시스템 링크 준비
-        sw_edges = []
-        for sw in softwares:
-            sw_systems = sw.systems.filter(id__in=systems.values_list('id', flat=True))
-            if sw_systems.exists():
-                add_node(f'sw_{sw.id}', sw.name, 'software', sw.status, sw.get_status_display())
-                for s in sw_systems:
-                    sw_edges.append({
-                        'data': {
-                            'id': f'edge_sw_{sw.id}_sys_{s.id}',
-                            'source': f'sw_{sw.id}',
-                            'target': f'sys_{s.id}',
-                            'type': 'software_link'
-                        }
-                    })
-                    system_nodes_with_edges.add(f'sys_{s.id}')
-
-        # 시스템 노드 추가 (최종 결정된 시스템들만)
-        for s in systems:
-            sys_id = f'sys_{s.id}'
-            if not hide_unconnected or sys_id in system_nodes_with_edges:
-                add_node(sys_id, s.name, 'system', s.status, s.get_status_display())
-
-        # 모든 엣지 합치기 (노드가 존재하는 경우만)
-        all_potential_edges = contract_edges + hw_edges + sw_edges
-        for edge in all_potential_edges:
-            if edge['data']['source'] in added_node_ids and edge['data']['target'] in added_node_ids:
-                edges.append(edge)
-
-        import json
         context = {
-            'nodes_json': json.dumps(nodes),
-            'edges_json': json.dumps(edges),
+            **get_topology_json(status_filter, hide_unconnected),
             'hide_unconnected': hide_unconnected,
             'current_statuses': status_filter,
             'status_choices': System.STATUS_CHOICES,
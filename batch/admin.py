@@ -0,0 +1,11 @@
+from django.contrib import admin
+from .models import BatchJob
+
+
+@admin.register(BatchJob)
+class BatchJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'command', 'args', 'status', 'progress_current', 'progress_total', 'created_by', 'created_at', 'finished_at')
+    list_filter = ('command', 'status', 'created_at')
+    search_fields = ('command', 'output', 'error')
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'heartbeat_at', 'worker', 'output', 'error')
+    ordering = ('-created_at',)
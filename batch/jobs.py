@@ -0,0 +1,199 @@
+"""
+배치 작업 큐 처리
+웹 요청은 submit_job 으로 작업을 등록만 하고, run_batch_worker 커맨드가 claim_next_job/run_job 으로 실행합니다.
+실행 중 출력과 진행률은 주기적으로 BatchJob 에 기록되어 조회 API 에서 부분 결과로 확인할 수 있습니다.
+"""
+import datetime
+import logging
+import threading
+import time
+import traceback
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from .models import BatchJob
+
+logger = logging.getLogger(__name__)
+
+# 진행률을 보고하는 커맨드가 stealth option 으로 받는 콜백 이름
+PROGRESS_OPTION = 'progress_callback'
+PROGRESS_COMMANDS = {'generate_missing_reviews', 'send_review_notifications', 'export_report_pack'}
+
+FLUSH_INTERVAL_SECONDS = 2.0
+# 출력/진행률이 없는 동안에도 heartbeat_at 을 갱신하는 간격. STALE_AFTER 보다 충분히 짧아야 함
+HEARTBEAT_INTERVAL_SECONDS = 60.0
+STALE_AFTER = datetime.timedelta(minutes=15)
+
+
+class JobCancelled(Exception):
+    """취소 요청된 작업을 중단하기 위해 진행률 콜백/출력 기록 시점에 발생시키는 예외"""
+
+
+def submit_job(command, args=None, user=None):
+    """
+    작업을 큐에 등록합니다. 같은 명령/인자로 대기 또는 실행 중인 작업이 있으면 그 작업을 반환합니다.
+    반환값: (job, created)
+    """
+    args = [str(arg) for arg in (args or [])]
+    existing = BatchJob.objects.filter(
+        command=command,
+        args=args,
+        status__in=[BatchJob.STATUS_PENDING, BatchJob.STATUS_RUNNING],
+    ).first()
+    if existing:
+        return existing, False
+
+    job = BatchJob.objects.create(command=command, args=args, created_by=user)
+    logger.info(f"Batch job #{job.pk} queued: {command} {' '.join(args)}")
+    return job, True
+
+
+def request_cancel(job):
+    """
+    작업 취소를 요청합니다. 대기 중인 작업은 즉시 취소되고,
+    실행 중인 작업은 다음 진행률 보고 또는 출력 기록(flush) 시점에 중단됩니다.
+    """
+    now = timezone.now()
+    cancelled = BatchJob.objects.filter(pk=job.pk, status=BatchJob.STATUS_PENDING).update(
+        status=BatchJob.STATUS_CANCELLED, cancel_requested=True, finished_at=now
+    )
+    if not cancelled:
+        BatchJob.objects.filter(pk=job.pk, status=BatchJob.STATUS_RUNNING).update(cancel_requested=True)
+    job.refresh_from_db()
+    return job
+
+
+def claim_next_job(worker_name):
+    """
+    가장 오래된 대기 작업을 조건부 UPDATE 로 선점합니다.
+    여러 워커가 동시에 실행되어도 UPDATE 가 1건 성공한 워커만 작업을 가져갑니다. (SQLite/PostgreSQL 공통)
+    """
+    pending_ids = BatchJob.objects.filter(status=BatchJob.STATUS_PENDING).order_by('created_at', 'pk').values_list('pk', flat=True)[:5]
+    for job_id in pending_ids:
+        now = timezone.now()
+        claimed = BatchJob.objects.filter(pk=job_id, status=BatchJob.STATUS_PENDING).update(
+            status=BatchJob.STATUS_RUNNING,
+            worker=worker_name,
+            started_at=now,
+            heartbeat_at=now,
+        )
+        if claimed:
+            return BatchJob.objects.get(pk=job_id)
+    return None
+
+
+def fail_stale_jobs(stale_after=STALE_AFTER):
+    """워커가 비정상 종료되어 오랫동안 갱신되지 않은 실행 중 작업을 실패 처리합니다."""
+    threshold = timezone.now() - stale_after
+    return BatchJob.objects.filter(status=BatchJob.STATUS_RUNNING, heartbeat_at__lt=threshold).update(
+        status=BatchJob.STATUS_FAILED,
+        error='워커 응답 없음 (비정상 종료)',
+        finished_at=timezone.now(),
+    )
+
+
+class JobReporter:
+    """커맨드의 stdout/stderr 로 쓰이는 스트림. 출력과 진행률을 모아 주기적으로 DB에 기록합니다."""
+
+    def __init__(self, job, flush_interval=FLUSH_INTERVAL_SECONDS):
+        self.job = job
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._progress = None
+
+    def write(self, text):
+        self._buffer.append(text)
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush(check_cancel=True)
+
+    def progress(self, current, total):
+        """커맨드에서 호출하는 진행률 콜백. 취소가 요청되었으면 JobCancelled 를 발생시킵니다."""
+        self._progress = (current, total)
+        self.flush(check_cancel=True)
+
+    def flush(self, check_cancel=False):
+        """
+        버퍼와 진행률을 기록합니다.
+        check_cancel 이면 취소 요청 여부도 확인해, 진행률을 보고하지 않는 커맨드도 출력 시점에 중단되도록 합니다.
+        """
+        updates = {'heartbeat_at': timezone.now()}
+        if self._buffer:
+            text = ''.join(self._buffer)
+            self._buffer = []
+            self.job.output += text
+            # 다른 프로세스(취소 요청 등)의 변경을 덮어쓰지 않도록 필요한 컬럼만 갱신
+            updates['output'] = self.job.output
+        if self._progress is not None:
+            updates['progress_current'], updates['progress_total'] = self._progress
+        BatchJob.objects.filter(pk=self.job.pk).update(**updates)
+        self._last_flush = time.monotonic()
+        if check_cancel and BatchJob.objects.filter(pk=self.job.pk, cancel_requested=True).exists():
+            raise JobCancelled()
+
+
+class JobHeartbeat(threading.Thread):
+    """
+    커맨드 실행 중 heartbeat_at 을 주기적으로 갱신하는 스레드.
+    출력 없이 오래 걸리는 작업이 fail_stale_jobs 에 의해 실패 처리되지 않도록 합니다.
+    """
+
+    def __init__(self, job, interval=HEARTBEAT_INTERVAL_SECONDS):
+        super().__init__(name=f'batch-job-{job.pk}-heartbeat', daemon=True)
+        self.job = job
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def beat(self):
+        BatchJob.objects.filter(pk=self.job.pk, status=BatchJob.STATUS_RUNNING).update(heartbeat_at=timezone.now())
+
+    def run(self):
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    self.beat()
+                except Exception as e:
+                    logger.warning(f"Batch job #{self.job.pk} heartbeat failed: {e}")
+        finally:
+            # 스레드별 DB 연결 정리
+            connection.close()
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def run_job(job):
+    """선점한 작업을 실행하고 최종 상태를 기록합니다."""
+    reporter = JobReporter(job)
+    options = {'stdout': reporter, 'stderr': reporter}
+    if job.command in PROGRESS_COMMANDS:
+        options[PROGRESS_OPTION] = reporter.progress
+
+    logger.info(f"Batch job #{job.pk} started: {job.command} {' '.join(job.args)}")
+    status = BatchJob.STATUS_SUCCEEDED
+    error = ''
+    heartbeat = JobHeartbeat(job)
+    heartbeat.start()
+    try:
+        call_command(job.command, *job.args, **options)
+    except JobCancelled:
+        status = BatchJob.STATUS_CANCELLED
+        reporter.write('\n작업이 취소되었습니다.\n')
+    except Exception as e:
+        status = BatchJob.STATUS_FAILED
+        error = str(e)
+        reporter.write(traceback.format_exc())
+        logger.error(f"Batch job #{job.pk} failed: {e}", exc_info=True)
+    finally:
+        heartbeat.stop()
+
+    reporter.flush()
+    BatchJob.objects.filter(pk=job.pk).update(status=status, error=error, finished_at=timezone.now())
+    job.refresh_from_db()
+    logger.info(f"Batch job #{job.pk} finished with status {status}")
+    if job.output:
+        logger.info(f"Output:\n{job.output}")
+    return job
@@ -0,0 +1,42 @@
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from batch.jobs import claim_next_job, fail_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = '배치 작업 큐(BatchJob)에서 대기 중인 작업을 꺼내 실행하는 워커를 구동합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=3.0, help='대기 작업이 없을 때 조회 간격(초)')
+        parser.add_argument('--once', action='store_true', help='대기 중인 작업을 모두 처리한 뒤 종료')
+        parser.add_argument('--name', type=str, help='워커 이름 (기본값: 호스트명:PID)')
+
+    def handle(self, *args, **options):
+        worker_name = options.get('name') or f"{socket.gethostname()}:{os.getpid()}"
+        poll_interval = options['poll_interval']
+
+        self.stdout.write(f"배치 워커 시작: {worker_name}")
+        stale_count = fail_stale_jobs()
+        if stale_count:
+            self.stdout.write(self.style.WARNING(f"응답 없는 실행 중 작업 {stale_count}건을 실패 처리했습니다."))
+
+        try:
+            while True:
+                close_old_connections()
+                job = claim_next_job(worker_name)
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                self.stdout.write(f"▶ 작업 #{job.pk} 실행: {job.command} {' '.join(job.args)}")
+                job = run_job(job)
+                self.stdout.write(f"■ 작업 #{job.pk} 종료: {job.get_status_display()}")
+        except KeyboardInterrupt:
+            self.stdout.write("배치 워커 종료")
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('command', models.CharField(choices=[('generate_missing_reviews', 'AI 리뷰 생성'), ('analyze_team_performance', '팀 성과 분석'), ('send_review_notifications', '리뷰 결과 메일 발송'), ('check_notifications', '모니터링 미작성자 알림')], max_length=50, verbose_name='명령')),
+                ('args', models.JSONField(blank=True, default=list, verbose_name='명령 인자')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('succeeded', '완료'), ('failed', '실패'), ('cancelled', '취소')], default='pending', max_length=20, verbose_name='상태')),
+                ('progress_current', models.IntegerField(default=0, verbose_name='처리 건수')),
+                ('progress_total', models.IntegerField(default=0, verbose_name='전체 건수')),
+                ('output', models.TextField(blank=True, verbose_name='실행 출력')),
+                ('error', models.TextField(blank=True, verbose_name='오류 내용')),
+                ('cancel_requested', models.BooleanField(default=False, verbose_name='취소 요청 여부')),
+                ('worker', models.CharField(blank=True, max_length=100, verbose_name='실행 워커')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='최근 갱신일시')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='batch_jobs', to=settings.AUTH_USER_MODEL, verbose_name='요청자')),
+            ],
+            options={
+                'verbose_name': '배치 작업',
+                'verbose_name_plural': '배치 작업 목록',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='batch_job_status_created_idx')],
+            },
+        ),
+    ]
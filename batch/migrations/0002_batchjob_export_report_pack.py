@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('batch', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='batchjob',
+            name='command',
+            field=models.CharField(choices=[('generate_missing_reviews', 'AI 리뷰 생성'), ('analyze_team_performance', '팀 성과 분석'), ('send_review_notifications', '리뷰 결과 메일 발송'), ('check_notifications', '모니터링 미작성자 알림'), ('export_report_pack', '주간 리포트 팩 내보내기')], max_length=50, verbose_name='명령'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+
+class BatchJob(models.Model):
+    """배치 작업 큐. 웹 요청은 작업을 등록만 하고, run_batch_worker 커맨드가 꺼내서 실행합니다."""
+
+    COMMAND_CHOICES = [
+        ('generate_missing_reviews', 'AI 리뷰 생성'),
+        ('analyze_team_performance', '팀 성과 분석'),
+        ('send_review_notifications', '리뷰 결과 메일 발송'),
+        ('check_notifications', '모니터링 미작성자 알림'),
+        ('export_report_pack', '주간 리포트 팩 내보내기'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_SUCCEEDED, '완료'),
+        (STATUS_FAILED, '실패'),
+        (STATUS_CANCELLED, '취소'),
+    ]
+    FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+    command = models.CharField("명령", max_length=50, choices=COMMAND_CHOICES)
+    args = models.JSONField("명령 인자", default=list, blank=True)
+    status = models.CharField("상태", max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    progress_current = models.IntegerField("처리 건수", default=0)
+    progress_total = models.IntegerField("전체 건수", default=0)
+    output = models.TextField("실행 출력", blank=True)
+    error = models.TextField("오류 내용", blank=True)
+    cancel_requested = models.BooleanField("취소 요청 여부", default=False)
+    worker = models.CharField("실행 워커", max_length=100, blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='batch_jobs', verbose_name="요청자")
+    created_at = models.DateTimeField("등록일시", auto_now_add=True)
+    started_at = models.DateTimeField("시작일시", null=True, blank=True)
+    finished_at = models.DateTimeField("종료일시", null=True, blank=True)
+    heartbeat_at = models.DateTimeField("최근 갱신일시", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "배치 작업"
+        verbose_name_plural = "배치 작업 목록"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='batch_job_status_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_command_display()} #{self.pk} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    @property
+    def progress_percent(self):
+        if self.status == self.STATUS_SUCCEEDED:
+            return 100
+        if not self.progress_total:
+            return 0
+        return min(int(self.progress_current * 100 / self.progress_total), 100)
+
+    @property
+    def download_url(self):
+        """결과 파일을 만드는 작업이 완료된 경우 다운로드 URL"""
+        if self.command == 'export_report_pack' and self.status == self.STATUS_SUCCEEDED:
+            return reverse('batch:download_report_pack', args=[self.pk])
+        return None
+
+    def to_dict(self, output_offset=0):
+        """상태 조회 API 응답. output_offset 이후의 출력만 포함합니다."""
+        return {
+            'id': self.pk,
+            'command': self.command,
+            'command_display': self.get_command_display(),
+            'args': self.args,
+            'status': self.status,
+            'status_display': self.get_status_display(),
+            'is_finished': self.is_finished,
+            'success': self.status == self.STATUS_SUCCEEDED,
+            'cancel_requested': self.cancel_requested,
+            'progress': {
+                'current': self.progress_current,
+                'total': self.progress_total,
+                'percent': self.progress_percent,
+            },
+            'output': self.output[output_offset:],
+            'output_offset': len(self.output),
+            'error': self.error,
+            'download_url': self.download_url,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -9,6 +9,12 @@ urlpatterns = [
     path('generate-missing-reviews/', views.generate_missing_reviews, name='generate_missing_reviews'),
     path('check-monitor-notifications/', views.check_monitor_notifications, name='check_monitor_notifications'),
     path('analyze-team-performance/', views.analyze_team_performance, name='analyze_team_performance'),
+    path('export-report-pack/', views.export_report_pack, name='export_report_pack'),
     path('operation-status/', views.get_operation_status, name='get_operation_status'),
     path('get-logs/', views.get_batch_logs, name='get_batch_logs'),
+    path('get-logs/stream/', views.stream_batch_logs, name='stream_batch_logs'),
+    path('jobs/', views.job_list, name='job_list'),
+    path('jobs/<int:job_id>/', views.job_status, name='job_status'),
+    path('jobs/<int:job_id>/cancel/', views.cancel_job, name='cancel_job'),
+    path('jobs/<int:job_id>/download/', views.download_report_pack, name='download_report_pack'),
 ]
@@ -1,51 +1,40 @@
+import codecs
 import datetime
 import logging
 import os
-import subprocess
-import sys
+import time
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import JsonResponse
-from django.shortcuts import render
-
-from reports.models import ReportReview, TeamPerformanceAnalysis
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, render
+
+from app.services.report_review import find_reviews_to_refresh
+from common.gemini_cache import get_cache_stats
+from common.week_calendar import WeekKey
+from reports.management.commands.export_report_pack import pack_output_path
+from reports.models import TeamPerformanceAnalysis
 from teams.models import Team
 
-logger = logging.getLogger(__name__)
-
-
-def _get_month_week_label(week_start: datetime.date, week_end: datetime.date) -> str:
-    if week_start.month == week_end.month:
-        first_monday = week_start.replace(day=1)
-        while first_monday.weekday() != 0:
-            first_monday += datetime.timedelta(days=1)
-        week_index = (week_start - first_monday).days // 7 + 1
-        return f"{week_start.month}월 {week_index}주차"
+from .jobs import request_cancel, submit_job
+from .models import BatchJob
 
-    month_base = week_end if week_start.day <= 3 else week_start
-    first_monday = month_base.replace(day=1)
-    while first_monday.weekday() != 0:
-        first_monday += datetime.timedelta(days=1)
-    week_index = (month_base - first_monday).days // 7 + 1
-    return f"{month_base.month}월 {week_index}주차"
+logger = logging.getLogger(__name__)
 
 
 def _get_recent_week_options(count: int = 5):
-    today = datetime.date.today()
-    this_monday = today - datetime.timedelta(days=today.weekday())
+    this_week = WeekKey.current()
     options = []
 
     for i in range(count):
-        week_start = this_monday - datetime.timedelta(weeks=i)
+        week = this_week.shift(-i)
+        week_start = week.start
         week_end = week_start + datetime.timedelta(days=6)
-        year, week_number, _ = week_start.isocalendar()
-        month_week = _get_month_week_label(week_start, week_end)
         options.append(
             {
-                'value': f'{year}-{week_number}',
-                'label': f'{month_week}({week_start.month}/{week_start.day}~{week_end.month}/{week_end.day})',
+                'value': f'{week.year}-{week.week}',
+                'label': f'{week.label}({week_start.month}/{week_start.day}~{week_end.month}/{week_end.day})',
             }
         )
 
@@ -78,20 +67,22 @@ def _get_review_completion_status(year: int, week_number: int):
     ).distinct()
     target_count = target_users.count()
 
-    reviewed_count = ReportReview.objects.filter(
-        user__in=target_users,
-        year=year,
-        week_number=week_number,
-    ).values('user_id').distinct().count()
+    missing_ids, stale_ids = find_reviews_to_refresh(
+        target_users.values_list('id', flat=True),
+        datetime.date.fromisocalendar(year, week_number, 1),
+    )
 
-    pending_count = max(target_count - reviewed_count, 0)
-    completed = pending_count == 0
+    pending_count = len(missing_ids)
+    reviewed_count = max(target_count - pending_count, 0)
+    stale_count = len(stale_ids)
+    completed = pending_count == 0 and stale_count == 0
 
     return {
         'completed': completed,
         'target_count': target_count,
         'reviewed_count': reviewed_count,
         'pending_count': pending_count,
+        'stale_count': stale_count,
         'can_run': not completed,
         'label': '완료' if completed else '미완료',
     }
@@ -151,65 +142,35 @@ def batch_operations(request):
             'teams': teams,
             'week_options': week_options,
             'default_week_value': week_options[0]['value'] if week_options else '',
+            # 리포트 팩은 분기 단위(13주) 내보내기까지 선택할 수 있도록 더 긴 기간 제공
+            'pack_week_options': _get_recent_week_options(26),
+            'log_stream_enabled': bool(settings.BATCH_LOG_STREAM_ENABLED),
         },
     )
 
 
+def _job_response(job, created):
+    return JsonResponse(
+        {
+            'success': True,
+            'created': created,
+            'job': job.to_dict(),
+        },
+        status=202 if created else 200,
+    )
+
+
 @staff_member_required
 def send_review_notifications(request):
     if request.method == 'POST':
-        try:
-            aws_region = os.environ.get('AWS_SES_REGION_NAME', 'Not Set')
-            aws_access_key = os.environ.get('AWS_SES_ACCESS_KEY_ID')
-            aws_secret_key = os.environ.get('AWS_SES_SECRET_ACCESS_KEY')
-
-            debug_log = "[ENV CHECK]\n"
-            debug_log += f"AWS_SES_REGION_NAME: {aws_region}\n"
-            debug_log += f"AWS_SES_ACCESS_KEY_ID: {'Set' if aws_access_key else 'Not Set'}\n"
-            debug_log += f"AWS_SES_SECRET_ACCESS_KEY: {'Set' if aws_secret_key else 'Not Set'}\n"
-            debug_log += "-" * 20 + "\n\n"
-
-            logger.info("Starting send_review_notifications batch job.")
-            logger.debug(debug_log)
-
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            result = subprocess.run(
-                [sys.executable, 'manage.py', 'send_review_notifications'],
-                cwd=project_root,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                timeout=300,
-            )
-
-            full_output = debug_log + result.stdout
-
-            logger.info(f"Batch job finished with return code {result.returncode}")
-            logger.info(f"Output:\n{full_output}")
-            logger.debug(f"Output:\n{full_output}")
-
-            return JsonResponse(
-                {
-                    'success': result.returncode == 0,
-                    'stdout': full_output,
-                    'stderr': '',
-                    'returncode': result.returncode,
-                }
-            )
-
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"Batch job timed out: {e}")
-            return JsonResponse(
-                {
-                    'success': False,
-                    'error': 'Command execution timed out (5 minutes).',
-                    'stdout': f"Timeout after {e.timeout} seconds.",
-                    'stderr': '',
-                }
-            )
-        except Exception as e:
-            logger.error(f"Batch job failed with exception: {e}", exc_info=True)
-            return JsonResponse({'success': False, 'error': str(e), 'stdout': '', 'stderr': ''})
+        logger.info(
+            "[ENV CHECK] AWS_SES_REGION_NAME: %s, AWS_SES_ACCESS_KEY_ID: %s, AWS_SES_SECRET_ACCESS_KEY: %s",
+            os.environ.get('AWS_SES_REGION_NAME', 'Not Set'),
+            'Set' if os.environ.get('AWS_SES_ACCESS_KEY_ID') else 'Not Set',
+            'Set' if os.environ.get('AWS_SES_SECRET_ACCESS_KEY') else 'Not Set',
+        )
+        job, created = submit_job('send_review_notifications', user=request.user)
+        return _job_response(job, created)
 
     return JsonResponse({'error': 'POST request only allowed.'}, status=405)
 
@@ -217,59 +178,18 @@ def send_review_notifications(request):
 @staff_member_required
 def generate_missing_reviews(request):
     if request.method == 'POST':
-        try:
-            week_value = request.POST.get('week')
-            parsed_week = _parse_week_value(week_value)
-            if not parsed_week:
-                return JsonResponse({'success': False, 'error': 'Invalid week selection.'})
-            year, week_number = parsed_week
-
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    'manage.py',
-                    'generate_missing_reviews',
-                    '--year',
-                    str(year),
-                    '--week',
-                    str(week_number),
-                ],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=600,
-            )
-
-            logger.info("Starting generate_missing_reviews batch job.")
-            logger.info(f"Batch job finished with return code {result.returncode}")
-            if result.stdout:
-                logger.info(f"Stdout:\n{result.stdout}")
-            if result.stderr:
-                logger.error(f"Stderr:\n{result.stderr}")
-
-            return JsonResponse(
-                {
-                    'success': result.returncode == 0,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'returncode': result.returncode,
-                }
-            )
-
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"Batch job timed out: {e}")
-            return JsonResponse(
-                {
-                    'success': False,
-                    'error': 'Command execution timed out (10 minutes).',
-                    'stdout': '',
-                    'stderr': '',
-                }
-            )
-        except Exception as e:
-            logger.error(f"Batch job failed with exception: {e}", exc_info=True)
-            return JsonResponse({'success': False, 'error': str(e), 'stdout': '', 'stderr': ''})
+        week_value = request.POST.get('week')
+        parsed_week = _parse_week_value(week_value)
+        if not parsed_week:
+            return JsonResponse({'success': False, 'error': 'Invalid week selection.'})
+        year, week_number = parsed_week
+
+        job, created = submit_job(
+            'generate_missing_reviews',
+            ['--year', year, '--week', week_number, '--stale'],
+            user=request.user,
+        )
+        return _job_response(job, created)
 
     return JsonResponse({'error': 'POST request only allowed.'}, status=405)
 
@@ -277,46 +197,8 @@ def generate_missing_reviews(request):
 @staff_member_required
 def check_monitor_notifications(request):
     if request.method == 'POST':
-        try:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-            result = subprocess.run(
-                [sys.executable, 'manage.py', 'check_notifications', '--type=monitor'],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-
-            logger.info("Starting check_monitor_notifications batch job.")
-            logger.info(f"Batch job finished with return code {result.returncode}")
-            if result.stdout:
-                logger.info(f"Stdout:\n{result.stdout}")
-            if result.stderr:
-                logger.error(f"Stderr:\n{result.stderr}")
-
-            return JsonResponse(
-                {
-                    'success': result.returncode == 0,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'returncode': result.returncode,
-                }
-            )
-
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"Batch job timed out: {e}")
-            return JsonResponse(
-                {
-                    'success': False,
-                    'error': 'Command execution timed out (5 minutes).',
-                    'stdout': '',
-                    'stderr': '',
-                }
-            )
-        except Exception as e:
-            logger.error(f"Batch job failed with exception: {e}", exc_info=True)
-            return JsonResponse({'success': False, 'error': str(e), 'stdout': '', 'stderr': ''})
+        job, created = submit_job('check_notifications', ['--type=monitor'], user=request.user)
+        return _job_response(job, created)
 
     return JsonResponse({'error': 'POST request only allowed.'}, status=405)
 
@@ -324,68 +206,96 @@ def check_monitor_notifications(request):
 @staff_member_required
 def analyze_team_performance(request):
     if request.method == 'POST':
+        team_id = request.POST.get('team_id')
+        if not team_id:
+            return JsonResponse({'success': False, 'error': 'Team ID is required.'})
         try:
-            team_id = request.POST.get('team_id')
-            if not team_id:
-                return JsonResponse({'success': False, 'error': 'Team ID is required.'})
-
-            week_value = request.POST.get('week')
-            parsed_week = _parse_week_value(week_value)
-            if not parsed_week:
-                return JsonResponse({'success': False, 'error': 'Invalid week selection.'})
-            year, week_number = parsed_week
-
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    'manage.py',
-                    'analyze_team_performance',
-                    str(team_id),
-                    '--year',
-                    str(year),
-                    '--week',
-                    str(week_number),
-                ],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-
-            logger.info(f"Starting analyze_team_performance batch job for Team ID {team_id}.")
-            logger.info(f"Batch job finished with return code {result.returncode}")
-            if result.stdout:
-                logger.info(f"Stdout:\n{result.stdout}")
-            if result.stderr:
-                logger.error(f"Stderr:\n{result.stderr}")
-
-            return JsonResponse(
-                {
-                    'success': result.returncode == 0,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'returncode': result.returncode,
-                }
-            )
-
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"Batch job timed out: {e}")
-            return JsonResponse(
-                {
-                    'success': False,
-                    'error': 'Command execution timed out (5 minutes).',
-                    'stdout': '',
-                    'stderr': '',
-                }
-            )
-        except Exception as e:
-            logger.error(f"Batch job failed with exception: {e}", exc_info=True)
-            return JsonResponse({'success': False, 'error': str(e), 'stdout': '', 'stderr': ''})
+            team_id = int(team_id)
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'Invalid team ID.'})
+
+        week_value = request.POST.get('week')
+        parsed_week = _parse_week_value(week_value)
+        if not parsed_week:
+            return JsonResponse({'success': False, 'error': 'Invalid week selection.'})
+        year, week_number = parsed_week
+
+        job, created = submit_job(
+            'analyze_team_performance',
+            [team_id, '--year', year, '--week', week_number],
+            user=request.user,
+        )
+        return _job_response(job, created)
 
     return JsonResponse({'error': 'POST request only allowed.'}, status=405)
 
 
+@staff_member_required
+def export_report_pack(request):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST request only allowed.'}, status=405)
+
+    start = _parse_week_value(request.POST.get('start_week'))
+    end = _parse_week_value(request.POST.get('end_week'))
+    if not start or not end:
+        return JsonResponse({'success': False, 'error': 'Invalid week selection.'})
+    if start > end:
+        start, end = end, start
+
+    args = [f'{start[0]}-{start[1]}', f'{end[0]}-{end[1]}']
+    team_id = request.POST.get('team_id')
+    if team_id:
+        try:
+            args += ['--team', int(team_id)]
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'Invalid team ID.'})
+
+    job, created = submit_job('export_report_pack', args, user=request.user)
+    return _job_response(job, created)
+
+
+@staff_member_required
+def download_report_pack(request, job_id):
+    job = get_object_or_404(BatchJob, pk=job_id, command='export_report_pack')
+    if job.status != BatchJob.STATUS_SUCCEEDED:
+        raise Http404("완료되지 않은 작업입니다.")
+
+    path = pack_output_path(job.args)
+    if not path.exists():
+        raise Http404("결과 파일이 없습니다. 작업을 다시 실행해 주세요.")
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=path.name, content_type='application/zip')
+
+
+@staff_member_required
+def job_list(request):
+    jobs = BatchJob.objects.all()[:20]
+    return JsonResponse({'success': True, 'jobs': [job.to_dict(output_offset=len(job.output)) for job in jobs]})
+
+
+@staff_member_required
+def job_status(request, job_id):
+    job = get_object_or_404(BatchJob, pk=job_id)
+    try:
+        offset = max(int(request.GET.get('offset', 0)), 0)
+    except ValueError:
+        offset = 0
+    return JsonResponse({'success': True, 'job': job.to_dict(output_offset=offset)})
+
+
+@staff_member_required
+def cancel_job(request, job_id):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST request only allowed.'}, status=405)
+
+    job = get_object_or_404(BatchJob, pk=job_id)
+    if job.is_finished:
+        return JsonResponse({'success': False, 'error': 'Job already finished.', 'job': job.to_dict()})
+
+    job = request_cancel(job)
+    logger.info(f"Batch job #{job.pk} cancel requested by {request.user.username}")
+    return JsonResponse({'success': True, 'job': job.to_dict()})
+
+
 @staff_member_required
 def get_operation_status(request):
     review_week = request.GET.get('review_week') or request.GET.get('week') or request.GET.get('performance_week')
@@ -409,21 +319,148 @@ def get_operation_status(request):
             'success': True,
             'review': review_status,
             'performance': performance_status,
+            'gemini_cache': get_cache_stats(),
         }
     )
 
 
+LOG_TAIL_BYTES = 64 * 1024
+LOG_MAX_CHUNK_BYTES = 256 * 1024
+LOG_STREAM_POLL_SECONDS = 1.0
+LOG_STREAM_MAX_SECONDS = 55  # EventSource 가 Last-Event-ID 로 자동 재연결하므로 워커를 오래 점유하지 않음
+LOG_STREAM_HEARTBEAT_SECONDS = 15
+
+
+def _get_batch_log_path():
+    return os.path.join(settings.BASE_DIR, 'logs', 'batch.log')
+
+
+def _parse_int(value, default=None):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _read_log_chunk(path, offset, file_id=None, max_bytes=LOG_MAX_CHUNK_BYTES):
+    """
+    offset(바이트) 이후에 추가된 완전한 줄만 읽어 반환합니다. 한 줄이 max_bytes 보다 길면 그 줄은 잘라서 반환합니다.
+    로그 파일이 교체(자정 rotate)되었거나 파일이 줄어든 경우 처음부터 다시 읽습니다.
+    반환값: (content, next_offset, file_id, reset)
+    """
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        current_file_id = f"{stat.st_dev}:{stat.st_ino}"
+        reset = False
+        if offset is None or offset < 0:
+            # 커서가 없으면 마지막 LOG_TAIL_BYTES 만 반환 (줄 단위로 맞춤)
+            offset = max(stat.st_size - LOG_TAIL_BYTES, 0)
+            if offset:
+                f.seek(offset - 1)
+                if f.read(1) != b'\n':
+                    f.readline()
+                offset = f.tell()
+        elif (file_id and file_id != current_file_id) or offset > stat.st_size:
+            offset = 0
+            reset = True
+
+        f.seek(offset)
+        data = f.read(max_bytes)
+
+    last_newline = data.rfind(b'\n')
+    if last_newline >= 0:
+        # 아직 기록 중인 마지막 줄은 다음 조회로 미룸
+        data = data[:last_newline + 1]
+    elif len(data) < max_bytes:
+        data = b''
+    else:
+        # max_bytes 보다 긴 한 줄은 잘라서라도 진행 (잘린 멀티바이트 문자만 다음 조회로 미룸)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        text = decoder.decode(data, final=False)
+        return text, offset + len(data) - len(decoder.getstate()[0]), current_file_id, reset
+    return data.decode('utf-8', errors='replace'), offset + len(data), current_file_id, reset
+
+
 @staff_member_required
 def get_batch_logs(request):
+    """
+    배치 로그를 커서(offset) 기반으로 조회합니다.
+    - offset 미지정: 파일 끝부분(LOG_TAIL_BYTES)만 반환
+    - offset 지정: 해당 바이트 위치 이후 새로 기록된 줄만 반환
+    응답의 offset/file_id 를 다음 요청에 그대로 전달하면 됩니다.
+    """
     try:
-        log_file_path = os.path.join(settings.BASE_DIR, 'logs', 'batch.log')
+        log_file_path = _get_batch_log_path()
         if not os.path.exists(log_file_path):
             return JsonResponse({'success': False, 'message': 'Log file not found.'})
 
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        offset = _parse_int(request.GET.get('offset'))
+        file_id = request.GET.get('file_id')
+        content, next_offset, current_file_id, reset = _read_log_chunk(log_file_path, offset, file_id)
 
-        return JsonResponse({'success': True, 'content': content})
+        return JsonResponse(
+            {
+                'success': True,
+                'content': content,
+                'offset': next_offset,
+                'file_id': current_file_id,
+                'reset': reset,
+            }
+        )
     except Exception as e:
         logger.error(f"Failed to read batch logs: {e}", exc_info=True)
         return JsonResponse({'success': False, 'message': str(e)})
+
+
+def _format_sse(event, data, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.split('\n'))
+    return '\n'.join(lines) + '\n\n'
+
+
+def _stream_batch_logs(path, offset, file_id):
+    started = time.monotonic()
+    last_sent = started
+    while time.monotonic() - started < LOG_STREAM_MAX_SECONDS:
+        if os.path.exists(path):
+            content, offset, file_id, reset = _read_log_chunk(path, offset, file_id)
+            if reset:
+                yield _format_sse('reset', '', f"{file_id}/{offset}")
+            if content:
+                # 이벤트 ID 로 커서를 전달해 재연결 시 Last-Event-ID 로 이어받음
+                yield _format_sse('log', content.rstrip('\n'), f"{file_id}/{offset}")
+                last_sent = time.monotonic()
+                continue
+        if time.monotonic() - last_sent >= LOG_STREAM_HEARTBEAT_SECONDS:
+            yield ': keep-alive\n\n'
+            last_sent = time.monotonic()
+        time.sleep(LOG_STREAM_POLL_SECONDS)
+
+
+@staff_member_required
+def stream_batch_logs(request):
+    """
+    배치 로그를 Server-Sent Events 로 스트리밍합니다. 커서는 offset/file_id 또는 Last-Event-ID 로 전달합니다.
+    연결마다 워커를 점유하므로 BATCH_LOG_STREAM_ENABLED 설정으로 켠 경우에만 사용합니다.
+    """
+    if not settings.BATCH_LOG_STREAM_ENABLED:
+        return JsonResponse({'success': False, 'message': 'Log streaming is disabled.'}, status=404)
+
+    offset = _parse_int(request.GET.get('offset'))
+    file_id = request.GET.get('file_id')
+
+    last_event_id = request.headers.get('Last-Event-ID')
+    if last_event_id and '/' in last_event_id:
+        file_id, _, last_offset = last_event_id.rpartition('/')
+        offset = _parse_int(last_offset, offset)
+
+    response = StreamingHttpResponse(
+        _stream_batch_logs(_get_batch_log_path(), offset, file_id),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 비활성화
+    return response
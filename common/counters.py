@@ -0,0 +1,89 @@
+"""
+사이드바 카운터 캐시
+모든 페이지의 context processor 가 조회하는 SR 상태별 건수와 읽지 않은 알림 수를 Django cache framework 에 보관합니다.
+ServiceRequest / Notification 의 save·delete 시그널(및 일괄 update 하는 코드)에서 무효화하며,
+프로세스별 로컬 메모리 캐시(기본값)에서는 다른 프로세스의 변경이 SIDEBAR_COUNTER_TTL 이내에 반영됩니다.
+"""
+import logging
+from typing import Dict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = 'counters'
+# SR 은 담당자 변경·승인 대기 전체 건수처럼 여러 사용자의 값에 영향을 주므로 세대(generation) 키로 한 번에 무효화
+SR_GENERATION_KEY = 'counters:sr:generation'
+SR_COUNTS_KEY = 'counters:sr:{generation}:{user_id}'
+NOTIFICATION_COUNT_KEY = 'counters:notifications:unread:{user_id}'
+
+
+def _get_cache():
+    try:
+        return caches[CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def _timeout():
+    return getattr(settings, 'SIDEBAR_COUNTER_TTL', 60)
+
+
+def _sr_generation(cache) -> int:
+    generation = cache.get(SR_GENERATION_KEY)
+    if generation is None:
+        generation = 1
+        cache.add(SR_GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def get_service_request_counts(user) -> Dict[str, int]:
+    """사용자의 SR 접수/처리/승인 대기 건수와 전체 승인 대기 건수를 반환합니다."""
+    from service.models import ServiceRequest
+
+    cache = _get_cache()
+    key = SR_COUNTS_KEY.format(generation=_sr_generation(cache), user_id=user.pk)
+    counts = cache.get(key)
+    if counts is None:
+        counts = {
+            'count_sr_reception': ServiceRequest.objects.filter(status='N', assignee=user).count(),  # 접수 대기
+            'count_sr_processing': ServiceRequest.objects.filter(status='P', assignee=user).count(),  # 내가 처리중
+            'count_approval_user': ServiceRequest.objects.filter(status='A', assignee=user).count(),  # 승인 대기
+            'count_sr_approval': ServiceRequest.objects.filter(status='A').count(),  # 전체 승인 대기
+        }
+        cache.set(key, counts, timeout=_timeout())
+    return counts
+
+
+def get_unread_notification_count(user) -> int:
+    from notifications.models import Notification
+
+    cache = _get_cache()
+    key = NOTIFICATION_COUNT_KEY.format(user_id=user.pk)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(user=user, is_read=False).count()
+        cache.set(key, count, timeout=_timeout())
+    return count
+
+
+def invalidate_service_request_counts() -> None:
+    cache = _get_cache()
+    try:
+        cache.incr(SR_GENERATION_KEY)
+    except ValueError:
+        cache.set(SR_GENERATION_KEY, 2, timeout=None)
+    except Exception as e:
+        logger.warning("SR counter cache invalidation failed: %s", e)
+
+
+def invalidate_notification_counts(*user_ids) -> None:
+    keys = [NOTIFICATION_COUNT_KEY.format(user_id=user_id) for user_id in set(user_ids) if user_id]
+    if not keys:
+        return
+    try:
+        _get_cache().delete_many(keys)
+    except Exception as e:
+        logger.warning("Notification counter cache invalidation failed: %s", e)
@@ -0,0 +1,138 @@
+"""
+Gemini 응답 캐시
+모델명, 생성 설정, 프롬프트의 해시로 키를 만들어 동일한 요청의 응답 텍스트를 재사용합니다.
+저장소는 Django cache framework 의 'gemini' 별칭(기본: 파일 기반)을 사용하며,
+TTL(GEMINI_CACHE_TTL)이 지나면 만료되고, 최대 항목 수(GEMINI_CACHE_MAX_ENTRIES)를 넘으면 일부 항목이 정리(cull)됩니다.
+적중/미스 통계는 응답과 함께 정리되지 않도록 'gemini_stats' 별칭에 따로 기록합니다.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = 'gemini'
+STATS_CACHE_ALIAS = 'gemini_stats'
+# incr 가 서버에서 원자적으로 처리되는 백엔드. 그 외 백엔드의 통계는 근사치
+ATOMIC_INCR_BACKENDS = (RedisCache, BaseMemcachedCache)
+KEY_PREFIX = 'gemini:response:'
+STATS_KEYS = {
+    'hits': 'gemini:stats:hits',
+    'misses': 'gemini:stats:misses',
+    'bypasses': 'gemini:stats:bypasses',
+}
+
+
+@dataclass(frozen=True)
+class CachedGeminiResponse:
+    """캐시에서 복원한 응답. extract_gemini_text 가 그대로 읽을 수 있도록 text 속성을 가집니다."""
+    text: str
+    cached: bool = True
+
+
+def _get_cache():
+    if not getattr(settings, 'GEMINI_CACHE_ENABLED', False):
+        return None
+    try:
+        return caches[CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return None
+
+
+def _get_stats_cache():
+    if _get_cache() is None:
+        return None
+    try:
+        return caches[STATS_CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return None
+
+
+def is_cache_enabled() -> bool:
+    return _get_cache() is not None
+
+
+def make_cache_key(model: str, contents: Any, config: Dict[str, Any]) -> str:
+    """모델, 생성 설정, 프롬프트 내용으로 콘텐츠 주소 기반 캐시 키를 생성합니다."""
+    payload = json.dumps(
+        {'model': model, 'config': config, 'contents': contents},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return f"{KEY_PREFIX}{digest}"
+
+
+def _incr(name: str) -> None:
+    cache = _get_stats_cache()
+    if cache is None:
+        return
+    key = STATS_KEYS[name]
+    try:
+        # add 는 키가 없을 때만 저장되므로, 처음 기록하는 프로세스가 여럿이어도 값을 덮어쓰지 않음
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except Exception as e:
+        logger.warning("Gemini cache stats update failed: %s", e)
+
+
+def get_cached_text(key: str) -> Optional[str]:
+    """캐시된 응답 텍스트를 반환하고 적중/미스 횟수를 기록합니다."""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        text = cache.get(key)
+    except Exception as e:
+        logger.warning("Gemini cache read failed: %s", e)
+        return None
+    _incr('hits' if text is not None else 'misses')
+    return text
+
+
+def store_text(key: str, text: str) -> None:
+    cache = _get_cache()
+    if cache is None or not text:
+        return
+    try:
+        cache.set(key, text)
+    except Exception as e:
+        logger.warning("Gemini cache write failed: %s", e)
+
+
+def record_bypass() -> None:
+    """강제 재생성으로 캐시 조회를 건너뛴 횟수를 기록합니다."""
+    _incr('bypasses')
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    배치 화면 표시용 캐시 적중/미스 통계를 반환합니다.
+    통계 저장소의 incr 가 원자적이지 않으면 동시 실행 중 일부 횟수가 유실될 수 있어 approximate=True 로 표시합니다.
+    """
+    if _get_cache() is None:
+        return {'enabled': False, 'hits': 0, 'misses': 0, 'bypasses': 0, 'hit_rate': 0.0, 'approximate': False}
+
+    stats_cache = _get_stats_cache()
+    values = stats_cache.get_many(list(STATS_KEYS.values())) if stats_cache is not None else {}
+    stats = {name: values.get(key, 0) for name, key in STATS_KEYS.items()}
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = round(stats['hits'] / lookups * 100, 1) if lookups else 0.0
+    stats['enabled'] = True
+    stats['approximate'] = not isinstance(stats_cache, ATOMIC_INCR_BACKENDS)
+    return stats
+
+
+def reset_cache_stats() -> None:
+    cache = _get_stats_cache()
+    if cache is not None:
+        cache.delete_many(list(STATS_KEYS.values()))
@@ -1,8 +1,18 @@
+import json
 import os
 import logging
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, Optional, Sequence
 from django.conf import settings
 
+from common.gemini_cache import (
+    CachedGeminiResponse,
+    get_cached_text,
+    is_cache_enabled,
+    make_cache_key,
+    record_bypass,
+    store_text,
+)
+
 try:
     from google import genai
     from google.api_core import exceptions as google_exceptions
@@ -72,15 +82,40 @@ def get_handled_exceptions() -> Sequence[type]:
         
     return tuple(handlers)
 
+def is_json_text(text: str) -> bool:
+    """응답 텍스트가 JSON 으로 파싱되는지 확인합니다 (캐시 저장 기본 검증)."""
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
 def generate_gemini_content(
     client: Any,
     model: str,
     contents: Any,
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    use_cache: bool = True,
+    force_refresh: bool = False,
+    validate: Callable[[str], bool] = is_json_text,
 ) -> Any:
     """
     Gemini API를 호출하고 프롬프트와 응답을 로깅합니다.
+    동일한 모델/설정/프롬프트의 응답이 캐시에 있으면 API를 호출하지 않고 캐시된 응답을 반환합니다.
+    force_refresh=True 이면 캐시 조회를 건너뛰고 새로 생성한 응답으로 캐시를 갱신합니다.
+    validate 를 통과한 응답만 캐시에 저장하므로, 잘못된 형식의 응답은 다음 호출에서 다시 생성됩니다.
     """
+    cache_key = make_cache_key(model, contents, config) if use_cache and is_cache_enabled() else None
+    if cache_key:
+        if force_refresh:
+            record_bypass()
+        else:
+            cached_text = get_cached_text(cache_key)
+            if cached_text is not None:
+                logger.info("--- Gemini Cache Hit ---")
+                logger.info("Model: %s, Key: %s", model, cache_key)
+                return CachedGeminiResponse(text=cached_text)
+
     # 프롬프트 로깅 (보안상 민감한 정보가 포함될 수 있으므로 주의가 필요할 수 있음)
     logger.info("--- Gemini Request ---")
     logger.info("Model: %s", model)
@@ -97,7 +132,13 @@ def generate_gemini_content(
         response_text = extract_gemini_text(response)
         logger.info("--- Gemini Response ---")
         logger.info("Text: %s", response_text)
-        
+
+        if cache_key and response_text:
+            if validate(response_text):
+                store_text(cache_key, response_text)
+            else:
+                logger.warning("Gemini response failed validation, not cached (key=%s)", cache_key)
+
         return response
     except Exception as e:
         logger.error("--- Gemini Error ---")
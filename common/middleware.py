@@ -14,5 +14,8 @@ class ThreadLocalUserMiddleware:
 
     def __call__(self, request):
         set_current_user(request.user)
-        response = self.get_response(request)
-        return response
+        try:
+            return self.get_response(request)
+        finally:
+            # 스레드 재사용 시 이전 요청 사용자가 남지 않도록 초기화
+            set_current_user(None)
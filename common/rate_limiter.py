@@ -0,0 +1,51 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    외부 API 호출 속도를 제한하는 스레드 안전 토큰 버킷입니다.
+    분당 허용 호출 수(rate_per_minute)만큼 토큰이 채워지며, capacity 만큼 순간 호출(burst)을 허용합니다.
+    rate_per_minute 가 0 이하이면 제한 없이 즉시 통과합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate_per_second = max(rate_per_minute, 0) / 60.0
+        self.capacity = max(capacity or 1, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate_per_second <= 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """토큰을 소비할 수 있을 때까지 대기한 뒤, 실제 대기한 시간(초)을 반환합니다."""
+        if self.unlimited:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_seconds = (tokens - self._tokens) / self.rate_per_second
+            self._sleep(wait_seconds)
+            waited += wait_seconds
@@ -0,0 +1,144 @@
+"""
+워크로그 본문(마크다운/HTML 혼용) 정규화
+주간보고 내보내기(PPTX/Excel)와 AI 프롬프트 구성에서 작성자마다 같은 본문을 반복해서 정리하므로,
+정규식은 모듈 로드 시 한 번만 컴파일하고 결과는 원문 기준 LRU 캐시에 보관합니다.
+(str 은 해시를 객체에 저장하므로 캐시 조회 비용은 본문 길이와 무관한 해시 조회 + 일치 비교 한 번)
+"""
+import html
+import re
+from functools import lru_cache
+from typing import Optional
+
+from django.utils.html import strip_tags
+
+TEXT_CACHE_SIZE = 4096
+
+# 줄바꿈으로 바꿀 태그: <br>, <br/>, <br />, </p> (대소문자 무관)
+_MARKDOWN_BREAK = re.compile(r'<br>|<br/>|<br />|(?i:</p\s*>)')
+# AI 프롬프트용 정리: <br>, </p>, </div>
+_HTML_BREAK = re.compile(r'<(?:br|/p|/div)>', re.IGNORECASE)
+
+# strong/b/font-weight 스타일은 ** 로 변환해 유지 (PPTX 에서 굵게 표시)
+_BOLD_TAGS = (
+    re.compile(r'<strong[^>]*>(.*?)</strong>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<b[^>]*>(.*?)</b>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<span[^>]*style="[^"]*font-weight:\s*(?:bolder|bold|700)[^"]*"[^>]*>(.*?)</span>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<span[^>]*style=\'[^\']*font-weight:\s*(?:bolder|bold|700)[^\']*\'[^>]*>(.*?)</span>', re.IGNORECASE | re.DOTALL),
+)
+
+_HEADING = re.compile(r'#{1,6}\s*')
+_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC = re.compile(r'\*(.*?)\*')
+_INLINE_CODE = re.compile(r'`(.*?)`')
+_BULLET = re.compile(r'^\s*[•\-\*\+]\s+', re.MULTILINE)
+_NUMBERED = re.compile(r'^\s*\d+\.\s+', re.MULTILINE)
+_SENTENCE_SPLIT = re.compile(r'([.;,])\s+')
+_SENTENCE_SEPARATORS = ('. ', ', ', '; ')
+
+_MANY_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+_REPEATED_BLANK_LINES = re.compile(r'\n\s*\n+')
+_SPACES = re.compile(r' +')
+
+# 이 길이를 넘는 줄은 문장 구분자 기준으로 나누고, 나눈 조각은 이 길이 안에서 다시 합침
+LONG_LINE = 80
+BULLET_WIDTH = 60
+
+
+def _strip_html(text: str) -> str:
+    if '<' in text:
+        text = strip_tags(text)
+    return html.unescape(text)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _markdown_to_pptx_text(text: str) -> str:
+    text = _MARKDOWN_BREAK.sub('\n', text)
+    if '<' in text:
+        for pattern in _BOLD_TAGS:
+            text = pattern.sub(r'**\1**', text)
+    text = _strip_html(text)
+
+    # 기본적인 마크다운만 제거 (** bold는 유지)
+    text = _HEADING.sub('', text)
+    text = _INLINE_CODE.sub(r'\1', text)
+    return _MANY_BLANK_LINES.sub('\n\n', text).strip()
+
+
+def markdown_to_pptx_text(text: Optional[str]) -> str:
+    """PPTX용 텍스트 정리 - 원본 형태 최대한 유지, bold 처리 포함"""
+    if not text:
+        return ""
+    return _markdown_to_pptx_text(text)
+
+
+def _split_long_line(line: str):
+    """긴 문장을 문장 구분자(. , ;) 기준으로 나눠 BULLET_WIDTH 이내 조각으로 다시 묶습니다."""
+    parts = _SENTENCE_SPLIT.split(line)
+    current = ""
+    for i in range(0, len(parts), 2):
+        segment = parts[i] + parts[i + 1] if i + 1 < len(parts) else parts[i]
+        if current and len(current) + len(segment) > BULLET_WIDTH:
+            yield current
+            current = segment
+        else:
+            current += segment
+    if current.strip():
+        yield current
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _markdown_to_plain_text(text: str) -> str:
+    text = _strip_html(_MARKDOWN_BREAK.sub('\n', text))
+
+    # 마크다운 문법 제거
+    text = _HEADING.sub('', text)
+    if '*' in text:
+        text = _BOLD.sub(r'\1', text)
+        text = _ITALIC.sub(r'\1', text)
+    if '`' in text:
+        text = _INLINE_CODE.sub(r'\1', text)
+
+    # 기존 블릿 기호/번호 제거
+    text = _BULLET.sub('', text)
+    text = _NUMBERED.sub('', text)
+
+    # 줄 단위로 한 번만 순회하며 글머리표 부여 (긴 문장은 분리)
+    bullets = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) > LONG_LINE and any(sep in line for sep in _SENTENCE_SEPARATORS):
+            bullets.extend(f"• {part.strip()}" for part in _split_long_line(line))
+        else:
+            bullets.append(f"• {line}")
+
+    text = _BLANK_LINES.sub('\n', '\n'.join(bullets))
+    return _SPACES.sub(' ', text).strip()
+
+
+def markdown_to_plain_text(text: Optional[str]) -> str:
+    """마크다운 및 HTML 텍스트를 일반 텍스트로 변환하고 가독성 개선 (Excel 등)"""
+    if not text:
+        return ""
+    return _markdown_to_plain_text(text)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _html_to_text(text: str) -> str:
+    text = _strip_html(_HTML_BREAK.sub('\n', text))
+    # 가독성을 위해 연속된 개행은 하나로 줄임
+    return _REPEATED_BLANK_LINES.sub('\n', text).strip()
+
+
+def html_to_text(text: Optional[str]) -> str:
+    """HTML 태그를 제거하고 줄바꿈만 살린 텍스트 (AI 프롬프트용)"""
+    if not text:
+        return ""
+    return _html_to_text(text)
+
+
+def clear_text_cache() -> None:
+    for func in (_markdown_to_pptx_text, _markdown_to_plain_text, _html_to_text):
+        func.cache_clear()
@@ -0,0 +1,91 @@
+"""
+ISO 주차 달력
+워크로그/리포트/리뷰/배치 화면이 공통으로 쓰는 주차 시작일(월요일), 종료일(금요일), 'M월 N주차' 표시를 계산합니다.
+월별 주차는 월요일이 속한 달 기준이며, 그 달의 첫 월요일과 같은 요일 간격이므로
+(월요일 일자 - 1) // 7 + 1 로 바로 계산됩니다. 연도별 표는 처음 사용할 때 한 번 만들어 캐시합니다.
+"""
+import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+class WeekInfo(NamedTuple):
+    start: datetime.date  # 월요일
+    end: datetime.date  # 금요일
+    label: str  # 'M월 N주차'
+
+
+def weeks_in_year(year: int) -> int:
+    """ISO 연도의 주차 수 (52 또는 53). 12월 28일은 항상 그 해 마지막 ISO 주차에 속함"""
+    return datetime.date(year, 12, 28).isocalendar()[1]
+
+
+def _label(monday: datetime.date) -> str:
+    return f"{monday.month}월 {(monday.day - 1) // 7 + 1}주차"
+
+
+@lru_cache(maxsize=32)
+def _year_table(year: int) -> Tuple[WeekInfo, ...]:
+    first_monday = datetime.date.fromisocalendar(year, 1, 1)
+    table = []
+    for index in range(weeks_in_year(year)):
+        monday = first_monday + datetime.timedelta(weeks=index)
+        table.append(WeekInfo(monday, monday + datetime.timedelta(days=4), _label(monday)))
+    return tuple(table)
+
+
+def week_info(year: int, week_number: int) -> WeekInfo:
+    """(연도, 주차) 의 시작일/종료일/표시. 없는 주차면 ValueError"""
+    table = _year_table(int(year))
+    week_number = int(week_number)
+    if not 1 <= week_number <= len(table):
+        raise ValueError(f"{year}년에는 {week_number}주차가 없습니다.")
+    return table[week_number - 1]
+
+
+def month_week_label(year: int, week_number: int) -> str:
+    """'7월 1주차' 형식의 월별 주차"""
+    return week_info(year, week_number).label
+
+
+class WeekKey(NamedTuple):
+    """(ISO 연도, 주차) 값 타입. 튜플이므로 정렬/비교/딕셔너리 키로 그대로 사용할 수 있습니다."""
+    year: int
+    week: int
+
+    @classmethod
+    def from_date(cls, day: datetime.date) -> 'WeekKey':
+        year, week, _ = day.isocalendar()
+        return cls(year, week)
+
+    @classmethod
+    def current(cls, today: Optional[datetime.date] = None) -> 'WeekKey':
+        return cls.from_date(today or datetime.date.today())
+
+    @property
+    def info(self) -> WeekInfo:
+        return week_info(self.year, self.week)
+
+    @property
+    def start(self) -> datetime.date:
+        return self.info.start
+
+    @property
+    def end(self) -> datetime.date:
+        return self.info.end
+
+    @property
+    def label(self) -> str:
+        return self.info.label
+
+    def shift(self, weeks: int) -> 'WeekKey':
+        return WeekKey.from_date(self.start + datetime.timedelta(weeks=weeks))
+
+    def previous(self) -> 'WeekKey':
+        return self.shift(-1)
+
+    def next(self) -> 'WeekKey':
+        return self.shift(1)
+
+    def __str__(self) -> str:
+        return f"{self.year}-W{self.week:02d}"
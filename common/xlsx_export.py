@@ -0,0 +1,87 @@
+"""
+스트리밍 Excel(xlsx) 내보내기
+openpyxl write-only 워크시트로 행을 하나씩 기록하므로 전체 셀을 메모리에 올리지 않고,
+완성된 파일은 임시 파일에 저장한 뒤 FileResponse 로 나눠서 전송합니다.
+셀 스타일은 셀마다 Font/Border 객체를 만드는 대신 워크북에 등록한 NamedStyle 을 이름으로 참조합니다.
+"""
+import tempfile
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from django.http import FileResponse
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+HEADER_STYLE = 'itms_header'
+BODY_STYLE = 'itms_body'
+# Excel 시트 이름 최대 길이
+MAX_SHEET_TITLE = 31
+
+
+class XlsxColumn(NamedTuple):
+    header: str
+    width: Optional[float] = None
+
+
+def _register_styles(wb: Workbook) -> None:
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    wb.add_named_style(NamedStyle(
+        name=HEADER_STYLE,
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        alignment=Alignment(horizontal='center', vertical='center'),
+        border=border,
+    ))
+    wb.add_named_style(NamedStyle(
+        name=BODY_STYLE,
+        alignment=Alignment(horizontal='left', vertical='top', wrap_text=True),
+        border=border,
+    ))
+
+
+def write_xlsx(fileobj, sheet_title: str, columns: Sequence[XlsxColumn], rows: Iterable[Sequence]) -> None:
+    """
+    헤더 한 줄과 rows 를 write-only 시트에 기록해 fileobj 에 저장합니다.
+    rows 는 queryset.iterator() 기반 제너레이터처럼 한 번만 순회 가능한 iterable 이어도 됩니다.
+    """
+    wb = Workbook(write_only=True)
+    _register_styles(wb)
+    ws = wb.create_sheet(title=sheet_title[:MAX_SHEET_TITLE])
+
+    # write-only 시트는 행을 쓰기 전에 컬럼 너비를 지정해야 함
+    for index, column in enumerate(columns, start=1):
+        if column.width:
+            ws.column_dimensions[get_column_letter(index)].width = column.width
+
+    def styled_row(values, style):
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        return cells
+
+    ws.append(styled_row([column.header for column in columns], HEADER_STYLE))
+    for row in rows:
+        ws.append(styled_row(row, BODY_STYLE))
+    wb.save(fileobj)
+
+
+def xlsx_response(
+    filename: str,
+    sheet_title: str,
+    columns: Sequence[XlsxColumn],
+    rows: Iterable[Sequence],
+) -> FileResponse:
+    """write_xlsx 결과를 임시 파일에 저장하고 첨부 파일 응답으로 반환합니다. (응답 종료 시 임시 파일 삭제)"""
+    tmp = tempfile.TemporaryFile()
+    try:
+        write_xlsx(tmp, sheet_title, columns, rows)
+        tmp.seek(0)
+    except Exception:
+        tmp.close()
+        raise
+    return FileResponse(tmp, as_attachment=True, filename=filename, content_type=XLSX_CONTENT_TYPE)
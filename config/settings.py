@@ -36,6 +36,41 @@ SITE_URL ="https://itms.samchully.co.kr"
 GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-pro")
 GEMINI_TIMEOUT = int(os.getenv("GEMINI_TIMEOUT", "30"))
 
+# AI 리뷰 일괄 생성(generate_missing_reviews) 동시 실행 및 호출 속도 제한
+REVIEW_BATCH_CONCURRENCY = int(os.getenv("REVIEW_BATCH_CONCURRENCY", "4"))
+REVIEW_BATCH_RATE_PER_MINUTE = float(os.getenv("REVIEW_BATCH_RATE_PER_MINUTE", "20"))
+REVIEW_BATCH_BURST = int(os.getenv("REVIEW_BATCH_BURST", "4"))
+REVIEW_BATCH_MAX_RETRIES = int(os.getenv("REVIEW_BATCH_MAX_RETRIES", "3"))
+REVIEW_BATCH_BACKOFF_SECONDS = float(os.getenv("REVIEW_BATCH_BACKOFF_SECONDS", "2"))
+
+# Gemini 응답 캐시 (동일 프롬프트 재요청 시 API 호출 생략)
+GEMINI_CACHE_ENABLED = int(os.getenv("GEMINI_CACHE_ENABLED", 1))
+GEMINI_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", 60 * 60 * 24 * 14))  # 14일
+GEMINI_CACHE_MAX_ENTRIES = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", "2000"))
+
+# 사이드바 카운터(SR 건수, 읽지 않은 알림 수) 캐시 유지 시간(초)
+# 로컬 메모리 캐시는 프로세스별이므로 다른 프로세스(배치 워커 등)의 변경은 이 시간 안에 반영된다
+SIDEBAR_COUNTER_TTL = int(os.getenv("SIDEBAR_COUNTER_TTL", "60"))
+
+# 대시보드 카운터 통계 사용자별 캐시 유지 시간(초)
+DASHBOARD_STATS_TTL = int(os.getenv("DASHBOARD_STATS_TTL", "60"))
+
+# 주간 리포트 스냅샷(작성자별 워크로그 가공 결과) 캐시 유지 시간(초). 워크로그가 바뀌면 키가 바뀌어 즉시 새로 생성
+REPORT_SNAPSHOT_TTL = int(os.getenv("REPORT_SNAPSHOT_TTL", "3600"))
+
+# 주간 리포트 팩(export_report_pack) 생성 병렬 프로세스 수. 0 이면 CPU 수(최대 4)
+REPORT_PACK_WORKERS = int(os.getenv("REPORT_PACK_WORKERS", "0"))
+
+# 자산 토폴로지 그래프 JSON 캐시 유지 시간(초). 자산/연결 변경 시그널에서 즉시 무효화
+ASSET_TOPOLOGY_CACHE_TTL = int(os.getenv("ASSET_TOPOLOGY_CACHE_TTL", "600"))
+
+# 배치 로그 실시간 보기(SSE) 사용 여부. 기본은 꺼져 있고 로그 창은 커서 기반 조회 API 를 주기적으로 호출한다
+# 켜면 열린 로그 창마다 동기 워커(스레드) 1개를 연결당 최대 55초씩 점유하므로, gunicorn 등 동기 워커 수에 여유가 있을 때만 사용
+BATCH_LOG_STREAM_ENABLED = int(os.getenv("BATCH_LOG_STREAM_ENABLED", 0))
+
+# 통합 검색 결과 페이지당 건수
+SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "20"))
+
 
 # Application definition
 
@@ -64,6 +99,7 @@ INSTALLED_APPS = [
     'templates',
     'assets',
     'hooks',
+    'search',
 ]
 
 MIDDLEWARE = [
@@ -153,6 +189,38 @@ DATABASES = {
 
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 사이드바 카운터 캐시. 여러 프로세스가 공유하려면 COUNTER_CACHE_BACKEND/LOCATION 으로 Redis 등을 지정
+    'counters': {
+        'BACKEND': os.environ.get('COUNTER_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('COUNTER_CACHE_LOCATION', 'sidebar-counters'),
+        'TIMEOUT': SIDEBAR_COUNTER_TTL,
+    },
+    # 배치(서브프로세스)와 웹 프로세스가 공유해야 하므로 파일 기반으로 둔다
+    'gemini': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('GEMINI_CACHE_DIR', os.path.join(BASE_DIR, 'cache', 'gemini')),
+        'TIMEOUT': GEMINI_CACHE_TTL,
+        'OPTIONS': {
+            'MAX_ENTRIES': GEMINI_CACHE_MAX_ENTRIES,
+        },
+    },
+    # Gemini 캐시 적중/미스 통계. 응답과 함께 cull 되지 않도록 별도 저장소에 둔다
+    # 파일 기반 incr 는 원자적이지 않아 동시 실행(배치 스레드 등) 시 일부 횟수가 유실될 수 있으므로(근사치로 표시),
+    # 정확한 값이 필요하면 GEMINI_STATS_CACHE_BACKEND/LOCATION 으로 Redis 또는 Memcached 를 지정
+    'gemini_stats': {
+        'BACKEND': os.environ.get('GEMINI_STATS_CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('GEMINI_STATS_CACHE_LOCATION', os.path.join(BASE_DIR, 'cache', 'gemini-stats')),
+        'TIMEOUT': None,
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,126 @@
+"""
+대시보드 통계
+업무 카운터는 조건부 집계(Count(filter=Q(...))) 한 번으로, SR/자산/점검일지 통계는 영역별로 한 번씩 조회합니다.
+랜딩 페이지라 호출이 가장 많으므로 사용자별로 DASHBOARD_STATS_TTL 동안 캐시합니다.
+"""
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from assets.models import Contract, System
+from monitor.models import OperationLog
+from service.models import ServiceRequest
+from task.models import Task
+
+STATS_CACHE_KEY = 'dashboard:stats:{user_id}:{today}'
+LEAD_TIME_DEADLINE_HOUR = 17  # 점검일 17시까지 완료 기준
+
+
+def user_tasks_q(user):
+    """작성한 업무 + 할당받은 업무"""
+    return Q(author=user) | Q(assigned_to=user)
+
+
+def get_task_counters(user, today):
+    """사용자 업무의 상태/우선순위/마감 구간별 건수를 한 번의 집계 쿼리로 반환합니다."""
+    # 담당자(M2M) 조인으로 생기는 중복은 서브쿼리로 대상 업무 id 를 먼저 좁혀 제거
+    task_ids = Task.objects.filter(user_tasks_q(user)).values('pk')
+    active = Q(status__in=['todo', 'in_progress'])
+    week_before = timezone.now() - datetime.timedelta(days=7)
+
+    return Task.objects.filter(pk__in=task_ids).aggregate(
+        total_tasks=Count('pk'),
+        todo_tasks=Count('pk', filter=Q(status='todo')),
+        in_progress_tasks=Count('pk', filter=Q(status='in_progress')),
+        done_tasks=Count('pk', filter=Q(status='done')),
+        urgent_tasks=Count('pk', filter=Q(priority='urgent')),
+        high_tasks=Count('pk', filter=Q(priority='high')),
+        medium_tasks=Count('pk', filter=Q(priority='medium')),
+        low_tasks=Count('pk', filter=Q(priority='low')),
+        # 마감일 임박 업무 (3일 이내) / 연체된 업무
+        urgent_deadline_count=Count('pk', filter=active & Q(due_date__gte=today, due_date__lte=today + datetime.timedelta(days=3))),
+        overdue_count=Count('pk', filter=active & Q(due_date__lt=today)),
+        new_tasks_count=Count('pk', filter=Q(created_at__gte=week_before)),
+    )
+
+
+def get_service_request_counters(user):
+    counts = ServiceRequest.objects.aggregate(
+        sr_receipt_target_count=Count('pk', filter=Q(status='N', assignee=user)),  # SR 접수 대상
+        sr_processing_count=Count('pk', filter=Q(status='P', assignee=user)),  # 처리중
+        sr_total_count=Count('pk'),
+    )
+    # 기존 화면 호환: 접수 대상 + 처리중
+    counts['sr_in_progress_count'] = counts['sr_receipt_target_count'] + counts['sr_processing_count']
+    return counts
+
+
+def get_asset_counters(user, year):
+    counts = System.objects.aggregate(
+        total_systems=Count('pk'),
+        my_systems_count=Count('pk', filter=Q(manager=user)),
+    )
+    # 올해 유효 계약 (올해 기간에 걸치는 계약) / 내 담당 시스템이 포함된 계약
+    counts.update(Contract.objects.aggregate(
+        active_contracts_count=Count(
+            'pk',
+            distinct=True,
+            filter=Q(start_date__lte=datetime.date(year, 12, 31), end_date__gte=datetime.date(year, 1, 1)),
+        ),
+        my_contracts_count=Count('pk', distinct=True, filter=Q(systems__manager=user)),
+    ))
+    return counts
+
+
+def get_lead_time_stats():
+    """
+    완료된 점검일지의 평균 리드타임 (완료일시 - 점검일 17:00)
+    리드타임이 24시간 이내면 'good', 그 외에는 'attention'
+    """
+    stats = {
+        'avg_lead_time_hours': None,
+        'avg_lead_time_days': None,
+        'avg_lead_time_remaining_hours': None,
+        'lead_time_status': None,
+    }
+    rows = OperationLog.objects.filter(completed=True, completed_at__isnull=False).values_list('date', 'completed_at')
+
+    total_seconds = 0
+    count = 0
+    for log_date, completed_at in rows:
+        deadline = timezone.make_aware(datetime.datetime.combine(log_date, datetime.time(LEAD_TIME_DEADLINE_HOUR)))
+        # 마감 전에 완료하면 음수
+        total_seconds += (completed_at - deadline).total_seconds()
+        count += 1
+    if not count:
+        return stats
+
+    avg_hours = total_seconds / count / 3600
+    stats.update({
+        'avg_lead_time_hours': avg_hours,
+        'avg_lead_time_days': int(avg_hours // 24),
+        'avg_lead_time_remaining_hours': int(avg_hours % 24),
+        'lead_time_status': 'good' if avg_hours <= 24 else 'attention',
+    })
+    return stats
+
+
+def get_dashboard_stats(user, today=None, use_cache=True):
+    """대시보드 카운터 전체를 반환합니다. 사용자/날짜별로 짧게 캐시합니다."""
+    today = today or timezone.localdate()
+    key = STATS_CACHE_KEY.format(user_id=user.pk, today=today.isoformat())
+    if use_cache:
+        stats = cache.get(key)
+        if stats is not None:
+            return stats
+
+    stats = {}
+    stats.update(get_task_counters(user, today))
+    stats.update(get_service_request_counters(user))
+    stats.update(get_asset_counters(user, today.year))
+    stats.update(get_lead_time_stats())
+    cache.set(key, stats, timeout=getattr(settings, 'DASHBOARD_STATS_TTL', 60))
+    return stats
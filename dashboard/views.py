@@ -2,15 +2,15 @@ from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.db.models import Q, Count
 from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import timedelta
 from task.models import Task
 from worklog.models import Worklog
 from notifications.models import Notification
 
 from monitor.models import OperationLog
-from service.models import ServiceRequest
-from assets.models import System, Contract
 from reports.models import ReportReview, WeeklyReport
+from search.services import search_documents
+from .services import get_dashboard_stats, user_tasks_q
 
 @login_required
 def dashboard(request):
@@ -19,18 +19,10 @@ def dashboard(request):
     today = timezone.now().date()
     current_year = today.year
     
-    # 업무 통계 (작성한 업무 + 할당받은 업무)
-    user_tasks = Q(author=user) | Q(assigned_to=user)
-    total_tasks = Task.objects.filter(user_tasks).distinct().count()
-    todo_tasks = Task.objects.filter(user_tasks, status='todo').distinct().count()
-    in_progress_tasks = Task.objects.filter(user_tasks, status='in_progress').distinct().count()
-    done_tasks = Task.objects.filter(user_tasks, status='done').distinct().count()
-    
-    # 우선순위별 업무 통계
-    urgent_tasks = Task.objects.filter(user_tasks, priority='urgent').distinct().count()
-    high_tasks = Task.objects.filter(user_tasks, priority='high').distinct().count()
-    medium_tasks = Task.objects.filter(user_tasks, priority='medium').distinct().count()
-    low_tasks = Task.objects.filter(user_tasks, priority='low').distinct().count()
+    # 카운터 통계 (업무/SR/자산/점검 리드타임, 사용자별 단기 캐시)
+    stats = get_dashboard_stats(user, today)
+
+    user_tasks = user_tasks_q(user)
     
     # 마감일 임박 업무 (3일 이내)
     upcoming_deadline = timezone.now() + timedelta(days=3)
@@ -96,69 +88,6 @@ def dashboard(request):
         date__gte=timezone.now().date()
     ).first()
     
-    # --- Service Request (SR) Data ---
-    # 1. SR 접수 대상 (Status 'A': 요청접수)
-    sr_receipt_target_count = ServiceRequest.objects.filter(status='N', assignee=user).count()
-
-    # 2. 현재 처리진행 중인 SR 건수 (Status 'P': 처리중)
-    sr_in_progress_count = ServiceRequest.objects.filter(status='P', assignee=user).count()
-
-    # --- Average Lead Time Calculation ---
-    # Calculate average lead time for completed operation logs
-    # Lead time = completed_at - (date + 17:00)
-    # Deadline is 5:00 PM on the operation log date
-    
-    avg_lead_time_hours = None
-    avg_lead_time_days = None
-    avg_lead_time_remaining_hours = None
-    lead_time_status = None  # 'good' or 'attention'
-    
-    completed_logs = OperationLog.objects.filter(
-        completed=True,
-        completed_at__isnull=False
-    )
-    
-    if completed_logs.exists():
-        total_seconds = 0
-        count = 0
-        
-        for log in completed_logs:
-            # Create deadline: operation date at 5:00 PM (17:00)
-            deadline = datetime.combine(log.date, datetime.min.time().replace(hour=17, minute=0))
-            deadline = timezone.make_aware(deadline)
-            
-            # Calculate lead time (can be negative if completed before deadline)
-            lead_time = (log.completed_at - deadline).total_seconds()
-            total_seconds += lead_time
-            count += 1
-        
-        # Calculate average in hours
-        avg_lead_time_seconds = total_seconds / count
-        avg_lead_time_hours = avg_lead_time_seconds / 3600
-        
-        # Convert to days and hours
-        avg_lead_time_days = int(avg_lead_time_hours // 24)
-        avg_lead_time_remaining_hours = int(avg_lead_time_hours % 24)
-        
-        # Determine status based on 24-hour threshold
-        if avg_lead_time_hours <= 24:
-            lead_time_status = 'good'
-        else:
-            lead_time_status = 'attention'
-
-    # --- Asset Management Data ---
-    # 1. 전체 시스템 개수
-    total_systems = System.objects.count()
-    # 2. 올해 유효 계약 건수 (현재 날짜가 시작일과 종료일 사이이거나 올해 기간에 걸치는 계약)
-    active_contracts_count = Contract.objects.filter(
-        start_date__year__lte=current_year,
-        end_date__year__gte=current_year
-    ).count()
-    # 3. 내 담당 자산 (내가 담당자인 시스템 + 해당 시스템이 포함된 계약)
-    my_managed_systems = System.objects.filter(manager=user)
-    my_systems_count = my_managed_systems.count()
-    my_contracts_count = Contract.objects.filter(systems__in=my_managed_systems).distinct().count()
-
     # --- AI Review Data ---
     # --- AI Review Data ---
     latest_review = ReportReview.objects.filter(user=user).order_by('-year', '-week_number').first()
@@ -179,14 +108,7 @@ def dashboard(request):
             latest_review_report_id = report.id
 
     context = {
-        'total_tasks': total_tasks,
-        'todo_tasks': todo_tasks,
-        'in_progress_tasks': in_progress_tasks,
-        'done_tasks': done_tasks,
-        'urgent_tasks': urgent_tasks,
-        'high_tasks': high_tasks,
-        'medium_tasks': medium_tasks,
-        'low_tasks': low_tasks,
+        **stats,
         'urgent_deadline_tasks': urgent_deadline_tasks,
         'overdue_tasks': overdue_tasks,
         'recent_tasks': recent_tasks,
@@ -199,20 +121,6 @@ def dashboard(request):
         # Monitor Data
         'monitor_pending_logs': monitor_pending_logs,
         'monitor_upcoming': monitor_upcoming,
-        # SR Data
-        'sr_receipt_target_count': sr_receipt_target_count,
-        'sr_in_progress_count': sr_receipt_target_count + sr_in_progress_count, # Re-calculate for UI coherence
-        'sr_total_count': ServiceRequest.objects.count(),
-        # Asset Data
-        'total_systems': total_systems,
-        'active_contracts_count': active_contracts_count,
-        'my_systems_count': my_systems_count,
-        'my_contracts_count': my_contracts_count,
-        'avg_lead_time_hours': avg_lead_time_hours,
-        'avg_lead_time_days': avg_lead_time_days,
-        'avg_lead_time_remaining_hours': avg_lead_time_remaining_hours,
-        'lead_time_status': lead_time_status,
-        'lead_time_status': lead_time_status,
         'today': timezone.now().date(),
         'latest_review': latest_review,
         'latest_report_id': latest_review_report_id,
@@ -223,26 +131,12 @@ def dashboard(request):
 
 @login_required
 def search(request):
-    """통합 검색 기능"""
-    query = request.GET.get('q', '')
-    results = {
-        'tasks': [],
-        'worklogs': [],
-        'query': query
-    }
-    
+    """통합 검색 (업무/주간업무/SR/시스템/계약/인시던트, 전문 검색 인덱스 기반)"""
+    query = request.GET.get('q', '').strip()
+    kind = request.GET.get('kind', '')
+    context = {'query': query, 'kind': kind}
+
     if query:
-        # 업무 검색 (작성한 업무 + 할당받은 업무)
-        user_tasks = Q(author=request.user) | Q(assigned_to=request.user)
-        results['tasks'] = Task.objects.filter(
-            Q(title__icontains=query) | Q(description__icontains=query),
-            user_tasks
-        ).distinct()
-        
-        # 워크로그 검색
-        results['worklogs'] = Worklog.objects.filter(
-            Q(this_week_work__icontains=query) | Q(next_week_plan__icontains=query),
-            author=request.user
-        )
-    
-    return render(request, 'dashboard/search_results.html', results)
+        context['results'] = search_documents(request.user, query, kind=kind, page=request.GET.get('page'))
+
+    return render(request, 'dashboard/search_results.html', context)
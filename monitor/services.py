@@ -0,0 +1,88 @@
+"""
+시스템점검일지 조회용 일괄 로더
+월간 목록/상세 화면에서 점검일지 × 카테고리 격자를 고정된 쿼리 수로 구성합니다.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models import Prefetch
+
+from .models import LogCategory, LogEntry, OperationLog, SubcategoryEntry
+
+
+@dataclass
+class OperationLogRow:
+    """점검일지 한 건과 카테고리 순서에 맞춘 로그 항목 목록 (항목이 없으면 None)"""
+    log: OperationLog
+    entries: List[Optional[LogEntry]]
+    # 비활성 카테고리를 포함해 점검완료 항목이 하나라도 있는지 (OperationLog.check_start 와 동일)
+    started: bool = False
+
+    @property
+    def ready(self) -> bool:
+        """모든 활성 카테고리가 점검완료인지 (OperationLog.check_complete 와 동일)"""
+        return all(entry is not None and entry.is_checked for entry in self.entries)
+
+
+@dataclass
+class OperationLogMatrix:
+    categories: List[LogCategory]
+    rows: List[OperationLogRow] = field(default_factory=list)
+
+    @property
+    def entries_map(self) -> Dict[int, Dict[int, Optional[LogEntry]]]:
+        """{log_id: {category_id: entry}} 형태. 템플릿의 get_item 필터로 조회합니다."""
+        return {
+            row.log.id: {category.id: entry for category, entry in zip(self.categories, row.entries)}
+            for row in self.rows
+        }
+
+    @property
+    def ready_map(self) -> Dict[int, bool]:
+        return {row.log.id: row.ready for row in self.rows}
+
+
+def load_operation_log_matrix(
+    logs: Iterable[OperationLog],
+    categories: Optional[Iterable[LogCategory]] = None,
+) -> OperationLogMatrix:
+    """
+    점검일지 목록의 로그 항목과 하위 카테고리 항목을 일괄 조회해 격자로 구성합니다.
+    LogEntry 1회, SubcategoryEntry 1회(prefetch)로 점검일지/카테고리 수와 무관하게 쿼리 수가 고정됩니다.
+    categories 를 생략하면 활성 카테고리를 순서대로 사용합니다.
+    """
+    logs = list(logs)
+    if categories is None:
+        categories = LogCategory.objects.filter(is_active=True).order_by('order')
+    categories = list(categories)
+    matrix = OperationLogMatrix(categories=categories)
+    if not logs:
+        return matrix
+
+    entries = (
+        LogEntry.objects
+        .filter(operation_log__in=logs)
+        .select_related('checked_by__profile')
+        .prefetch_related(
+            Prefetch(
+                'subcategory_entries',
+                queryset=SubcategoryEntry.objects.select_related('subcategory'),
+            )
+        )
+    )
+
+    entries_by_log: Dict[int, Dict[int, LogEntry]] = {}
+    started_logs = set()
+    for entry in entries:
+        entries_by_log.setdefault(entry.operation_log_id, {})[entry.category_id] = entry
+        if entry.is_checked:
+            started_logs.add(entry.operation_log_id)
+
+    for log in logs:
+        log_entries = entries_by_log.get(log.id, {})
+        matrix.rows.append(OperationLogRow(
+            log=log,
+            entries=[log_entries.get(category.id) for category in categories],
+            started=log.id in started_logs,
+        ))
+    return matrix
@@ -4,6 +4,7 @@ from monitor.models import (
     OperationLog, OperationLogAttachment, LogCategory, 
     LogSubcategory, LogEntry, SubcategoryEntry
 )
+from monitor.services import load_operation_log_matrix
 from datetime import date, datetime
 from calendar import monthrange
 from django.utils import timezone
@@ -30,32 +31,37 @@ def operation_log_list(request):
         month = datetime.today().strftime('%Y-%m')
     year, mon = map(int, month.split('-'))
 
-    logs = OperationLog.objects.filter(date__year=year, date__month=mon).order_by('date')
-    
-    # Get all active categories for display
-    categories = LogCategory.objects.filter(is_active=True).order_by('order')
-    
-    # 각 로그와 카테고리에 대한 로그 항목을 미리 준비
-    log_entries_map = {}
-    for log in logs:
-        log_entries_map[log.id] = {}
-        for category in categories:
-            entry = LogEntry.objects.filter(operation_log=log, category=category).first()
-            log_entries_map[log.id][category.id] = entry
-    
+    logs = (
+        OperationLog.objects
+        .filter(date__year=year, date__month=mon)
+        .select_related('duty_user__profile')
+        .order_by('date')
+    )
+
+    # 한 달치 로그 항목을 일괄 조회해 일자 × 카테고리 격자로 구성
+    matrix = load_operation_log_matrix(logs)
+
     return render(request, 'monitor/operation_log_list.html', {
-        'logs': logs,
+        'logs': [row.log for row in matrix.rows],
         'selected_month': month,
-        'categories': categories,
-        'log_entries_map': log_entries_map,
+        'categories': matrix.categories,
+        'log_entries_map': matrix.entries_map,
+        'log_ready_map': matrix.ready_map,
     })
 
 
 @login_required
 def operation_log_detail(request, pk):
-    log = get_object_or_404(OperationLog, pk=pk)
-    ready = log.check_complete()
-    current_step = get_workflow_status(log.check_start(), log.check_complete(), log.completed, log.approved)
+    log = get_object_or_404(
+        OperationLog.objects.select_related(
+            'duty_user__profile', 'completed_by__profile', 'approved_by__profile'
+        ),
+        pk=pk,
+    )
+    matrix = load_operation_log_matrix([log])
+    row = matrix.rows[0]
+    ready = row.ready
+    current_step = get_workflow_status(row.started, ready, log.completed, log.approved)
 
     steps = [
         {'name': '점검 전', 'step': -1, 'date': ' '},
@@ -73,14 +79,6 @@ def operation_log_detail(request, pk):
         else:
             s['status'] = 'N'
     
-    # Get all categories and their log entries for this operation log
-    categories = LogCategory.objects.filter(is_active=True).order_by('order')
-    log_entries = {}
-    
-    for category in categories:
-        entry = LogEntry.objects.filter(operation_log=log, category=category).first()
-        log_entries[category.id] = entry
-
     # Group attachments by category
     attachments_by_category = {}
     for attachment in log.attachments.all():
@@ -94,8 +92,8 @@ def operation_log_detail(request, pk):
         'ready': ready,
         'steps': steps,
         'step': current_step+1,
-        'categories': categories,
-        'log_entries': log_entries,
+        'categories': matrix.categories,
+        'log_entries': matrix.entries_map[log.id],
         'attachments_by_category': attachments_by_category,
     })
 
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
+from common.counters import invalidate_notification_counts
 from .models import Notification
 
 @admin.register(Notification)
@@ -69,12 +70,18 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ['mark_as_read', 'mark_as_unread', 'delete_read_notifications']
     
     def mark_as_read(self, request, queryset):
+        # is_read 로 필터된 목록이면 update 후 재조회 결과가 비므로 대상 사용자를 먼저 모음
+        user_ids = set(queryset.values_list('user_id', flat=True))
         updated = queryset.update(is_read=True)
+        invalidate_notification_counts(*user_ids)
         self.message_user(request, f'{updated}개 알림을 읽음으로 표시했습니다.')
     mark_as_read.short_description = '선택된 알림을 읽음으로 표시'
     
     def mark_as_unread(self, request, queryset):
+        # is_read 로 필터된 목록이면 update 후 재조회 결과가 비므로 대상 사용자를 먼저 모음
+        user_ids = set(queryset.values_list('user_id', flat=True))
         updated = queryset.update(is_read=False)
+        invalidate_notification_counts(*user_ids)
         self.message_user(request, f'{updated}개 알림을 읽지 않음으로 표시했습니다.')
     mark_as_unread.short_description = '선택된 알림을 읽지 않음으로 표시'
     
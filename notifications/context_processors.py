@@ -1,3 +1,4 @@
+from common.counters import get_unread_notification_count
 from .models import Notification
 
 def notifications(request):
@@ -10,7 +11,8 @@ def notifications(request):
         
         return {
             'unread_notifications': unread_notifications,
-            'unread_notifications_count': unread_notifications.count(),
+            # 읽지 않은 알림 수는 카운터 캐시에서 조회 (목록 queryset 은 템플릿에서 사용할 때만 실행됨)
+            'unread_notifications_count': get_unread_notification_count(request.user),
             'recent_notifications': recent_notifications,
         }
     return {
@@ -21,6 +21,10 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 주간 알림 중복 확인 (사용자별 유형/기간 조회)
+            models.Index(fields=['user', 'notification_type', 'created_at'], name='notif_user_type_created_idx'),
+        ]
 
     def __str__(self):
         return f'{self.user.username}: {self.title}'
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from common.counters import invalidate_notification_counts
+from .models import Notification
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_unread_counter(sender, instance, **kwargs):
+    """알림 생성/읽음/삭제 시 해당 사용자의 읽지 않은 알림 수 캐시 무효화"""
+    invalidate_notification_counts(instance.user_id)
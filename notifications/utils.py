@@ -1,6 +1,9 @@
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
+import datetime
 from datetime import timedelta
 from .models import Notification
+from common.counters import get_unread_notification_count, invalidate_notification_counts
 from task.models import Task
 from django.contrib.auth.models import User
 
@@ -107,134 +110,147 @@ def notify_task_status_changed(task, old_status, new_status, changer):
                 task=task
             )
 
+def _local_day_range(day):
+    """로컬 날짜 하루를 [시작, 다음날 시작) 범위의 aware datetime 으로 반환 (created_at 인덱스 범위 조회용)"""
+    start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+    return start, start + timedelta(days=1)
+
+
+def _bulk_create_notifications(notifications):
+    """
+    알림을 한 번에 저장합니다.
+    bulk_create 는 post_save 시그널을 보내지 않으므로 읽지 않은 알림 수 캐시를 직접 무효화합니다.
+    """
+    if not notifications:
+        return []
+    created = Notification.objects.bulk_create(notifications, batch_size=500)
+    invalidate_notification_counts(*(notification.user_id for notification in notifications))
+    return created
+
+
 def check_due_date_notifications():
     """
     마감일 임박 및 초과 업무 알림 체크
     (이 함수는 주기적으로 실행되어야 함 - 예: 매일 오전 9시)
+    대상 업무와 담당자는 일괄 조회하고, 오늘 이미 알림을 보낸 업무는 같은 쿼리에서 제외합니다.
     """
     today = timezone.localdate()
     three_days_later = today + timedelta(days=3)
+    today_start, tomorrow_start = _local_day_range(today)
 
-    # 마감일 임박 알림 (오늘, 1일 전, 3일 전)
-    upcoming_tasks = Task.objects.filter(
+    def notified_today(notification_type):
+        # 중복 알림 방지를 위해 오늘 이미 알림을 보낸 업무 제외
+        return Exists(Notification.objects.filter(
+            task=OuterRef('pk'),
+            notification_type=notification_type,
+            created_at__gte=today_start,
+            created_at__lt=tomorrow_start,
+        ))
+
+    # due_date 조건이 있으므로 due_date가 None인 업무는 포함되지 않음
+    tasks = Task.objects.select_related('author').prefetch_related('assigned_to')
+    upcoming_tasks = tasks.filter(
         due_date__gte=today,
         due_date__lte=three_days_later,
         status__in=['todo', 'in_progress']
-    )
+    ).exclude(notified_today('task_due'))
+    overdue_tasks = tasks.filter(
+        due_date__lt=today,
+        status__in=['todo', 'in_progress']
+    ).exclude(notified_today('task_overdue'))
 
-    for task in upcoming_tasks:
-        # due_date가 None이 아닌지 확인
-        if not task.due_date:
-            continue
+    notifications = []
 
+    # 마감일 임박 알림 (오늘, 1일 전, 3일 전)
+    for task in upcoming_tasks:
         days_left = (task.due_date - today).days
 
-        # 중복 알림 방지를 위해 오늘 이미 알림을 보냈는지 확인
-        today_notifications = Notification.objects.filter(
-            task=task,
+        # 업무 작성자에게 알림
+        notifications.append(Notification(
+            user=task.author,
             notification_type='task_due',
-            created_at__date=today
-        )
-
-        if not today_notifications.exists():
-            if days_left <= 3: # 3일 이하로 남은 경우에만 알림
-                # 업무 작성자에게 알림
-                create_notification(
-                    user=task.author,
-                    notification_type='task_due',
-                    title=f'업무 마감일이 {days_left}일 남았습니다',
-                    message=f'"{task.title}" 업무의 마감일이 {days_left}일 남았습니다. ({task.due_date.strftime("%Y-%m-%d")})',
-                    task=task
-                )
+            title=f'업무 마감일이 {days_left}일 남았습니다',
+            message=f'"{task.title}" 업무의 마감일이 {days_left}일 남았습니다. ({task.due_date.strftime("%Y-%m-%d")})',
+            task=task
+        ))
 
-                # 담당자들에게 알림
-                for assigned_user in task.assigned_to.all():
-                    create_notification(
-                        user=assigned_user,
-                        notification_type='task_due',
-                        title=f'담당 업무 마감일이 {days_left}일 남았습니다',
-                        message=f'담당하고 있는 "{task.title}" 업무의 마감일이 {days_left}일 남았습니다.',
-                        task=task
-                    )
+        # 담당자들에게 알림
+        for assigned_user in task.assigned_to.all():
+            notifications.append(Notification(
+                user=assigned_user,
+                notification_type='task_due',
+                title=f'담당 업무 마감일이 {days_left}일 남았습니다',
+                message=f'담당하고 있는 "{task.title}" 업무의 마감일이 {days_left}일 남았습니다.',
+                task=task
+            ))
 
     # 마감일 초과 알림
-    overdue_tasks = Task.objects.filter(
-        due_date__lt=today,
-        status__in=['todo', 'in_progress']
-    )
-
     for task in overdue_tasks:
-        # due_date가 None이 아닌지 확인
-        if not task.due_date:
-            continue
-
         days_overdue = (today - task.due_date).days
 
-        # 중복 알림 방지
-        today_overdue_notifications = Notification.objects.filter(
-            task=task,
+        # 업무 작성자에게 알림
+        notifications.append(Notification(
+            user=task.author,
             notification_type='task_overdue',
-            created_at__date=today
-        )
+            title=f'업무 마감일이 {days_overdue}일 지났습니다',
+            message=f'"{task.title}" 업무의 마감일이 {days_overdue}일 지났습니다. 빠른 처리가 필요합니다.',
+            task=task
+        ))
 
-        if not today_overdue_notifications.exists():
-            # 업무 작성자에게 알림
-            create_notification(
-                user=task.author,
+        # 담당자들에게 알림
+        for assigned_user in task.assigned_to.all():
+            notifications.append(Notification(
+                user=assigned_user,
                 notification_type='task_overdue',
-                title=f'업무 마감일이 {days_overdue}일 지났습니다',
-                message=f'"{task.title}" 업무의 마감일이 {days_overdue}일 지났습니다. 빠른 처리가 필요합니다.',
+                title=f'담당 업무 마감일이 {days_overdue}일 지났습니다',
+                message=f'담당하고 있는 "{task.title}" 업무의 마감일이 지났습니다. 긴급 처리가 필요합니다.',
                 task=task
-            )
+            ))
 
-            # 담당자들에게 알림
-            for assigned_user in task.assigned_to.all():
-                create_notification(
-                    user=assigned_user,
-                    notification_type='task_overdue',
-                    title=f'담당 업무 마감일이 {days_overdue}일 지났습니다',
-                    message=f'담당하고 있는 "{task.title}" 업무의 마감일이 지났습니다. 긴급 처리가 필요합니다.',
-                    task=task
-                )
+    return len(_bulk_create_notifications(notifications))
 
 def check_worklog_reminders():
     """
     워크로그 작성 알림 체크
     (매주 금요일 오후에 실행)
+    이번 주 워크로그 미작성자 중 아직 알림을 받지 않은 사용자를 한 번의 쿼리로 찾아 일괄 생성합니다.
     """
     from worklog.models import Worklog
-    import datetime
     
     # 현재 주차 정보
-    today = datetime.date.today()
-    year, week_number, _ = today.isocalendar()
+    today = timezone.localdate()
+    year, week_number, weekday = today.isocalendar()
+    week_start, _ = _local_day_range(today - timedelta(days=weekday - 1))
+    week_end = week_start + timedelta(days=7)
     
-    # 이번 주 워크로그를 작성하지 않은 사용자들 찾기
-    users_with_worklog = Worklog.objects.filter(
+    # 이번 주 워크로그를 작성한 사용자
+    worklog_written = Exists(Worklog.objects.filter(
+        author=OuterRef('pk'),
         year=year,
         week_number=week_number
-    ).values_list('author', flat=True)
+    ))
+    # 이미 이번 주 워크로그 알림을 받은 사용자 (user, notification_type, created_at 인덱스 사용)
+    already_reminded = Exists(Notification.objects.filter(
+        user=OuterRef('pk'),
+        notification_type='worklog_reminder',
+        created_at__gte=week_start,
+        created_at__lt=week_end
+    ))
     
-    users_without_worklog = User.objects.filter(
+    user_ids = User.objects.filter(
         is_active=True
-    ).exclude(id__in=users_with_worklog)
+    ).exclude(worklog_written).exclude(already_reminded).values_list('id', flat=True)
     
-    for user in users_without_worklog:
-        # 이미 이번 주 워크로그 알림을 받았는지 확인
-        existing_reminder = Notification.objects.filter(
-            user=user,
+    notifications = [
+        Notification(
+            user_id=user_id,
             notification_type='worklog_reminder',
-            created_at__week=week_number,
-            created_at__year=year
+            title='주간보고 작성 알림',
+            message='금주 주간보고를 아직 작성하지 않으셨습니다. 이번 주 업무 내용을 기록해주세요.'
         )
-        
-        if not existing_reminder.exists():
-            create_notification(
-                user=user,
-                notification_type='worklog_reminder',
-                title='주간보고 작성 알림',
-                message=f'금주 주간보고를 아직 작성하지 않으셨습니다. 이번 주 업무 내용을 기록해주세요.'
-            )
+        for user_id in user_ids
+    ]
+    return len(_bulk_create_notifications(notifications))
 
 def check_monitor_reminders():
     """
@@ -283,13 +299,15 @@ def mark_notifications_as_read(user, notification_ids=None):
     if notification_ids:
         queryset = queryset.filter(id__in=notification_ids)
     
-    return queryset.update(is_read=True)
+    updated = queryset.update(is_read=True)
+    invalidate_notification_counts(user.pk)
+    return updated
 
 def get_unread_notifications_count(user):
     """
     읽지 않은 알림 개수 반환
     """
-    return Notification.objects.filter(user=user, is_read=False).count()
+    return get_unread_notification_count(user)
 
 def get_recent_notifications(user, limit=10):
     """
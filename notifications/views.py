@@ -1,6 +1,7 @@
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
+from common.counters import invalidate_notification_counts
 from .models import Notification
 
 @login_required
@@ -24,5 +25,6 @@ def mark_all_notifications_read(request):
     """모든 알림을 읽음으로 표시"""
     if request.method == 'POST':
         Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+        invalidate_notification_counts(request.user.pk)
         return JsonResponse({'success': True})
     return JsonResponse({'success': False})
@@ -13,6 +13,7 @@ class Command(BaseCommand):
         parser.add_argument('team_id', type=int, help='Target Team ID')
         parser.add_argument('--year', type=int, help='ISO year anchor for analysis')
         parser.add_argument('--week', type=int, help='ISO week anchor for analysis')
+        parser.add_argument('--no-cache', action='store_true', help='Ignore cached Gemini responses and regenerate')
 
     def handle(self, *args, **options):
         team_id = options['team_id']
@@ -39,7 +40,11 @@ class Command(BaseCommand):
                 return
 
         analyzer = TeamPerformanceAnalyzer(team_id)
-        result = analyzer.analyze_last_4_weeks(anchor_year=anchor_year, anchor_week=anchor_week)
+        result = analyzer.analyze_last_4_weeks(
+            anchor_year=anchor_year,
+            anchor_week=anchor_week,
+            force_refresh=options.get('no_cache', False),
+        )
         
         if 'error' in result:
              self.stdout.write(self.style.ERROR(f"Analysis failed: {result['error']}"))
@@ -0,0 +1,63 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.services.pptx_export import (
+    build_weekly_report_pptx,
+    clear_pptx_template_cache,
+    load_pptx_template,
+)
+
+HEADER_LABELS = ["담당", "금주 실적", "차주 계획"]
+
+
+def _synthetic_entries(count, lines):
+    body = "\n".join(f"• **업무 {i + 1}** 진행 및 결과 공유" for i in range(lines))
+    return [
+        {"author": f"작성자{i + 1:03d}", "this_week": body, "next_week": body}
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = '작성자 수에 따른 주간보고 PPTX 내보내기 시간을 측정합니다 (DB 사용 안 함)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--authors', default='5,10,20,40,80',
+            help='측정할 작성자 수 목록 (쉼표 구분, 기본값: 5,10,20,40,80)',
+        )
+        parser.add_argument('--lines', type=int, default=3, help='작성자별 금주/차주 항목 줄 수 (기본값: 3)')
+        parser.add_argument('--repeat', type=int, default=5, help='작성자 수별 반복 횟수 (기본값: 5)')
+
+    def handle(self, *args, **options):
+        try:
+            author_counts = [int(value) for value in options['authors'].split(',') if value.strip()]
+        except ValueError:
+            raise CommandError("--authors 는 쉼표로 구분한 정수여야 합니다.")
+        repeat = max(options['repeat'], 1)
+
+        # 템플릿 로드: 최초(파싱) vs 캐시 재사용
+        clear_pptx_template_cache()
+        started = time.perf_counter()
+        load_pptx_template()
+        cold_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        load_pptx_template()
+        warm_ms = (time.perf_counter() - started) * 1000
+        self.stdout.write(f"템플릿 로드: 최초 {cold_ms:.1f}ms / 캐시 {warm_ms:.3f}ms")
+
+        self.stdout.write(f"{'작성자 수':>8} {'평균(ms)':>10} {'최소(ms)':>10} {'최대(ms)':>10} {'크기(KB)':>10}")
+        for count in author_counts:
+            entries = _synthetic_entries(count, options['lines'])
+            timings = []
+            size = 0
+            for _ in range(repeat):
+                started = time.perf_counter()
+                size = len(build_weekly_report_pptx(entries, "벤치마크 주간보고", HEADER_LABELS))
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(
+                f"{count:>8} {statistics.mean(timings):>10.1f} {min(timings):>10.1f} "
+                f"{max(timings):>10.1f} {size / 1024:>10.1f}"
+            )
@@ -0,0 +1,52 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.text_normalize import clear_text_cache, html_to_text, markdown_to_plain_text, markdown_to_pptx_text
+from worklog.models import Worklog
+
+FUNCTIONS = (
+    ('markdown_to_plain_text (Excel)', markdown_to_plain_text),
+    ('markdown_to_pptx_text (PPTX)', markdown_to_pptx_text),
+    ('html_to_text (AI 프롬프트)', html_to_text),
+)
+
+
+class Command(BaseCommand):
+    help = '저장된 워크로그 본문으로 텍스트 정규화 함수의 처리 시간을 측정합니다 (캐시 없음 / 캐시 적중)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=2000, help='사용할 최근 워크로그 수 (기본값: 2000)')
+        parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+
+    def handle(self, *args, **options):
+        corpus = []
+        worklogs = Worklog.objects.order_by('-year', '-week_number').values_list('this_week_work', 'next_week_plan')
+        for this_week, next_week in worklogs[:options['limit']].iterator():
+            corpus.extend(text for text in (this_week, next_week) if text)
+        if not corpus:
+            raise CommandError("측정에 사용할 워크로그가 없습니다.")
+
+        total_chars = sum(len(text) for text in corpus)
+        self.stdout.write(f"본문 {len(corpus)}건, 평균 {total_chars // len(corpus)}자")
+        self.stdout.write(f"{'함수':<32} {'캐시 없음(ms)':>14} {'캐시 적중(ms)':>14} {'건당(µs)':>10}")
+
+        repeat = max(options['repeat'], 1)
+        for name, func in FUNCTIONS:
+            cold, warm = [], []
+            for _ in range(repeat):
+                clear_text_cache()
+                started = time.perf_counter()
+                for text in corpus:
+                    func(text)
+                cold.append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                for text in corpus:
+                    func(text)
+                warm.append((time.perf_counter() - started) * 1000)
+
+            cold_ms, warm_ms = statistics.median(cold), statistics.median(warm)
+            self.stdout.write(f"{name:<32} {cold_ms:>14.1f} {warm_ms:>14.2f} {cold_ms * 1000 / len(corpus):>10.1f}")
+        clear_text_cache()
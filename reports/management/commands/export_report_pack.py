@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.services.report_pack import FORMATS, build_report_pack, pack_reports, parse_week, report_pack_path
+
+
+def default_workers():
+    return getattr(settings, 'REPORT_PACK_WORKERS', None) or min(4, os.cpu_count() or 1)
+
+
+def pack_output_path(args):
+    """배치 작업 인자(job.args)를 이 커맨드와 같은 방식으로 해석해 결과 ZIP 경로를 반환합니다."""
+    options = vars(Command().create_parser('manage.py', 'export_report_pack').parse_args(list(args)))
+    start, end, team_id, formats = _resolve(options)
+    return Path(options['output']) if options.get('output') else report_pack_path(start, end, team_id, formats)
+
+
+def _resolve(options):
+    try:
+        start, end = parse_week(options['start_week']), parse_week(options['end_week'])
+    except ValueError as e:
+        raise CommandError(str(e))
+    if start > end:
+        raise CommandError("시작 주차가 종료 주차보다 늦습니다.")
+    formats = FORMATS if options['format'] == 'all' else (options['format'],)
+    return start, end, options.get('team'), formats
+
+
+class Command(BaseCommand):
+    help = '기간(주차 범위)과 팀 기준으로 주간 리포트 PPTX/Excel 을 하나의 ZIP 으로 내보냅니다'
+    # 배치 작업 워커(batch.jobs)가 진행률을 받기 위해 전달하는 옵션
+    stealth_options = ('progress_callback',)
+
+    def add_arguments(self, parser):
+        parser.add_argument('start_week', help='시작 주차 (예: 2024-14)')
+        parser.add_argument('end_week', help='종료 주차, 포함 (예: 2024-26)')
+        parser.add_argument('--team', type=int, help='팀 ID (지정하지 않으면 모든 팀)')
+        parser.add_argument('--format', choices=[*FORMATS, 'all'], default='all', help='내보낼 형식 (기본값: all)')
+        parser.add_argument(
+            '--workers', type=int,
+            help='리포트 생성 병렬 프로세스 수 (기본값: settings.REPORT_PACK_WORKERS 또는 CPU 수, 최대 4)',
+        )
+        parser.add_argument('--output', help='ZIP 저장 경로 (기본값: MEDIA_ROOT/report_packs/ 아래 자동 생성)')
+
+    def handle(self, *args, **options):
+        start, end, team_id, formats = _resolve(options)
+        workers = options.get('workers') or default_workers()
+        output_path = Path(options['output']) if options.get('output') else report_pack_path(start, end, team_id, formats)
+
+        report_ids = list(pack_reports(start, end, team_id).values_list('pk', flat=True))
+        if not report_ids:
+            self.stdout.write(self.style.WARNING("해당 기간에 주간 리포트가 없습니다."))
+            return
+
+        self.stdout.write(
+            f"{start[0]}년 {start[1]}주차 ~ {end[0]}년 {end[1]}주차 리포트 {len(report_ids)}건 "
+            f"({', '.join(formats)}, 프로세스 {workers}개)"
+        )
+        file_count = build_report_pack(
+            report_ids, output_path, formats=formats, workers=workers,
+            progress=options.get('progress_callback'),
+        )
+        self.stdout.write(self.style.SUCCESS(f"파일 {file_count}개를 저장했습니다: {output_path}"))
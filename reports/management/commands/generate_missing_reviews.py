@@ -1,20 +1,33 @@
 import logging
-import time
 from datetime import date
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
-from worklog.models import Worklog
-from reports.models import ReportReview
-from app.services.report_review import review_last_4_weeks
+from app.services.report_review import find_reviews_to_refresh
+from app.services.review_batch import run_review_batch
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = 'Generate review reports for users who have current week worklogs but no existing review'
+    # 배치 작업 워커(batch.jobs)가 진행률을 받기 위해 전달하는 옵션
+    stealth_options = ('progress_callback',)
 
     def add_arguments(self, parser):
         parser.add_argument('--year', type=int, help='ISO year to process')
         parser.add_argument('--week', type=int, help='ISO week number to process')
+        parser.add_argument(
+            '--concurrency', type=int,
+            help='동시 실행 수 (기본값: settings.REVIEW_BATCH_CONCURRENCY)',
+        )
+        parser.add_argument(
+            '--rate', type=float,
+            help='분당 최대 API 호출 수, 0이면 제한 없음 (기본값: settings.REVIEW_BATCH_RATE_PER_MINUTE)',
+        )
+        parser.add_argument(
+            '--stale', action='store_true',
+            help='리뷰가 없는 사용자뿐 아니라, 리뷰 생성 이후 4주간 주간업무가 수정된 사용자의 리뷰도 재생성',
+        )
+        parser.add_argument('--no-cache', action='store_true', help='Gemini 응답 캐시를 무시하고 강제로 재생성')
 
     def handle(self, *args, **options):
         """
@@ -47,50 +60,73 @@ class Command(BaseCommand):
         
         self.stdout.write(f"현재 주차 워크로그 작성자: {users_with_worklog.count()}명")
         
-        # 이미 리뷰가 있는 사용자들 제외
-        users_without_review = users_with_worklog.exclude(
-            report_reviews__year=current_year,
-            report_reviews__week_number=current_week
+        # 리뷰가 없거나(--stale 지정 시) 입력 데이터가 바뀐 사용자만 대상으로 선정
+        missing_ids, stale_ids = find_reviews_to_refresh(
+            users_with_worklog.values_list('id', flat=True), target_monday
         )
-        
-        if not users_without_review.exists():
-            self.stdout.write(self.style.SUCCESS("모든 사용자의 리뷰가 이미 생성되어 있습니다."))
+        target_ids = missing_ids | stale_ids if options.get('stale') else missing_ids
+
+        if not target_ids:
+            if stale_ids:
+                self.stdout.write(self.style.SUCCESS(
+                    f"모든 사용자의 리뷰가 이미 생성되어 있습니다. (내용 변경 {len(stale_ids)}명은 --stale 로 재생성 가능)"
+                ))
+            else:
+                self.stdout.write(self.style.SUCCESS("모든 사용자의 리뷰가 최신 상태입니다."))
             return
-        
-        self.stdout.write(f"리뷰 생성 대상: {users_without_review.count()}명")
+
+        users_to_review = User.objects.filter(id__in=target_ids).order_by('id')
+        if options.get('stale'):
+            self.stdout.write(f"리뷰 생성 대상: {len(target_ids)}명 (미생성 {len(missing_ids)}명, 내용 변경 {len(stale_ids)}명)")
+        else:
+            self.stdout.write(f"리뷰 생성 대상: {len(target_ids)}명")
         self.stdout.write("-" * 50)
         
-        success_count = 0
-        fail_count = 0
-        
-        for user in users_without_review:
-            try:
-                self.stdout.write(f"🔄 {user.username}님의 리뷰를 생성 중...")
-                
-                # AI 리뷰 생성 (이 함수가 자동으로 DB에 저장함)
-                review_result = review_last_4_weeks(user, as_of=target_monday)
-                
-                if review_result.get('error'):
-                    self.stdout.write(self.style.WARNING(f"⚠️  {user.username}님 리뷰 생성 중 오류: {review_result['error']}"))
-                    fail_count += 1
-                else:
-                    self.stdout.write(self.style.SUCCESS(f"✅ {user.username}님의 리뷰가 성공적으로 생성되었습니다."))
-                    success_count += 1
-                
-                # 과도한 API 요청 방지를 위한 지연 (3초)
-                if user != users_without_review.last():
-                    time.sleep(3)
-                    
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"❌ {user.username}님 리뷰 생성 실패: {e}"))
-                logger.error(f"Failed to generate review for user {user.id}: {e}", exc_info=True)
-                fail_count += 1
-        
+        progress_callback = options.get('progress_callback')
+        processed = []
+        if progress_callback:
+            progress_callback(0, len(target_ids))
+
+        def report(result):
+            processed.append(result)
+            if result.success:
+                self.stdout.write(self.style.SUCCESS(
+                    f"✅ {result.username}님의 리뷰가 성공적으로 생성되었습니다. ({result.latency:.1f}s)"
+                ))
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f"⚠️  {result.username}님 리뷰 생성 중 오류: {result.error} (시도 {result.attempts}회)"
+                ))
+            if progress_callback:
+                progress_callback(len(processed), len(target_ids))
+
+        # AI 리뷰 생성 (review_last_4_weeks 가 자동으로 DB에 저장함)
+        summary = run_review_batch(
+            users_to_review,
+            as_of=target_monday,
+            concurrency=options.get('concurrency'),
+            rate_per_minute=options.get('rate'),
+            on_result=report,
+            force_refresh=options.get('no_cache', False),
+        )
+        success_count = summary.success_count
+        fail_count = summary.fail_count
+
         self.stdout.write("-" * 50)
         self.stdout.write(self.style.SUCCESS(f"✅ 성공: {success_count}건"))
         if fail_count > 0:
             self.stdout.write(self.style.WARNING(f"⚠️  실패: {fail_count}건"))
         self.stdout.write(f"📊 총 처리: {success_count + fail_count}건")
+
+        latency = summary.latency_percentiles()
+        self.stdout.write(
+            f"⏱️  소요 시간: {summary.elapsed:.1f}s, 동시 실행: {summary.concurrency}, "
+            f"처리량: {summary.throughput_per_minute:.1f}건/분, 재시도: {summary.retry_count}회"
+        )
+        self.stdout.write(
+            "⏱️  지연 시간: "
+            + ", ".join(f"{name}={value:.1f}s" for name, value in latency.items())
+        )
         
         if success_count > 0:
             self.stdout.write("\n💡 생성된 리뷰를 이메일로 발송하려면 다음 명령어를 실행하세요:")
@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = 'Sends pending AI review result notifications to users via email.'
+    # 배치 작업 워커(batch.jobs)가 진행률을 받기 위해 전달하는 옵션
+    stealth_options = ('progress_callback',)
 
     def handle(self, *args, **options):
         """
@@ -19,12 +21,18 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS("발송할 리뷰 알림이 없습니다."))
             return
 
-        self.stdout.write(f"총 {pending_reviews.count()}개의 리뷰 알림을 발송합니다.")
+        pending_reviews = list(pending_reviews.select_related('user'))
+        total_count = len(pending_reviews)
+        self.stdout.write(f"총 {total_count}개의 리뷰 알림을 발송합니다.")
         
         success_count = 0
         fail_count = 0
+        progress_callback = options.get('progress_callback')
+
+        for index, review in enumerate(pending_reviews, start=1):
+            if progress_callback:
+                progress_callback(index - 1, total_count)
 
-        for review in pending_reviews:
             try:
                 # 이메일 발송 함수 호출
                 send_review_notification(review)
@@ -42,6 +50,9 @@ class Command(BaseCommand):
                 logger.error(f"Failed to send notification for review {review.id}: {e}", exc_info=True)
                 fail_count += 1
 
+        if progress_callback:
+            progress_callback(total_count, total_count)
+
         self.stdout.write("-" * 30)
         self.stdout.write(self.style.SUCCESS(f"총 {success_count}건의 알림을 성공적으로 발송했습니다."))
         if fail_count > 0:
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0007_delete_teamweeklyreport'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportreview',
+            name='input_digest',
+            field=models.CharField(blank=True, default='', help_text='리뷰 생성에 사용된 4주간 주간업무 내용의 SHA-256 해시', max_length=64, verbose_name='입력 데이터 해시'),
+        ),
+    ]
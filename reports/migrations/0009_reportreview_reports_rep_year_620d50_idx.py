@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0008_reportreview_input_digest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reportreview',
+            index=models.Index(fields=['year', 'week_number', 'user'], name='reports_rep_year_620d50_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+
+from common.week_calendar import month_week_label, week_info
 from teams.models import Team
 from worklog.models import Worklog
 
@@ -10,12 +12,17 @@ class ReportReview(models.Model):
     year = models.IntegerField("년도")
     week_number = models.IntegerField("주차")
     review_content = models.JSONField("AI 리뷰 내용")
+    input_digest = models.CharField("입력 데이터 해시", max_length=64, blank=True, default='', help_text="리뷰 생성에 사용된 4주간 주간업무 내용의 SHA-256 해시")
     notification_sent = models.BooleanField("알림 발송 여부", default=False)
     created_at = models.DateTimeField("생성일시", auto_now_add=True)
     updated_at = models.DateTimeField("수정일시", auto_now=True)
 
     class Meta:
         unique_together = ('user', 'year', 'week_number')
+        # 리포트 상세/배치의 주차별 리뷰 존재 여부 조회용
+        indexes = [
+            models.Index(fields=['year', 'week_number', 'user']),
+        ]
         ordering = ['-year', '-week_number', 'user']
         verbose_name = "AI 리뷰 결과"
         verbose_name_plural = "AI 리뷰 결과 목록"
@@ -26,47 +33,17 @@ class ReportReview(models.Model):
     @property
     def week_start_date(self):
         """해당 주의 월요일 날짜"""
-        import datetime
-        return datetime.date.fromisocalendar(self.year, self.week_number, 1)
+        return week_info(self.year, self.week_number).start
 
     @property
     def week_end_date(self):
-        """해당 주의 일요일 날짜"""
-        import datetime
-        return self.week_start_date + datetime.timedelta(days=4)
+        """해당 주의 금요일 날짜"""
+        return week_info(self.year, self.week_number).end
 
     @property
     def month_week_display(self):
         """'7월 1주차'와 같은 형식으로 월별 주차를 반환합니다."""
-        import datetime
-        start_date = self.week_start_date
-        end_date = self.week_end_date
-        
-        # 주의 시작과 끝이 같은 달인 경우
-        if start_date.month == end_date.month:
-            # 해당 월의 첫 번째 월요일을 찾아서 몇 번째 주인지 계산
-            first_monday = start_date.replace(day=1)
-            while first_monday.weekday() != 0:  # 0 = 월요일
-                first_monday += datetime.timedelta(days=1)
-            
-            week_diff = (start_date - first_monday).days // 7 + 1
-            return f"{start_date.month}월 {week_diff}주차"
-        else:
-            # 주가 두 달에 걸쳐있는 경우, 더 많은 날이 포함된 달 기준
-            if start_date.day <= 3:  # 월요일~수요일이 이전 달
-                month = end_date.month
-                first_monday = end_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (end_date - first_monday).days // 7 + 1
-            else:  # 목요일~일요일이 다음 달
-                month = start_date.month
-                first_monday = start_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (start_date - first_monday).days // 7 + 1
-            
-            return f"{month}월 {week_diff}주차"
+        return month_week_label(self.year, self.week_number)
 
 
 class WeeklyReport(models.Model):
@@ -97,10 +74,7 @@ class WeeklyReport(models.Model):
         if report:
             return report, False
             
-        import datetime
-        week_start = datetime.date.fromisocalendar(year, week_number, 1)
-        # 'M월 W주차' 표시용 (기존 로직과 동일)
-        month_week_display = f"{week_start.month}월 {((week_start.day - 1) // 7) + 1}주차"
+        month_week_display = month_week_label(year, week_number)
         
         return cls.objects.get_or_create(
             year=year,
@@ -125,14 +99,12 @@ class WeeklyReport(models.Model):
     @property
     def week_start_date(self):
         """해당 주의 월요일 날짜"""
-        import datetime
-        return datetime.date.fromisocalendar(self.year, self.week_number, 1)
+        return week_info(self.year, self.week_number).start
 
     @property
     def week_end_date(self):
-        """해당 주의 일요일 날짜"""
-        import datetime
-        return self.week_start_date + datetime.timedelta(days=4)
+        """해당 주의 금요일 날짜"""
+        return week_info(self.year, self.week_number).end
 
     @property
     def next_week_start_date(self):
@@ -152,35 +124,8 @@ class WeeklyReport(models.Model):
     @property
     def month_week_display(self):
         """'7월 1주차'와 같은 형식으로 월별 주차를 반환합니다."""
-        import datetime
-        start_date = self.week_start_date
-        end_date = self.week_end_date
-        
-        # 주의 시작과 끝이 같은 달인 경우
-        if start_date.month == end_date.month:
-            # 해당 월의 첫 번째 월요일을 찾아서 몇 번째 주인지 계산
-            first_monday = start_date.replace(day=1)
-            while first_monday.weekday() != 0:  # 0 = 월요일
-                first_monday += datetime.timedelta(days=1)
-            
-            week_diff = (start_date - first_monday).days // 7 + 1
-            return f"{start_date.month}월 {week_diff}주차"
-        else:
-            # 주가 두 달에 걸쳐있는 경우, 더 많은 날이 포함된 달 기준
-            if start_date.day <= 3:  # 월요일~수요일이 이전 달
-                month = end_date.month
-                first_monday = end_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (end_date - first_monday).days // 7 + 1
-            else:  # 목요일~일요일이 다음 달
-                month = start_date.month
-                first_monday = start_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (start_date - first_monday).days // 7 + 1
-            
-            return f"{month}월 {week_diff}주차"
+        return month_week_label(self.year, self.week_number)
+
 
 class WeeklyReportComment(models.Model):
     """주간 리포트 코멘트"""
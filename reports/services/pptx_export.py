@@ -0,0 +1,326 @@
+"""
+주간 리포트 PPTX 내보내기
+템플릿(reports/files/templates.pptfile)은 프로세스당 한 번만 읽어 파일 내용, 기준 슬라이드 도형 XML,
+데이터 행 XML, 관계 목록을 캐시하고, 슬라이드 복제 시 캐시된 XML 에서 바로 생성합니다.
+템플릿 파일이 바뀌면(수정 시각 기준) 다시 읽습니다.
+"""
+import io
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from django.conf import settings
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_AUTO_SIZE, MSO_VERTICAL_ANCHOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.util import Pt
+
+R_NAMESPACE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+BOLD_PATTERN = re.compile(r'(\*\*.*?\*\*)')
+
+
+class PptxTemplateError(Exception):
+    """템플릿 구조가 내보내기에 맞지 않을 때 발생"""
+
+
+@dataclass(frozen=True)
+class PptxTemplate:
+    """파싱한 템플릿에서 요청마다 재사용하는 값들"""
+    path: str
+    mtime: float
+    data: bytes  # 템플릿 파일 내용
+    shapes_xml: Tuple[bytes, ...]  # 기준 슬라이드 도형 XML
+    row_xml: bytes  # 표의 데이터 행 XML
+    capacity: int  # 기준 슬라이드 표의 데이터 행 수
+    # (원본 rId, 관계 유형, 내부 파트명 또는 외부 URL, 외부 여부)
+    relationships: Tuple[Tuple[str, str, str, bool], ...]
+
+
+_template_cache: Dict[str, PptxTemplate] = {}
+_template_lock = threading.Lock()
+
+
+def default_template_path() -> Path:
+    return Path(settings.BASE_DIR) / "reports/files/templates.pptfile"
+
+
+def _get_table(slide):
+    for shape in slide.shapes:
+        if shape.has_table:
+            return shape.table
+    return None
+
+
+def _parse_template(path: str, mtime: float) -> PptxTemplate:
+    with open(path, 'rb') as f:
+        data = f.read()
+    prs = Presentation(io.BytesIO(data))
+    base_slide = prs.slides[0]
+
+    base_table = _get_table(base_slide)
+    if base_table is None:
+        raise PptxTemplateError("템플릿에 표가 없습니다.")
+    if len(base_table.rows) < 2:
+        raise PptxTemplateError("템플릿에 데이터 행이 필요합니다.")
+
+    relationships = []
+    for r_id, rel in base_slide.part.rels.items():
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            continue
+        # 발표자 노트는 복사하지 않는 편이 안전
+        if "notesSlide" in str(rel.reltype):
+            continue
+        if rel.is_external:
+            relationships.append((r_id, rel.reltype, rel.target_ref, True))  # URL 문자열
+        else:
+            relationships.append((r_id, rel.reltype, str(rel.target_part.partname), False))  # 내부 파트
+
+    return PptxTemplate(
+        path=path,
+        mtime=mtime,
+        data=data,
+        shapes_xml=tuple(etree.tostring(shape._element) for shape in base_slide.shapes),
+        row_xml=etree.tostring(base_table._tbl.tr_lst[1]),
+        capacity=max(len(base_table.rows) - 1, 1),
+        relationships=tuple(relationships),
+    )
+
+
+def load_pptx_template(path: Optional[Path] = None) -> PptxTemplate:
+    """템플릿을 캐시에서 반환하고, 처음이거나 파일이 바뀐 경우에만 다시 파싱합니다."""
+    path = str(path or default_template_path())
+    mtime = Path(path).stat().st_mtime
+    template = _template_cache.get(path)
+    if template is not None and template.mtime == mtime:
+        return template
+    with _template_lock:
+        template = _template_cache.get(path)
+        if template is None or template.mtime != mtime:
+            template = _parse_template(path, mtime)
+            _template_cache[path] = template
+    return template
+
+
+def clear_pptx_template_cache() -> None:
+    _template_cache.clear()
+
+
+class _SlideCloner:
+    """한 프레젠테이션 안에서 캐시된 기준 슬라이드 XML 로 새 슬라이드를 만듭니다."""
+
+    def __init__(self, prs, template: PptxTemplate, layout):
+        self.prs = prs
+        self.template = template
+        self.layout = layout
+        self._parts = None
+
+    def _part(self, partname):
+        if self._parts is None:
+            self._parts = {str(part.partname): part for part in self.prs.part.package.iter_parts()}
+        return self._parts[partname]
+
+    def clone(self):
+        new_slide = self.prs.slides.add_slide(self.layout)
+
+        # 기본 placeholder 제거
+        for shape in list(new_slide.shapes):
+            sp = shape._element
+            sp.getparent().remove(sp)
+
+        # 관계 연결 후 도형 XML 의 rId 를 새 슬라이드의 rId 로 바꿈
+        rid_map = {}
+        for old_rid, reltype, target, is_external in self.template.relationships:
+            target_ref = target if is_external else self._part(target)
+            rid_map[old_rid] = new_slide.part.relate_to(target_ref, reltype, is_external=is_external)
+
+        for shape_xml in self.template.shapes_xml:
+            element = parse_xml(shape_xml)
+            if rid_map:
+                _remap_relationship_ids(element, rid_map)
+            new_slide.shapes._spTree.insert_element_before(element, "p:extLst")
+        return new_slide
+
+
+def _remap_relationship_ids(element, rid_map):
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if name.startswith('{%s}' % R_NAMESPACE) and value in rid_map:
+                node.set(name, rid_map[value])
+
+
+def _fit_cell_text(cell, text, *, max_size=11, min_size=9, bold=False, font_color=None):
+    """표 셀 텍스트를 자동 축소하여 맞춤 - bold 마크다운 처리"""
+    tf = cell.text_frame
+    tf.clear()
+    tf.word_wrap = True
+    tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+
+    p = tf.paragraphs[0]
+    p.line_spacing = 1.2  # 줄간격 1.2배수로 설정
+    p.space_after = Pt(0)
+
+    if not text:
+        text = ""
+
+    # **bold** 마크다운 처리
+    for part in BOLD_PATTERN.split(text):
+        if part.startswith('**') and part.endswith('**'):
+            run = p.add_run()
+            run.text = part[2:-2]  # ** 제거
+            run.font.bold = True
+            run.font.size = Pt(max_size)
+            if font_color:
+                run.font.color.rgb = font_color
+        elif part:
+            run = p.add_run()
+            run.text = part
+            run.font.bold = bold
+            run.font.size = Pt(max_size)
+            if font_color:
+                run.font.color.rgb = font_color
+
+    # 줄 수 계산
+    return max(text.count("\n") + 1, 1)
+
+
+def _tighten_cell_layout(cell):
+    """표 셀 여백 최소화 (너무 작으면 텍스트가 잘림)"""
+    cell.margin_left = Pt(4)
+    cell.margin_right = Pt(4)
+    cell.margin_top = Pt(3)
+    cell.margin_bottom = Pt(3)
+
+
+def _set_cell_text(cell, text, *, bold=False, max_size=11, min_size=9):
+    _tighten_cell_layout(cell)
+    lines = _fit_cell_text(cell, text, max_size=max_size, min_size=min_size, bold=bold)
+    cell.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+    return lines
+
+
+def build_weekly_report_pptx(
+    entries: Sequence[dict],
+    title: str,
+    header_labels: Sequence[str],
+    template: Optional[PptxTemplate] = None,
+) -> bytes:
+    """
+    작성자별 항목({'author', 'this_week', 'next_week'})으로 주간보고 PPTX 를 만들어 바이트로 반환합니다.
+    표가 슬라이드 높이를 넘으면 기준 슬라이드를 복제해 나머지 항목을 이어서 채웁니다.
+    """
+    template = template or load_pptx_template()
+    prs = Presentation(io.BytesIO(template.data))
+    base_slide = prs.slides[0]
+    cloner = _SlideCloner(prs, template, base_slide.slide_layout)
+
+    slide_width = prs.slide_width
+    # 슬라이드 실제 높이에 맞게 표 최대 높이 설정 (약 75% 수준)
+    slide_body_max = prs.slide_height / 12700 * 0.75
+
+    def optimize_table_layout(table):
+        """표 레이아웃 최적화 - 컬럼 너비 재분배"""
+        if len(table.columns) < 3:
+            return
+        # 슬라이드 너비의 95% 사용, 담당(10%) : 금주실적(45%) : 차주계획(45%)
+        table_width = int(slide_width * 0.95)
+        for i, ratio in enumerate([0.1, 0.45, 0.45]):
+            table.columns[i].width = int(table_width * ratio)
+
+    def populate_table(target_slide, chunk):
+        """표를 채우고, 슬라이드 높이를 넘으면 False (분할 필요)"""
+        table = None
+        for shape in target_slide.shapes:
+            if shape.has_table:
+                table = shape.table
+                optimize_table_layout(table)
+                # 표를 가운데 정렬
+                shape.left = (slide_width - sum(col.width for col in table.columns)) // 2
+                break
+        if table is None:
+            return False
+
+        # 기존 행 제거 (헤더 제외) 후 새 행 추가
+        tbl = table._tbl
+        while len(tbl.tr_lst) > 1:
+            tbl.remove(tbl.tr_lst[-1])
+        for _ in chunk:
+            tbl.append(parse_xml(template.row_xml))
+
+        # 헤더 설정 (3개 컬럼만 사용)
+        header_row = table.rows[0]
+        for i, label in enumerate(header_labels):
+            if i < len(header_row.cells):
+                _tighten_cell_layout(header_row.cells[i])
+                _fit_cell_text(header_row.cells[i], label, max_size=12, min_size=12, bold=True, font_color=RGBColor(255, 255, 255))
+        # 4번째 컬럼이 있다면 숨기기
+        if len(header_row.cells) > 3:
+            header_row.cells[3].text = ""
+        header_row.height = Pt(38)
+
+        total_height = header_row.height.pt
+        for row_idx, entry in enumerate(chunk, start=1):
+            if row_idx >= len(table.rows):
+                break
+            row = table.rows[row_idx]
+
+            l1 = _set_cell_text(row.cells[0], entry["author"], bold=True, max_size=13, min_size=9)
+            l2 = _set_cell_text(row.cells[1], entry["this_week"], max_size=10, min_size=10)
+            l3 = _set_cell_text(row.cells[2], entry["next_week"], max_size=10, min_size=10)
+            if len(row.cells) > 3:
+                row.cells[3].text = ""
+
+            # 행 높이 계산 (최대 줄 수 기준)
+            row_height_pt = 24 + (max(l1, l2, l3) - 1) * 12
+            row.height = Pt(row_height_pt)
+            total_height += row_height_pt
+
+            # 슬라이드 높이 초과 검사 (단, 최소 1개의 행은 보장)
+            if total_height > slide_body_max and row_idx > 1:
+                tbl.remove(tbl.tr_lst[-1])
+                return False
+        return True
+
+    slide_index = 0
+    entry_index = 0
+    while entry_index < len(entries):
+        slide = base_slide if slide_index == 0 else cloner.clone()
+        chunk = list(entries[entry_index:entry_index + template.capacity])
+
+        if populate_table(slide, chunk):
+            entry_index += len(chunk)
+        elif len(chunk) > 1:
+            # 절반으로 줄여서 재시도, 그래도 넘치면 1개씩이라도 처리
+            chunk = chunk[:len(chunk) // 2]
+            if populate_table(slide, chunk):
+                entry_index += len(chunk)
+            else:
+                populate_table(slide, chunk[:1])
+                entry_index += 1
+        else:
+            # 1개 항목도 들어가지 않는 경우 (매우 긴 텍스트)
+            entry_index += 1
+
+        # 슬라이드 제목 설정
+        title_shape = slide.shapes.title
+        if title_shape is not None:
+            title_shape.text = title
+
+        # 빈 텍스트 박스 처리
+        for shape in slide.shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE and shape.has_text_frame:
+                if not shape.text.replace(" ", "").strip():
+                    shape.text_frame.clear()
+                    shape.text_frame.paragraphs[0].font.size = Pt(12)
+                    break
+
+        slide_index += 1
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,85 @@
+"""
+주간 리포트 내보내기 파일 구성
+개별 다운로드 뷰(export_weekly_report_pptx/excel)와 여러 리포트를 묶는 리포트 팩(report_pack)이
+같은 파일명/표 구성을 사용하도록 리포트 한 건의 PPTX 내용과 Excel 시트 구성을 만듭니다.
+"""
+import datetime
+from typing import Iterator, List, Sequence, Tuple
+
+from common.week_calendar import month_week_label
+from common.xlsx_export import XlsxColumn
+from reports.models import WeeklyReport
+
+from .pptx_export import build_weekly_report_pptx
+from .report_snapshot import EMPTY_NEXT_WEEK, EMPTY_THIS_WEEK, get_report_snapshot
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def _team_name(report: WeeklyReport) -> str:
+    return report.team.name if report.team else "전체"
+
+
+def weekly_report_pptx(report: WeeklyReport) -> Tuple[str, bytes]:
+    """리포트 PPTX 의 (파일명, 내용). 템플릿이 잘못된 경우 PptxTemplateError"""
+    # 작성자별 워크로그 (캐시된 리포트 스냅샷, PPTX용 정리 텍스트 포함)
+    entries = [
+        {
+            "author": entry.author_name,
+            "this_week": entry.this_week_pptx,
+            "next_week": entry.next_week_pptx,
+        }
+        for entry in get_report_snapshot(report).entries
+    ]
+
+    if not entries:
+        entries.append(
+            {
+                "author": "작성자 없음",
+                "this_week": EMPTY_THIS_WEEK,
+                "next_week": EMPTY_NEXT_WEEK,
+            }
+        )
+
+    month_week_display = getattr(report, "month_week_display", None) or month_week_label(report.year, report.week_number)
+    team_name = _team_name(report)
+
+    next_week_start = getattr(report, "next_week_start_date", None)
+    next_week_end = getattr(report, "next_week_end_date", None)
+    if not next_week_start or not next_week_end:
+        next_week_start = report.week_end_date + datetime.timedelta(days=3)
+        next_week_end = next_week_start + datetime.timedelta(days=4)
+
+    header_labels = [
+        "담당",
+        f"금주 실적 ({report.week_start_date:%m월 %d일} ~ {report.week_end_date:%m월 %d일})",
+        f"차주 계획 ({next_week_start:%m월 %d일} ~ {next_week_end:%m월 %d일})",
+    ]
+
+    content = build_weekly_report_pptx(entries, f"{month_week_display} {team_name} 주간보고", header_labels)
+    return f"{team_name}_주간보고_{month_week_display}.pptx", content
+
+
+def weekly_report_xlsx(report: WeeklyReport) -> Tuple[str, str, List[XlsxColumn], Iterator[Sequence]]:
+    """리포트 Excel 의 (파일명, 시트 이름, 컬럼, 행). write_xlsx/xlsx_response 에 그대로 전달합니다."""
+    # 작성자별 워크로그 (캐시된 리포트 스냅샷, 표시 이름 기준)
+    entry_by_author = {}
+    for entry in get_report_snapshot(report).entries:
+        entry_by_author[entry.display_name] = entry
+
+    columns = [
+        XlsxColumn("담당자", 15),
+        XlsxColumn(f"금주 실적 ({report.week_start_date.strftime('%m월 %d일')} ~ {report.week_end_date.strftime('%m월 %d일')})", 50),
+        XlsxColumn(f"차주 계획 ({report.next_week_start_date.strftime('%m월 %d일')} ~ {report.next_week_end_date.strftime('%m월 %d일')})", 50),
+    ]
+    # 마크다운 텍스트를 일반 텍스트로 변환한 값 (스냅샷에서 미리 계산)
+    rows = (
+        (author_name, entry.this_week_plain, entry.next_week_plain)
+        for author_name, entry in entry_by_author.items()
+    )
+
+    # 팀명과 월/주차 정보로 파일명 생성
+    month = report.week_start_date.month
+    week_in_month = ((report.week_start_date.day - 1) // 7) + 1
+    filename = f"{_team_name(report)}_주간보고서_{month}월_{week_in_month}주차.xlsx"
+    return filename, f"{report.year}년 {report.week_number}주차 주간보고서", columns, rows
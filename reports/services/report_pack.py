@@ -0,0 +1,151 @@
+"""
+주간 리포트 팩 (여러 주차·팀의 리포트를 하나의 ZIP 으로 내보내기)
+리포트별 PPTX/Excel 생성은 서로 독립적이므로 workers > 1 이면 프로세스 풀에서 병렬로 만들고,
+완성된 파일은 부모 프로세스에서 도착 순서대로 ZIP 에 기록합니다. (메모리에는 처리 중인 리포트 파일만 유지)
+배치 작업(export_report_pack 커맨드)으로 실행되며, 결과 파일 경로는 인자만으로 정해집니다.
+"""
+import datetime
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+
+from common.xlsx_export import write_xlsx
+from reports.models import WeeklyReport
+
+from .report_files import weekly_report_pptx, weekly_report_xlsx
+
+FORMATS = ('pptx', 'xlsx')
+PACK_DIR = 'report_packs'
+
+Week = Tuple[int, int]  # (ISO 연도, 주차)
+
+
+def parse_week(value: str) -> Week:
+    """'2024-10' 또는 '2024-W10' 형식의 ISO 주차를 (연도, 주차) 로 변환합니다."""
+    try:
+        year_str, week_str = str(value).split('-', 1)
+        year, week = int(year_str), int(week_str.upper().lstrip('W'))
+        datetime.date.fromisocalendar(year, week, 1)
+    except (TypeError, ValueError):
+        raise ValueError(f"잘못된 주차 형식입니다: {value} (예: 2024-10)")
+    return year, week
+
+
+def pack_reports(start: Week, end: Week, team_id: Optional[int] = None):
+    """기간(시작/종료 주차 포함) 안의 주간 리포트. 팀을 지정하지 않으면 모든 팀"""
+    (start_year, start_week), (end_year, end_week) = start, end
+    reports = WeeklyReport.objects.filter(
+        Q(year__gt=start_year) | Q(year=start_year, week_number__gte=start_week),
+        Q(year__lt=end_year) | Q(year=end_year, week_number__lte=end_week),
+    )
+    if team_id:
+        reports = reports.filter(team_id=team_id)
+    return reports.select_related('team').order_by('year', 'week_number', 'team__name', 'pk')
+
+
+def report_pack_path(start: Week, end: Week, team_id: Optional[int] = None, formats: Sequence[str] = FORMATS) -> Path:
+    """인자로 정해지는 결과 ZIP 경로 (같은 조건으로 다시 실행하면 덮어씀)"""
+    name = (
+        f"report_pack_{team_id or 'all'}_{start[0]}W{start[1]:02d}_{end[0]}W{end[1]:02d}_"
+        f"{'-'.join(sorted(formats))}.zip"
+    )
+    return Path(settings.MEDIA_ROOT) / PACK_DIR / name
+
+
+def render_report_files(report_id: int, formats: Sequence[str] = FORMATS) -> List[Tuple[str, bytes]]:
+    """리포트 한 건의 (ZIP 내부 경로, 파일 내용) 목록. 프로세스 풀에서 실행되므로 모듈 최상위 함수로 둡니다."""
+    report = WeeklyReport.objects.select_related('team').get(pk=report_id)
+    folder = f"{report.year}-W{report.week_number:02d}"
+    files = []
+    if 'pptx' in formats:
+        filename, content = weekly_report_pptx(report)
+        files.append((f"{folder}/{filename}", content))
+    if 'xlsx' in formats:
+        filename, sheet_title, columns, rows = weekly_report_xlsx(report)
+        buffer = io.BytesIO()
+        write_xlsx(buffer, sheet_title, columns, rows)
+        files.append((f"{folder}/{filename}", buffer.getvalue()))
+    return files
+
+
+def _init_worker():
+    # spawn 방식으로 시작된 워커는 Django 설정이 되어 있지 않으므로 초기화 (fork 방식이면 이미 준비됨)
+    import django
+
+    django.setup()
+
+
+def _iter_rendered(report_ids: Sequence[int], formats: Sequence[str], workers: int):
+    if workers <= 1 or len(report_ids) <= 1:
+        for report_id in report_ids:
+            yield render_report_files(report_id, formats)
+        return
+
+    # 부모 프로세스의 DB 연결을 자식 프로세스와 공유하지 않도록 닫은 뒤 풀 생성
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(render_report_files, report_id, formats) for report_id in report_ids]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def build_report_pack(
+    report_ids: Iterable[int],
+    output_path: Path,
+    formats: Sequence[str] = FORMATS,
+    workers: int = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    리포트들을 ZIP 으로 묶어 output_path 에 저장하고 포함된 파일 수를 반환합니다.
+    임시 파일에 기록한 뒤 완료 시 교체하므로, 중간에 실패·취소되어도 이전 결과 파일이 깨지지 않습니다.
+    progress(처리 건수, 전체 건수) 는 리포트 한 건이 끝날 때마다 호출됩니다.
+    """
+    report_ids = list(report_ids)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.part')
+
+    file_count = 0
+    try:
+        # PPTX/XLSX 는 이미 압축된 형식이라 ZIP_STORED 로 CPU 사용을 줄임
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_STORED) as archive:
+            if progress:
+                progress(0, len(report_ids))
+            used_names = set()
+            for done, files in enumerate(_iter_rendered(report_ids, formats, workers), start=1):
+                for arcname, content in files:
+                    arcname = _unique_name(arcname, used_names)
+                    archive.writestr(arcname, content)
+                    file_count += 1
+                if progress:
+                    progress(done, len(report_ids))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    return file_count
+
+
+def _unique_name(arcname: str, used_names: set) -> str:
+    # 같은 주차에 팀 없는(전체) 리포트 등으로 파일명이 겹치는 경우 번호를 붙임
+    candidate = arcname
+    stem, dot, ext = arcname.rpartition('.')
+    index = 2
+    while candidate in used_names:
+        candidate = f"{stem}_{index}{dot}{ext}"
+        index += 1
+    used_names.add(candidate)
+    return candidate
@@ -0,0 +1,137 @@
+"""
+주간 리포트 스냅샷
+상세 화면, PPTX/Excel 내보내기, 작성자별 팝업이 공통으로 사용하는 작성자별 워크로그 목록을 한 번 만들어
+(리포트, 워크로그 최종 수정일시) 단위로 캐시합니다. 마크다운 정리/변환 결과도 미리 계산해 둡니다.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from accounts.models import prefetch_team_memberships
+from common.text_normalize import markdown_to_plain_text, markdown_to_pptx_text
+from reports.models import WeeklyReport
+from templates.templatetags.markdown_extras import markdown_format
+from worklog.models import Worklog
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'reports:snapshot:{report_id}:{version}'
+EMPTY_THIS_WEEK = "작성된 내용이 없습니다."
+EMPTY_NEXT_WEEK = "작성된 계획이 없습니다."
+
+
+@dataclass
+class ReportEntry:
+    """작성자 한 명의 워크로그와 화면/내보내기용으로 미리 가공한 값"""
+    author: User
+    worklog: Worklog
+    author_name: str  # 한국식 성이름
+    display_name: str  # 이름(직급)
+    meta_text: str  # 직급 / 소속 팀
+    this_week_html: str  # 상세 화면용 마크다운 변환 결과
+    next_week_html: str
+    this_week_pptx: str  # PPTX용 정리 텍스트 (bold 유지)
+    next_week_pptx: str
+    this_week_plain: str  # Excel용 일반 텍스트
+    next_week_plain: str
+
+    @property
+    def author_id(self):
+        return self.worklog.author_id
+
+
+@dataclass
+class ReportSnapshot:
+    report_id: int
+    version: str
+    entries: List[ReportEntry] = field(default_factory=list)
+
+    @property
+    def worklogs(self) -> List[Worklog]:
+        return [entry.worklog for entry in self.entries]
+
+
+def report_worklogs(report: WeeklyReport):
+    """리포트 대상 워크로그. 팀이 지정된 경우 해당 팀 멤버의 워크로그만, 아니면 전체"""
+    worklogs = Worklog.objects.filter(year=report.year, week_number=report.week_number)
+    if report.team_id:
+        worklogs = worklogs.filter(author__in=report.team.members.all())
+    return worklogs.select_related('author', 'author__profile').order_by(
+        'display_order', 'author__profile__last_name_ko', 'author__username'
+    )
+
+
+def _snapshot_version(report: WeeklyReport) -> str:
+    """워크로그/작성자 프로필이 수정되거나 워크로그가 추가·삭제되면 바뀌는 버전 문자열"""
+    stats = report_worklogs(report).order_by().aggregate(
+        count=Count('pk'),
+        worklog_updated=Max('updated_at'),
+        profile_updated=Max('author__profile__updated_at'),
+    )
+    parts: Tuple[Optional[str], ...] = (
+        str(stats['count']),
+        stats['worklog_updated'].isoformat() if stats['worklog_updated'] else '',
+        stats['profile_updated'].isoformat() if stats['profile_updated'] else '',
+    )
+    return '|'.join(parts)
+
+
+def build_report_snapshot(report: WeeklyReport, version: str = '') -> ReportSnapshot:
+    worklogs = list(report_worklogs(report))
+    # 소속 팀(meta_text)을 작성자별로 조회하지 않도록 한 번에 조회
+    prefetch_team_memberships([worklog.author for worklog in worklogs])
+
+    snapshot = ReportSnapshot(report_id=report.pk, version=version)
+    for worklog in worklogs:
+        author = worklog.author
+        profile = getattr(author, 'profile', None)
+        meta_parts = []
+        if profile and profile.position:
+            meta_parts.append(profile.position)
+        if profile:
+            meta_parts.append(profile.department_display)
+
+        snapshot.entries.append(ReportEntry(
+            author=author,
+            worklog=worklog,
+            author_name=profile.get_korean_name if profile else author.username,
+            display_name=profile.display_name if profile else author.username,
+            meta_text=" / ".join(meta_parts),
+            this_week_html=markdown_format(worklog.this_week_work),
+            next_week_html=markdown_format(worklog.next_week_plan),
+            this_week_pptx=markdown_to_pptx_text(worklog.this_week_work) if worklog.this_week_work else EMPTY_THIS_WEEK,
+            next_week_pptx=markdown_to_pptx_text(worklog.next_week_plan) if worklog.next_week_plan else EMPTY_NEXT_WEEK,
+            this_week_plain=markdown_to_plain_text(worklog.this_week_work) if worklog.this_week_work else EMPTY_THIS_WEEK,
+            next_week_plain=markdown_to_plain_text(worklog.next_week_plan) if worklog.next_week_plan else EMPTY_NEXT_WEEK,
+        ))
+    return snapshot
+
+
+def get_report_snapshot(report: WeeklyReport, use_cache: bool = True) -> ReportSnapshot:
+    """
+    캐시된 리포트 스냅샷을 반환하고, 없으면 만들어 저장합니다.
+    캐시 키에 워크로그 수와 최종 수정일시가 포함되므로 워크로그가 바뀌면 자동으로 새로 만들어집니다.
+    (팀 소속 변경은 REPORT_SNAPSHOT_TTL 이 지나면 반영)
+    """
+    version = _snapshot_version(report)
+    key = CACHE_KEY.format(report_id=report.pk, version=version)
+    if use_cache:
+        try:
+            snapshot = cache.get(key)
+        except Exception as e:
+            logger.warning("Report snapshot cache read failed: %s", e)
+            snapshot = None
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = build_report_snapshot(report, version)
+    try:
+        cache.set(key, snapshot, timeout=getattr(settings, 'REPORT_SNAPSHOT_TTL', 60 * 60))
+    except Exception as e:
+        logger.warning("Report snapshot cache write failed: %s", e)
+    return snapshot
@@ -5,10 +5,10 @@ import datetime
 from django.conf import settings
 from django.db.models import Q
 from django.contrib.auth.models import User
-from django.utils.html import strip_tags
 from worklog.models import Worklog
 from reports.models import ReportReview, TeamPerformanceAnalysis, WeeklyReport
 from teams.models import Team
+from common.text_normalize import html_to_text
 from common.gemini_utils import (
     get_gemini_client,
     get_gemini_generation_config,
@@ -39,8 +39,13 @@ class TeamPerformanceAnalyzer:
         if not self.client:
              raise ValueError("Failed to initialize Gemini client")
 
-    def analyze_last_4_weeks(self, anchor_year: Optional[int] = None, anchor_week: Optional[int] = None) -> Dict[str, Any]:
-        """최근 4주간의 데이터를 분석합니다."""
+    def analyze_last_4_weeks(
+        self,
+        anchor_year: Optional[int] = None,
+        anchor_week: Optional[int] = None,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """최근 4주간의 데이터를 분석합니다. force_refresh=True 이면 Gemini 응답 캐시를 사용하지 않습니다."""
         logger.info(f"Starting performance analysis for team: {self.team.name}")
         
         # 1. 데이터 수집
@@ -59,7 +64,9 @@ class TeamPerformanceAnalyzer:
                 client=self.client,
                 model=self.model_name, 
                 contents=prompt,
-                config=config
+                config=config,
+                force_refresh=force_refresh,
+                validate=self._is_parsable,
             )
             text = extract_gemini_text(response)
             if not text:
@@ -82,20 +89,6 @@ class TeamPerformanceAnalyzer:
         
         return analysis_json
 
-    def _clean_html(self, text: Optional[str]) -> str:
-        if not text:
-            return ""
-        import re
-        import html
-        # 줄바꿈 태그를 실제 개행문자로 변환
-        text = re.sub(r'<(?:br|/p|/div)>', '\n', text, flags=re.IGNORECASE)
-        # 나머지 태그 제거 및 HTML 엔티티 복원
-        text = strip_tags(text)
-        text = html.unescape(text)
-        # 가독성을 위해 연속된 개행은 하나로 줄임
-        text = re.sub(r'\n\s*\n+', '\n', text)
-        return text.strip()
-
     def _collect_data(self, anchor_year: Optional[int] = None, anchor_week: Optional[int] = None) -> Dict[str, Any]:
         """최근 4주 데이터를 수집합니다."""
         if anchor_year and anchor_week:
@@ -136,9 +129,9 @@ class TeamPerformanceAnalyzer:
                 
                 week_entry = {
                     "week": f"{week_info['year']}-W{week_info['week']}",
-                    "work_done": self._clean_html(worklog.this_week_work) if worklog else "작성 안 함",
-                    "next_plan": self._clean_html(worklog.next_week_plan) if worklog else "작성 안 함",
-                    "review_summary": self._clean_html(review['review_content'].get('summary')) if review and review.get('review_content') and review['review_content'].get('summary') else ""
+                    "work_done": html_to_text(worklog.this_week_work) if worklog else "작성 안 함",
+                    "next_plan": html_to_text(worklog.next_week_plan) if worklog else "작성 안 함",
+                    "review_summary": html_to_text(review['review_content'].get('summary')) if review and review.get('review_content') and review['review_content'].get('summary') else ""
                 }
                 weeks_data.append(week_entry)
             
@@ -156,6 +149,9 @@ class TeamPerformanceAnalyzer:
         import json
         
         member_json_str = json.dumps(data['member_data'], ensure_ascii=False, indent=2)
+        # 분석 기준일은 실행일이 아닌 기준 주차로 표기해 같은 주차 재분석 시 프롬프트가 동일하도록 함 (응답 캐시 적중)
+        anchor = data['weeks'][0]
+        anchor_monday = datetime.date.fromisocalendar(anchor['year'], anchor['week'], 1)
         
         prompt = f"""
 당신은 IT 프로젝트 매니저이자 인사 분석 전문가입니다.
@@ -173,7 +169,7 @@ class TeamPerformanceAnalyzer:
 반드시 다음 JSON 포맷으로만 응답하세요. 마크다운 코드 블록(```json)을 사용하지 마세요.
 
 {{
-    "analysis_period": "{datetime.date.today().strftime('%Y-%m-%d')} 기준 최근 4주",
+    "analysis_period": "{anchor_monday.strftime('%Y-%m-%d')} 기준 최근 4주",
     "team_summary": "팀 전체 종합 평가 및 특징 (3-4문장)",
     "member_analysis": [
         {{
@@ -194,6 +190,14 @@ class TeamPerformanceAnalyzer:
 """
         return prompt
 
+    def _is_parsable(self, text: str) -> bool:
+        """응답 캐시 저장 전 검증 (코드블록으로 감싼 JSON 도 허용)"""
+        try:
+            self._parse_response(text)
+        except ValueError:
+            return False
+        return True
+
     def _parse_response(self, text: str) -> Dict[str, Any]:
         import json
         import re
@@ -3,34 +3,25 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView, DetailView
 from django.contrib import messages
-from django.db.models import Q
 from django.core.paginator import Paginator
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, FileResponse
 from django.conf import settings
 from collections import defaultdict
-from copy import deepcopy
 import datetime
-import re
-from openpyxl import Workbook
-from pptx import Presentation
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from pptx.util import Pt
-from pptx.enum.text import MSO_VERTICAL_ANCHOR, MSO_AUTO_SIZE
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.dml.color import RGBColor
+import io
 from .models import WeeklyReport, WeeklyReportComment, WeeklyReportPersonalComment, ReportReview, TeamPerformanceAnalysis
 from mailing.text_formatter import format_review_content
 from worklog.models import Worklog
+from worklog.services import load_worklog_history, week_choices_json
 from teams.models import Team, TeamMembership
-from accounts.models import UserProfile
+from accounts.models import UserProfile, prefetch_team_memberships
 from django.contrib.auth.models import User
 from .forms import WeeklyReportCommentForm, WeeklyReportPersonalCommentForm
-import html
-from django.utils.html import strip_tags
+from .services.report_snapshot import get_report_snapshot
+from .services.pptx_export import PptxTemplateError
+from .services.report_files import PPTX_CONTENT_TYPE, weekly_report_pptx, weekly_report_xlsx
+from common.xlsx_export import xlsx_response
 from django.template.loader import render_to_string
-from copy import deepcopy
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
 class WeeklyReportListView(LoginRequiredMixin, ListView, ):
     model = WeeklyReport
@@ -45,28 +36,9 @@ class WeeklyReportListView(LoginRequiredMixin, ListView, ):
 def weekly_report_detail(request, id):
     """주간 리포트 상세 보기"""
     report = get_object_or_404(WeeklyReport, id=id)
-    
-    
-    # 팀이 지정된 경우 해당 팀의 워크로그만, 아니면 전체
-    if report.team:
-        team = get_object_or_404(Team, id=report.team.id)
-        # 팀 멤버들의 워크로그만 가져오기
-        team_members = team.members.all()
-        worklogs = Worklog.objects.filter(
-            year=report.year, 
-            week_number=report.week_number,
-            author__in=team_members
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-        
+    # 작성자별 워크로그 (캐시된 리포트 스냅샷)
+    snapshot = get_report_snapshot(report)
 
-    else:
-        # 전체 워크로그
-        worklogs = Worklog.objects.filter(
-            year=report.year, 
-            week_number=report.week_number
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-
-    
     # 댓글 처리
     if request.method == 'POST':
         form = WeeklyReportCommentForm(request.POST)
@@ -99,17 +71,16 @@ def weekly_report_detail(request, id):
     ).values_list('user', flat=True))
 
     worklog_entries = []
-    for worklog in worklogs:
-        author_profile = getattr(worklog.author, 'profile', None)
-        author_name = author_profile.get_korean_name if author_profile else worklog.author.username
-
+    for entry in snapshot.entries:
         worklog_entries.append({
-            'author': worklog.author,
-            'author_id': worklog.author_id,
-            'author_name': author_name,
-            'worklog': worklog,
-            'personal_comments': comments_by_user.get(worklog.author_id, []),
-            'has_ai_review': worklog.author_id in review_user_ids,
+            'author': entry.author,
+            'author_id': entry.author_id,
+            'author_name': entry.author_name,
+            'worklog': entry.worklog,
+            'this_week_html': entry.this_week_html,
+            'next_week_html': entry.next_week_html,
+            'personal_comments': comments_by_user.get(entry.author_id, []),
+            'has_ai_review': entry.author_id in review_user_ids,
         })
 
     user_role = None
@@ -120,7 +91,7 @@ def weekly_report_detail(request, id):
 
     context = {
         'report': report,
-        'worklogs': worklogs,
+        'worklogs': snapshot.worklogs,
         'worklog_entries': worklog_entries,
         'worklog_count': len(worklog_entries),
         'form': form,
@@ -187,7 +158,37 @@ def add_personal_comment(request, report_id):
         'target_user_id': target_user_id,
     })
 
-@login_required
+def group_worklogs_by_team(worklogs):
+    """
+    워크로그를 작성자의 소속 팀별로 그룹화합니다. 여러 팀에 속한 작성자는 각 팀에 모두 포함됩니다.
+    작성자 프로필은 select_related, 팀 소속은 prefetch_team_memberships 로 한 번에 조회하므로
+    작성자 수와 무관하게 쿼리 수가 고정됩니다.
+    """
+    worklogs = list(worklogs)
+    prefetch_team_memberships([worklog.author for worklog in worklogs])
+    role_display = dict(TeamMembership.ROLE_CHOICES)
+
+    team_summary = defaultdict(list)
+    for worklog in worklogs:
+        profile = getattr(worklog.author, 'profile', None)
+        author_name = profile.get_korean_name if profile else worklog.author.username
+        memberships = profile.get_team_memberships() if profile else []
+
+        if memberships:
+            for membership in memberships:
+                team_summary[membership.team.name].append({
+                    'author': author_name,
+                    'worklog': worklog,
+                    'role': role_display.get(membership.role, membership.role)
+                })
+        else:
+            team_summary['미분류'].append({
+                'author': author_name,
+                'worklog': worklog,
+                'role': '일반'
+            })
+    return dict(team_summary)
+
 
 @login_required
 def team_worklog_summary(request):
@@ -211,40 +212,17 @@ def team_worklog_summary(request):
             year=year, 
             week_number=week_number,
             author__in=team_members
-        ).select_related('author')
+        ).select_related('author', 'author__profile')
         selected_team = team
     else:
         worklogs = Worklog.objects.filter(
             year=year, 
             week_number=week_number
-        ).select_related('author')
+        ).select_related('author', 'author__profile')
         selected_team = None
     
     # 팀별로 그룹화 (실제 팀 멤버십 기준)
-    team_summary = defaultdict(list)
-    
-    for worklog in worklogs:
-        try:
-            author_name = worklog.author.profile.get_korean_name
-        except:
-            author_name = worklog.author.username
-        
-        # 사용자의 팀 정보 가져오기
-        user_teams = TeamMembership.objects.filter(user=worklog.author).select_related('team')
-        
-        if user_teams.exists():
-            for membership in user_teams:
-                team_summary[membership.team.name].append({
-                    'author': author_name,
-                    'worklog': worklog,
-                    'role': membership.get_role_display()
-                })
-        else:
-            team_summary['미분류'].append({
-                'author': author_name,
-                'worklog': worklog,
-                'role': '일반'
-            })
+    team_summary = group_worklogs_by_team(worklogs)
     
     # 연도 및 주차 선택 옵션
     current_year = datetime.date.today().year
@@ -257,7 +235,7 @@ def team_worklog_summary(request):
     context = {
         'year': year,
         'week_number': week_number,
-        'team_summary': dict(team_summary),
+        'team_summary': team_summary,
         'week_start': datetime.date.fromisocalendar(year, week_number, 1),
         'week_end': datetime.date.fromisocalendar(year, week_number, 1) + datetime.timedelta(days=6),
         'year_choices': year_choices,
@@ -273,36 +251,17 @@ def worklog_summary_popup(request, year, week_number):
     """작성자별 워크로그 집계 팝업"""
     team_id = request.GET.get('team')
     
-    # 팀이 지정된 경우 해당 팀의 워크로그만, 아니면 전체
+    # 팀이 지정된 경우 해당 팀의 리포트, 아니면 전체 리포트
     if team_id:
         team = get_object_or_404(Team, id=team_id)
-        # 팀 멤버들의 워크로그만 가져오기
-        team_members = team.members.all()
-        worklogs = Worklog.objects.filter(
-            year=year, 
-            week_number=week_number,
-            author__in=team_members
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-        
         report = get_object_or_404(WeeklyReport, year=year, week_number=week_number, team=team)
     else:
-        # 전체 워크로그
-        worklogs = Worklog.objects.filter(
-            year=year, 
-            week_number=week_number
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
         report = get_object_or_404(WeeklyReport, year=year, week_number=week_number, team=None)
     
-    # 작성자별 워크로그 그룹화
-    worklog_by_author = {}
-    for worklog in worklogs:
-        # UserProfile이 있으면 한국식 이름 사용, 없으면 username 사용
-        try:
-            author_name = worklog.author.profile.get_korean_name
-        except:
-            author_name = worklog.author.username
-        
-        worklog_by_author[author_name] = worklog
+    # 작성자별 워크로그 그룹화 (한국식 이름 기준)
+    worklog_by_author = {
+        entry.author_name: entry.worklog for entry in get_report_snapshot(report).entries
+    }
     
     context = {
         'report': report,
@@ -332,99 +291,7 @@ def confirm_closing_api(request):
 def export_weekly_report_excel(request, id):
     """주간 리포트 Excel 내보내기"""
     report = get_object_or_404(WeeklyReport, id=id)
-    
-    # 워크로그 데이터 가져오기
-    worklogs = Worklog.objects.filter(
-        year=report.year,
-        week_number=report.week_number,
-        author__teams=report.team
-    ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-    
-    worklog_by_author = {}
-    for worklog in worklogs:
-        author_name = worklog.author.profile.display_name if worklog.author.profile else worklog.author.username
-        worklog_by_author[author_name] = worklog
-    
-    # Excel 워크북 생성
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"{report.year}년 {report.week_number}주차 주간보고서"
-    
-    # 스타일 정의
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 헤더 작성
-    ws['A1'] = "담당자"
-    ws['B1'] = f"금주 실적 ({report.week_start_date.strftime('%m월 %d일')} ~ {report.week_end_date.strftime('%m월 %d일')})"
-    ws['C1'] = f"차주 계획 ({report.next_week_start_date.strftime('%m월 %d일')} ~ {report.next_week_end_date.strftime('%m월 %d일')})"
-    
-    # 헤더 스타일 적용
-    for col in ['A1', 'B1', 'C1']:
-        ws[col].font = header_font
-        ws[col].fill = header_fill
-        ws[col].alignment = Alignment(horizontal='center', vertical='center')
-        ws[col].border = border
-    
-    # 컬럼 너비 설정
-    ws.column_dimensions['A'].width = 15
-    ws.column_dimensions['B'].width = 50
-    ws.column_dimensions['C'].width = 50
-    
-    # 데이터 작성
-    row = 2
-    for author_name, worklog in worklog_by_author.items():
-        ws[f'A{row}'] = author_name
-        
-        # 마크다운 텍스트를 일반 텍스트로 변환
-        this_week_text = clean_markdown_text(worklog.this_week_work) if worklog.this_week_work else "작성된 내용이 없습니다."
-        next_week_text = clean_markdown_text(worklog.next_week_plan) if worklog.next_week_plan else "작성된 계획이 없습니다."
-        
-        ws[f'B{row}'] = this_week_text
-        ws[f'C{row}'] = next_week_text
-        
-        # 셀 스타일 적용
-        for col in ['A', 'B', 'C']:
-            cell = ws[f'{col}{row}']
-            cell.border = border
-            cell.alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-        
-        row += 1
-    
-    # Excel 파일을 메모리 버퍼에 저장
-    import io
-    from django.http import FileResponse
-    
-    buffer = io.BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    
-    # 팀명과 월/주차 정보로 파일명 생성
-    team_name = report.team.name if report.team else "전체"
-    month = report.week_start_date.month
-    week_in_month = ((report.week_start_date.day - 1) // 7) + 1
-    filename = f"{team_name}_주간보고서_{month}월_{week_in_month}주차.xlsx"
-    
-    response = FileResponse(
-        buffer,
-        as_attachment=True,
-        filename=filename,
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    return response
-
-
-
-
-
-
-    return response
+    return xlsx_response(*weekly_report_xlsx(report))
 
 
 @login_required
@@ -468,447 +335,18 @@ def get_ai_review_content(request, report_id, user_id):
 def export_weekly_report_pptx(request, id):
     """주간 리포트를 PowerPoint 파일로 내보냅니다."""
     report = get_object_or_404(WeeklyReport, id=id)
+    try:
+        filename, content = weekly_report_pptx(report)
+    except PptxTemplateError as e:
+        return HttpResponse(str(e), status=500)
 
-    # 팀이 지정된 경우 해당 팀의 워크로그만, 아니면 전체
-    if report.team:
-        team = get_object_or_404(Team, id=report.team.id)
-        # 팀 멤버들의 워크로그만 가져오기
-        team_members = team.members.all()
-        worklogs = Worklog.objects.filter(
-            year=report.year, 
-            week_number=report.week_number,
-            author__in=team_members
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-    else:
-        # 전체 워크로그
-        worklogs = Worklog.objects.filter(
-            year=report.year, 
-            week_number=report.week_number
-        ).select_related('author', 'author__profile').order_by('display_order', 'author__profile__last_name_ko', 'author__username')
-
-    entries = []
-    for worklog in worklogs:
-        profile = getattr(worklog.author, 'profile', None)
-        author_name = profile.get_korean_name if profile else worklog.author.username
-        meta_parts = []
-        if profile and getattr(profile, 'position', None):
-            meta_parts.append(profile.position)
-        if profile and getattr(profile, 'department_display', None):
-            meta_parts.append(profile.department_display)
-        meta_text = " / ".join(meta_parts)
-
-        this_week = clean_markdown_text_for_pptx(worklog.this_week_work) if worklog.this_week_work else "작성된 내용이 없습니다."
-        next_week = clean_markdown_text_for_pptx(worklog.next_week_plan) if worklog.next_week_plan else "작성된 계획이 없습니다."
-
-        entries.append(
-            {
-                "author": author_name,
-                "this_week": this_week,
-                "next_week": next_week,
-            }
-        )
-
-    if not entries:
-        entries.append(
-            {
-                "author": "작성자 없음",
-                "this_week": "작성된 내용이 없습니다.",
-                "next_week": "작성된 계획이 없습니다.",
-            }
-        )
-
-    month_week_display = getattr(report, "month_week_display", None)
-    if not month_week_display:
-        week_in_month = ((report.week_start_date.day - 1) // 7) + 1
-        month_week_display = f"{report.week_start_date.month}월 {week_in_month}주차"
-    team_name = report.team.name if report.team else "전체"
-
-    template_path = settings.BASE_DIR / "reports/files/templates.pptfile"
-    prs = Presentation(str(template_path))
-    base_slide = prs.slides[0]
-
-    def get_table(target_slide):
-        for shape in target_slide.shapes:
-            if shape.has_table:
-                return shape.table
-        return None
-
-    base_table = get_table(base_slide)
-    if base_table is None:
-        return HttpResponse("템플릿에 표가 없습니다.", status=500)
-
-    if len(base_table.rows) < 2:
-        return HttpResponse("템플릿에 데이터 행이 필요합니다.", status=500)
-
-    template_row_xml = deepcopy(base_table._tbl.tr_lst[1])
-    capacity = max(len(base_table.rows) - 1, 1)
-
-    template_shapes_xml = [deepcopy(shape._element) for shape in base_slide.shapes]
-    template_relationships = []
-    for r_id, rel in base_slide.part.rels.items():  # (rId, rel) 튜플
-        if rel.reltype == RT.SLIDE_LAYOUT:
-            continue
-        # 발표자 노트는 복사하지 않는 편이 안전
-        if "notesSlide" in str(rel.reltype):
-            continue
-        if getattr(rel, "is_external", False):
-            template_relationships.append((rel.reltype, rel.target_ref, True))   # URL 문자열
-        else:
-            template_relationships.append((rel.reltype, rel.target_part, False)) # 내부 파트
-
-    next_week_start = getattr(report, "next_week_start_date", None)
-    next_week_end = getattr(report, "next_week_end_date", None)
-    if not next_week_start or not next_week_end:
-        next_week_start = report.week_end_date + datetime.timedelta(days=3)
-        next_week_end = next_week_start + datetime.timedelta(days=4)
-
-    header_labels = [
-        "담당",
-        f"금주 실적 ({report.week_start_date:%m월 %d일} ~ {report.week_end_date:%m월 %d일})",
-        f"차주 계획 ({next_week_start:%m월 %d일} ~ {next_week_end:%m월 %d일})",
-    ]
-
-    def clone_template_slide():
-        new_slide = prs.slides.add_slide(base_slide.slide_layout)
-
-        # 기본 placeholder 제거
-        for shape in list(new_slide.shapes):
-            sp = shape._element
-            sp.getparent().remove(sp)
-
-        # 레이아웃 외 관계 제거
-        for r_id, rel in list(new_slide.part.rels.items()):
-            if rel.reltype != RT.SLIDE_LAYOUT:
-                del new_slide.part.rels[r_id]
-
-        # 도형 XML 복사
-        for shape_xml in template_shapes_xml:
-            new_slide.shapes._spTree.insert_element_before(deepcopy(shape_xml), "p:extLst")
-
-        # 관계 복사 (_add_relationship 사용, rId는 라이브러리에 맡김)
-        for reltype, target, is_external in template_relationships:
-            if hasattr(new_slide.part.rels, "_add_relationship"):
-                new_slide.part.rels._add_relationship(reltype, target, is_external)
-            else:
-                # 0.6.19 이하 하위호환 (rId 없이 호출)
-                new_slide.part.rels.add_relationship(reltype, target)
-
-        return new_slide
-        
-    def fit_cell_text(cell, text, *, max_size=11, min_size=9, bold=False, font_color=None):
-        """표 셀 텍스트를 자동 축소하여 맞춤 - bold 마크다운 처리"""
-        tf = cell.text_frame
-        tf.clear()
-        tf.word_wrap = True
-        tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-        
-        p = tf.paragraphs[0]
-        p.line_spacing = 1.2  # 줄간격 1.2배수로 설정
-        p.space_after = Pt(0)
-        
-        if not text:
-            text = ""
-        
-        # **bold** 마크다운 처리
-        parts = re.split(r'(\*\*.*?\*\*)', text)
-        
-        for part in parts:
-            if part.startswith('**') and part.endswith('**'):
-                # bold 텍스트
-                bold_text = part[2:-2]  # ** 제거
-                run = p.add_run()
-                run.text = bold_text
-                run.font.bold = True
-                run.font.size = Pt(max_size)
-                if font_color:
-                    run.font.color.rgb = font_color
-            elif part:
-                # 일반 텍스트
-                run = p.add_run()
-                run.text = part
-                run.font.bold = bold
-                run.font.size = Pt(max_size)
-                if font_color:
-                    run.font.color.rgb = font_color
-        
-        # 줄 수 계산
-        lines = max((text or "").count("\n") + 1, 1)
-        return lines
-
-    def tighten_cell_layout(cell):
-        """표 셀 여백과 줄간격을 최소화"""
-        # 표 셀 여백 최소화
-        cell.margin_left = Pt(4)   # 너무 작으면 텍스트가 잘림
-        cell.margin_right = Pt(4)
-        cell.margin_top = Pt(3)
-        cell.margin_bottom = Pt(3)
-
-    def set_cell_text(cell, text, *, bold=False, max_size=11, min_size=9):
-        """개선된 셀 텍스트 설정"""
-        tighten_cell_layout(cell)
-        lines = fit_cell_text(cell, text, max_size=max_size, min_size=min_size, bold=bold)
-        cell.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-        return lines
-
-    def optimize_table_layout(table):
-        """표 레이아웃 최적화 - 컬럼 너비 재분배 및 가운데 정렬"""
-        if not table or len(table.columns) < 3:
-            return
-            
-        # 슬라이드 너비 기준으로 표 너비 설정 (95% 사용하여 좌우 여백 최소화 및 균형 확보)
-        slide_width = prs.slide_width
-        table_width = int(slide_width * 0.95)
-        
-        # 최적 비율: 담당(10%) : 금주실적(45%) : 차주계획(45%)
-        ratios = [0.1, 0.45, 0.45]
-        
-        # 각 컬럼에 절대 너비 적용
-        for i, ratio in enumerate(ratios):
-            if i < len(table.columns):
-                table.columns[i].width = int(table_width * ratio)
-
-    def populate_table(target_slide, chunk):
-        """개선된 표 채우기 함수"""
-        table = get_table(target_slide)
-        if table is None:
-            return False
-            
-        # 표 레이아웃 최적화
-        optimize_table_layout(table)
-        
-        # 표를 가운데 정렬
-        for shape in target_slide.shapes:
-            if shape.has_table:
-                slide_width = prs.slide_width
-                table_width = sum(col.width for col in shape.table.columns)
-                # 가운데 정렬을 위한 left 위치 계산
-                shape.left = (slide_width - table_width) // 2
-                break
-            
-        # 기존 행 제거 (헤더 제외)
-        while len(table.rows) > 1:
-            table._tbl.remove(table._tbl.tr_lst[-1])
-            
-        # 새 행 추가
-        for _ in chunk:
-            table._tbl.append(deepcopy(template_row_xml))
-            
-        # 헤더 설정 (3개 컬럼만 사용)
-        header_row = table.rows[0]
-        for i, label in enumerate(header_labels):
-            if i < len(header_row.cells):
-                tighten_cell_layout(header_row.cells[i])
-                fit_cell_text(header_row.cells[i], label, max_size=12, min_size=12, bold=True, font_color=RGBColor(255, 255, 255))
-        
-        # 4번째 컬럼이 있다면 숨기기
-        if len(header_row.cells) > 3:
-            header_row.cells[3].text = ""
-            
-        table.rows[0].height = Pt(38)
-        
-        # 본문 데이터 설정 및 높이 계산
-        total_height = table.rows[0].height.pt
-        # 슬라이드 실제 높이에 맞게 최대 높이 설정 (약 75% 수준)
-        slide_height_pt = prs.slide_height / 12700
-        slide_body_max = slide_height_pt * 0.75
-        
-        for row_idx, entry in enumerate(chunk, start=1):
-            if row_idx >= len(table.rows):
-                break
-                
-            row = table.rows[row_idx]
-            
-            # 각 셀 텍스트 설정 및 줄 수 계산 (3개 컬럼만 사용)
-            l1 = set_cell_text(row.cells[0], entry["author"], bold=True, max_size=13, min_size=9)
-            l2 = set_cell_text(row.cells[1], entry["this_week"], max_size=10, min_size=10)  # 금주실적을 2번째 컬럼에
-            l3 = set_cell_text(row.cells[2], entry["next_week"], max_size=10, min_size=10)  # 차주계획을 3번째 컬럼에
-            
-            # 4번째 컬럼이 있다면 비우기
-            if len(row.cells) > 3:
-                row.cells[3].text = ""
-            
-            # 행 높이 계산 (최대 줄 수 기준)
-            max_lines = max(l1, l2, l3)
-            row_height_pt = 24 + (max_lines - 1) * 12  # 기본 높이와 줄간격 최적화
-            row.height = Pt(row_height_pt)
-            total_height += row_height_pt
-            
-            # 슬라이드 높이 초과 검사 (단, 최소 1개의 행은 보장)
-            if total_height > slide_body_max and row_idx > 1:
-                # 현재 행 제거하고 분할 필요 표시
-                table._tbl.remove(table._tbl.tr_lst[-1])
-                return False  # 분할 필요
-                
-        return True  # 성공적으로 완료
-
-    # 동적 슬라이드 분할 처리
-    template_slide = base_slide
-    slide_index = 0
-    entry_index = 0
-    
-    while entry_index < len(entries):
-        # 현재 슬라이드 준비
-        slide = template_slide if slide_index == 0 else clone_template_slide()
-        
-        # 남은 항목들로 청크 생성 (최대 capacity개)
-        remaining_entries = entries[entry_index:]
-        chunk = remaining_entries[:capacity]
-        
-        # 표 채우기 시도
-        success = populate_table(slide, chunk)
-        
-        if success:
-            # 성공: 전체 청크 처리 완료
-            entry_index += len(chunk)
-        else:
-            # 실패: 청크 크기를 줄여서 재시도
-            if len(chunk) > 1:
-                # 절반으로 줄여서 재시도
-                chunk = chunk[:len(chunk)//2]
-                success = populate_table(slide, chunk)
-                if success:
-                    entry_index += len(chunk)
-                else:
-                    # 1개씩이라도 처리
-                    chunk = chunk[:1]
-                    populate_table(slide, chunk)
-                    entry_index += 1
-            else:
-                # 1개 항목도 들어가지 않는 경우 (매우 긴 텍스트)
-                entry_index += 1
-        
-        # 슬라이드 제목 설정
-        title_shape = slide.shapes.title
-        if title_shape is not None:
-            title_shape.text = f"{month_week_display} {team_name} 주간보고"
-        
-        # 빈 텍스트 박스 처리
-        for shape in slide.shapes:
-            if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE and shape.has_text_frame:
-                existing = shape.text.replace(" ", "").strip()
-                if not existing:
-                    text_frame = shape.text_frame
-                    text_frame.clear()
-                    paragraph = text_frame.paragraphs[0]
-                    paragraph.font.size = Pt(12)
-                    break
-        
-        slide_index += 1
-
-    # PPTX 파일을 메모리 버퍼에 저장
-    import io
-    from django.http import FileResponse
-    
-    buffer = io.BytesIO()
-    prs.save(buffer)
-    buffer.seek(0)
-    
-    filename = f"{team_name}_주간보고_{month_week_display}.pptx"
-    
-    response = FileResponse(
-        buffer,
+    return FileResponse(
+        io.BytesIO(content),
         as_attachment=True,
         filename=filename,
-        content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        content_type=PPTX_CONTENT_TYPE
     )
-    return response
-
 
-def clean_markdown_text_for_pptx(text):
-    """PPTX용 텍스트 정리 - 원본 형태 최대한 유지, bold 처리 포함"""
-    if not text:
-        return ""
-
-    # HTML 태그 처리 (bold는 유지)
-    text = text.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    text = re.sub(r'</p\s*>', '\n', text, flags=re.IGNORECASE)
-    
-    # strong/b 태그를 **로 변환하여 유지
-    text = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-    
-    # font-weight 스타일 처리 (bolder, bold, 700 등)
-    text = re.sub(r'<span[^>]*style="[^"]*font-weight:\s*(?:bolder|bold|700)[^"]*"[^>]*>(.*?)</span>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'<span[^>]*style=\'[^\']*font-weight:\s*(?:bolder|bold|700)[^\']*\'[^>]*>(.*?)</span>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-    
-    # 나머지 HTML 태그 제거
-    text = strip_tags(text)
-    text = html.unescape(text)
-    
-    # 기본적인 마크다운만 제거 (** bold는 유지)
-    text = re.sub(r'#{1,6}\s*', '', text)
-    text = re.sub(r'`(.*?)`', r'\1', text)
-    
-    # 연속된 빈 줄만 정리
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    
-    return text.strip()
-
-def clean_markdown_text(text):
-    """마크다운 및 HTML 텍스트를 일반 텍스트로 변환하고 가독성 개선"""
-    if not text:
-        return ""
-
-    text = text.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    text = re.sub(r'</p\s*>', '\n', text, flags=re.IGNORECASE)
-
-    # HTML 태그 제거
-    text = strip_tags(text)
-    
-    # HTML 엔티티 디코딩
-    text = html.unescape(text)
-    
-    # 마크다운 문법 제거
-    text = re.sub(r'#{1,6}\s*', '', text)  # 헤더
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # 굵은 글씨
-    text = re.sub(r'\*(.*?)\*', r'\1', text)  # 기울임
-    text = re.sub(r'`(.*?)`', r'\1', text)  # 인라인 코드
-    
-    # 기존 블릿 기호 제거 (• - * + 등)
-    text = re.sub(r'^\s*[•\-\*\+]\s+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)  # 번호 리스트
-    
-    # 긴 문장을 글머리표로 분리 (가독성 개선)
-    lines = text.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # 긴 문장(80자 이상)이고 문장 구분자가 있는 경우 분리
-        if len(line) > 80 and any(sep in line for sep in ['. ', ', ', '; ']):
-            # 문장 구분자로 분리
-            parts = re.split(r'([.;,])\s+', line)
-            current_part = ""
-            
-            for i in range(0, len(parts), 2):
-                if i + 1 < len(parts):
-                    segment = parts[i] + parts[i + 1]
-                else:
-                    segment = parts[i]
-                
-                if len(current_part + segment) > 60 and current_part:
-                    processed_lines.append(f"• {current_part.strip()}")
-                    current_part = segment
-                else:
-                    current_part += segment
-            
-            if current_part.strip():
-                processed_lines.append(f"• {current_part.strip()}")
-        else:
-            processed_lines.append(f"• {line}")
-    
-    text = '\n'.join(processed_lines)
-    
-    # 연속된 공백과 줄바꿈 정리
-    text = re.sub(r'\n\s*\n', '\n', text)  # 빈 줄 제거
-    text = re.sub(r' +', ' ', text)  # 연속 공백 제거
-    
-    return text.strip()
-
-import json
 
 @login_required
 def personal_report_history(request):
@@ -940,60 +378,17 @@ def personal_report_history(request):
     current_year = datetime.date.today().year
     year_choices = list(range(current_year - 3, current_year + 1))
 
-    # 연도별 주차 정보 생성 (for JavaScript)
-    week_data = {}
-    for year in year_choices:
-        week_data[year] = []
-        for week_num in range(1, 54):
-            try:
-                week_start = datetime.date.fromisocalendar(year, week_num, 1)
-                # 주차의 마지막 날이 다음 해로 넘어가는 경우 방지
-                if week_start.year != year and week_num > 1:
-                    continue
-                week_end = week_start + datetime.timedelta(days=4)
-                display_text = f"{week_num}주차 ({week_start.strftime('%m.%d')}~{week_end.strftime('%m.%d')})"
-                week_data[year].append({'week': week_num, 'display': display_text})
-            except ValueError:
-                # 53주차가 없는 해 처리
-                break
-
     worklogs_data = []
     if selected_user_id:
-        # worklog 쿼리
-        worklogs = Worklog.objects.filter(
-            author_id=selected_user_id,
-        ).order_by('-year', '-week_number')
-
-        # 기간 필터링
-        worklogs = worklogs.filter(
-            Q(year__gt=int(start_year)) |
-            Q(year=int(start_year), week_number__gte=int(start_week))
-        )
-        worklogs = worklogs.filter(
-            Q(year__lt=int(end_year)) |
-            Q(year=int(end_year), week_number__lte=int(end_week))
+        # 기간 내 워크로그와 전주 계획 (쿼리 1회)
+        worklogs_data = load_worklog_history(
+            int(selected_user_id), (int(start_year), int(start_week)), (int(end_year), int(end_week))
         )
 
-        for log in worklogs:
-            # 전주 계획을 가져오기
-            prev_week_date = log.week_start_date - datetime.timedelta(days=7)
-            prev_year, prev_week, _ = prev_week_date.isocalendar()
-            
-            previous_worklog = Worklog.objects.filter(
-                author_id=selected_user_id,
-                year=prev_year,
-                week_number=prev_week
-            ).first()
-            
-            worklogs_data.append({
-                'worklog': log,
-                'previous_week_plan': previous_worklog.next_week_plan if previous_worklog else ''
-            })
-
     context = {
         'team_members': team_members,
         'year_choices': year_choices,
-        'week_data_json': json.dumps(week_data),
+        'week_data_json': week_choices_json(tuple(year_choices)),
         'selected_user_id': selected_user_id,
         'start_year': start_year,
         'start_week': start_week,
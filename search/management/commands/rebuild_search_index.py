@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from search.services import SEARCH_SOURCES, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = '통합 검색 인덱스(SearchDocument)를 원본 데이터로부터 전체 다시 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', action='append', choices=list(SEARCH_SOURCES), help='지정한 구분만 다시 생성 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        counts = rebuild_search_index(options['kind'])
+        for kind, count in counts.items():
+            self.stdout.write(f'{SEARCH_SOURCES[kind].label}: {count}건')
+        self.stdout.write(self.style.SUCCESS(f'검색 인덱스 {sum(counts.values())}건 재생성 완료'))
@@ -0,0 +1,138 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:53
+
+import html
+import re
+import unicodedata
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# search.services 의 마이그레이션 시점 사본 (토크나이저, FTS 테이블명, 구분별 원본 필드).
+# 이후 서비스 코드나 원본 모델이 바뀌어도 이 마이그레이션은 그대로 동작하도록 복사해 둡니다.
+FTS_TABLE = 'search_searchdocument_fts'
+BATCH_SIZE = 500
+
+_WORD = re.compile(r'[^\W_]+')
+_HTML_BREAK = re.compile(r'<(?:br|/p|/div)>', re.IGNORECASE)
+
+
+def _ngram_tokens(text):
+    tokens = []
+    for word in _WORD.findall(unicodedata.normalize('NFKC', text).lower()):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return ' '.join(tokens)
+
+
+def _plain_text(value):
+    return html.unescape(strip_tags(_HTML_BREAK.sub('\n', value))).strip()
+
+
+# (구분, 앱, 모델, 제목 함수, 본문 필드)
+SOURCES = [
+    ('task', 'task', 'Task', lambda task: task.title, ('description',)),
+    ('worklog', 'worklog', 'Worklog', lambda worklog: f'{worklog.year}년 {worklog.week_number}주차', ('this_week_work', 'next_week_plan')),
+    ('sr', 'service', 'ServiceRequest', lambda sr: sr.req_title or f'SR #{sr.pk}',
+     ('req_details', 'req_reason', 'req_system', 'req_module', 'req_depart', 'req_name', 'rcv_opinion', 'complete_content')),
+    ('system', 'assets', 'System', lambda system: f'{system.name} ({system.code})' if system.code else system.name, ('description',)),
+    ('contract', 'assets', 'Contract', lambda contract: contract.name, ('contractor', 'content')),
+    ('incident', 'hooks', 'Incident', lambda incident: incident.title, ('description', 'projectName', 'oname', 'metricName')),
+]
+
+SQLITE_FULLTEXT = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(title_tokens, body_tokens, content='search_searchdocument', content_rowid='id')",
+    f"""CREATE TRIGGER search_searchdocument_ai AFTER INSERT ON search_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens);
+    END""",
+    f"""CREATE TRIGGER search_searchdocument_ad AFTER DELETE ON search_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) VALUES ('delete', old.id, old.title_tokens, old.body_tokens);
+    END""",
+    f"""CREATE TRIGGER search_searchdocument_au AFTER UPDATE ON search_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) VALUES ('delete', old.id, old.title_tokens, old.body_tokens);
+        INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens);
+    END""",
+]
+SQLITE_FULLTEXT_DROP = [
+    'DROP TRIGGER IF EXISTS search_searchdocument_ai',
+    'DROP TRIGGER IF EXISTS search_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS search_searchdocument_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+POSTGRESQL_FULLTEXT = [
+    """ALTER TABLE search_searchdocument ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple'::regconfig, title_tokens), 'A') || setweight(to_tsvector('simple'::regconfig, body_tokens), 'B')
+    ) STORED""",
+    'CREATE INDEX search_searchdocument_vector_idx ON search_searchdocument USING GIN (search_vector)',
+]
+POSTGRESQL_FULLTEXT_DROP = [
+    'DROP INDEX IF EXISTS search_searchdocument_vector_idx',
+    'ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    _execute(schema_editor, {'sqlite': SQLITE_FULLTEXT, 'postgresql': POSTGRESQL_FULLTEXT})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _execute(schema_editor, {'sqlite': SQLITE_FULLTEXT_DROP, 'postgresql': POSTGRESQL_FULLTEXT_DROP})
+
+
+def build_documents(apps, schema_editor):
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    for kind, app_label, model_name, title_of, body_fields in SOURCES:
+        # rebuild_search_index 와 같이 500건마다 저장해 대량 데이터에서도 메모리를 일정하게 유지
+        documents = []
+        for instance in apps.get_model(app_label, model_name).objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            title = (title_of(instance) or '')[:255]
+            body = '\n'.join(_plain_text(value) for value in (getattr(instance, field) for field in body_fields) if value)
+            documents.append(SearchDocument(
+                kind=kind, object_id=instance.pk, title=title, body=body,
+                title_tokens=_ngram_tokens(title), body_tokens=_ngram_tokens(body), updated_at=instance.updated_at,
+            ))
+            if len(documents) >= BATCH_SIZE:
+                SearchDocument.objects.bulk_create(documents)
+                documents = []
+        SearchDocument.objects.bulk_create(documents)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('assets', '0017_inspectionoccurrence'),
+        ('hooks', '0001_initial'),
+        ('service', '0015_servicerequestattachment_file_type'),
+        ('task', '0009_category_is_key_task'),
+        ('worklog', '0008_worklog_worklog_wor_year_779500_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', '업무'), ('worklog', '주간업무'), ('sr', 'SR'), ('system', '시스템'), ('contract', '계약'), ('incident', '인시던트')], max_length=20, verbose_name='구분')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='원본 ID')),
+                ('title', models.CharField(max_length=255, verbose_name='제목')),
+                ('body', models.TextField(blank=True, verbose_name='본문')),
+                ('title_tokens', models.TextField(blank=True)),
+                ('body_tokens', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '검색 문서',
+                'verbose_name_plural': '검색 문서',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    통합 검색용 문서 (업무/주간업무/SR/시스템/계약/인시던트 1건당 1행)
+    *_tokens 는 n-gram 토큰 문자열이며, DB 엔진별 전문 검색 인덱스(SQLite FTS5 / PostgreSQL tsvector)가 이 컬럼을 색인합니다.
+    """
+    KIND_CHOICES = [
+        ('task', '업무'),
+        ('worklog', '주간업무'),
+        ('sr', 'SR'),
+        ('system', '시스템'),
+        ('contract', '계약'),
+        ('incident', '인시던트'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name='구분')
+    object_id = models.PositiveBigIntegerField(verbose_name='원본 ID')
+    title = models.CharField(max_length=255, verbose_name='제목')
+    body = models.TextField(blank=True, verbose_name='본문')
+    title_tokens = models.TextField(blank=True)
+    body_tokens = models.TextField(blank=True)
+    updated_at = models.DateTimeField(verbose_name='수정일시')
+
+    class Meta:
+        verbose_name = '검색 문서'
+        verbose_name_plural = '검색 문서'
+        unique_together = ('kind', 'object_id')
+
+    def __str__(self):
+        return f'[{self.get_kind_display()}] {self.title}'
@@ -0,0 +1,265 @@
+"""
+통합 검색
+업무/주간업무/SR/시스템/계약/인시던트를 SearchDocument 로 옮겨 적고, DB 엔진(SQL_ENGINE)별 전문 검색 인덱스로 찾습니다.
+- SQLite: FTS5 외부 콘텐츠 테이블(search_searchdocument_fts, 트리거로 동기화), bm25 로 순위
+- PostgreSQL: 생성 컬럼 search_vector(tsvector, GIN 인덱스), ts_rank 로 순위
+- 그 외 엔진: 인덱스 없이 부분 일치(icontains)
+
+한국어는 형태소 분석기 없이 찾을 수 있도록 단어를 2글자(bigram) 단위로 잘라 색인하고, 검색어도 같은 방식으로 잘라
+인접한 bigram 을 구문(phrase)으로 찾습니다. 그래서 기존 icontains 처럼 단어 중간의 부분 문자열도 찾습니다.
+원본 저장/삭제 시그널에서 해당 문서 1건만 갱신하고, 시그널 없는 일괄 저장 경로는 index_instances 를 직접 호출합니다.
+전체 재생성은 rebuild_search_index 명령을 사용합니다.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models import BooleanField, Count, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+
+from assets.models import Contract, System
+from common.text_normalize import html_to_text
+from hooks.models import Incident
+from service.models import ServiceRequest
+from task.models import Task
+from worklog.models import Worklog
+
+from .models import SearchDocument
+
+FTS_TABLE = 'search_searchdocument_fts'
+TITLE_WEIGHT = 10.0  # bm25 제목 컬럼 가중치 (본문 1.0)
+MAX_QUERY_WORDS = 8
+INDEX_BATCH_SIZE = 500
+
+# 밑줄은 FTS5/tsvector 토크나이저가 구분자로 취급하므로 단어에서 제외
+_WORD = re.compile(r'[^\W_]+')
+
+DOCUMENT_FIELDS = ('title', 'body', 'title_tokens', 'body_tokens', 'updated_at')
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(unicodedata.normalize('NFKC', text).lower())
+
+
+def _bigrams(word: str) -> List[str]:
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def ngram_tokens(text: Optional[str]) -> str:
+    """색인용 토큰 문자열. 단어별 bigram + 마지막 글자 ('서버장애' → '서버 버장 장애 애')"""
+    if not text:
+        return ''
+    tokens = []
+    for word in _words(text):
+        tokens.extend(_bigrams(word))
+        # 한 글자 검색어는 접두 검색('애*')으로 찾으므로, 단어 끝 글자도 토큰으로 남김
+        tokens.append(word[-1])
+    return ' '.join(tokens)
+
+
+def _query_terms(query: str) -> List[Tuple[List[str], bool]]:
+    """검색어 단어별 (bigram 목록, 접두 검색 여부). 단어끼리는 AND"""
+    terms = []
+    for word in _words(query)[:MAX_QUERY_WORDS]:
+        if len(word) == 1:
+            terms.append(([word], True))
+        else:
+            terms.append((_bigrams(word), False))
+    return terms
+
+
+def _fts5_query(terms) -> str:
+    # 토큰은 문자/숫자만이라 큰따옴표 구문으로 감싸면 FTS5 문법과 충돌하지 않음
+    return ' AND '.join('"{}"{}'.format(' '.join(grams), '*' if prefix else '') for grams, prefix in terms)
+
+
+def _tsquery(terms) -> str:
+    return ' & '.join(f'{grams[0]}:*' if prefix else '({})'.format(' <-> '.join(grams)) for grams, prefix in terms)
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """검색 대상 모델 정의"""
+    kind: str
+    label: str
+    model: type
+    url_name: str
+    title: Callable
+    body_fields: Tuple[str, ...]
+    # 사용자가 열람할 수 있는 원본 쿼리셋. None 이면 로그인 사용자 전체 공개
+    visible: Optional[Callable] = None
+
+    def document(self, instance) -> SearchDocument:
+        title = (self.title(instance) or '')[:255]
+        body = '\n'.join(html_to_text(value) for value in (getattr(instance, field) for field in self.body_fields) if value)
+        return SearchDocument(
+            kind=self.kind,
+            object_id=instance.pk,
+            title=title,
+            body=body,
+            title_tokens=ngram_tokens(title),
+            body_tokens=ngram_tokens(body),
+            updated_at=instance.updated_at,
+        )
+
+
+SEARCH_SOURCES: Dict[str, SearchSource] = {source.kind: source for source in (
+    SearchSource(
+        'task', '업무', Task, 'task_detail',
+        title=lambda task: task.title,
+        body_fields=('description',),
+        # TaskDetailView 와 동일하게 작성자 + 담당자
+        visible=lambda user: Task.objects.filter(Q(author=user) | Q(assigned_to=user)),
+    ),
+    SearchSource(
+        'worklog', '주간업무', Worklog, 'worklog_detail',
+        title=lambda worklog: f'{worklog.year}년 {worklog.week_number}주차',
+        body_fields=('this_week_work', 'next_week_plan'),
+        visible=lambda user: Worklog.objects.filter(author=user),
+    ),
+    SearchSource(
+        'sr', 'SR', ServiceRequest, 'service_request_detail',
+        title=lambda sr: sr.req_title or f'SR #{sr.pk}',
+        body_fields=('req_details', 'req_reason', 'req_system', 'req_module', 'req_depart', 'req_name', 'rcv_opinion', 'complete_content'),
+    ),
+    SearchSource(
+        'system', '시스템', System, 'assets:system_detail',
+        title=lambda system: f'{system.name} ({system.code})' if system.code else system.name,
+        body_fields=('description',),
+    ),
+    SearchSource(
+        'contract', '계약', Contract, 'assets:contract_detail',
+        title=lambda contract: contract.name,
+        body_fields=('contractor', 'content'),
+    ),
+    SearchSource(
+        'incident', '인시던트', Incident, 'hooks:incident_detail',
+        title=lambda incident: incident.title,
+        body_fields=('description', 'projectName', 'oname', 'metricName'),
+    ),
+)}
+
+_SOURCE_BY_MODEL = {source.model: source for source in SEARCH_SOURCES.values()}
+
+
+def index_instance(instance) -> None:
+    """원본 1건의 검색 문서를 생성/갱신합니다."""
+    document = _SOURCE_BY_MODEL[type(instance)].document(instance)
+    SearchDocument.objects.update_or_create(
+        kind=document.kind,
+        object_id=document.object_id,
+        defaults={field: getattr(document, field) for field in DOCUMENT_FIELDS},
+    )
+
+
+def index_instances(instances) -> int:
+    """
+    원본 여러 건의 검색 문서를 한 번에 생성/갱신합니다.
+    bulk_create/bulk_update 처럼 저장 시그널이 없는 경로에서 호출합니다. 반환값: 문서 수
+    """
+    documents = [_SOURCE_BY_MODEL[type(instance)].document(instance) for instance in instances]
+    SearchDocument.objects.bulk_create(
+        documents,
+        batch_size=INDEX_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=list(DOCUMENT_FIELDS),
+    )
+    return len(documents)
+
+
+def remove_instance(instance) -> None:
+    SearchDocument.objects.filter(kind=_SOURCE_BY_MODEL[type(instance)].kind, object_id=instance.pk).delete()
+
+
+def rebuild_search_index(kinds: Optional[List[str]] = None) -> Dict[str, int]:
+    """구분별 검색 문서를 모두 지우고 원본에서 다시 생성합니다. 반환값: 구분별 문서 수"""
+    counts = {}
+    with transaction.atomic():
+        for kind in kinds or SEARCH_SOURCES:
+            source = SEARCH_SOURCES[kind]
+            SearchDocument.objects.filter(kind=kind).delete()
+            batch, count = [], 0
+            for instance in source.model.objects.order_by('pk').iterator(chunk_size=INDEX_BATCH_SIZE):
+                batch.append(source.document(instance))
+                if len(batch) >= INDEX_BATCH_SIZE:
+                    count += len(SearchDocument.objects.bulk_create(batch))
+                    batch = []
+            count += len(SearchDocument.objects.bulk_create(batch))
+            counts[kind] = count
+    return counts
+
+
+def visible_documents_q(user) -> Q:
+    """사용자가 열람할 수 있는 검색 문서 조건 (원본 권한을 서브쿼리로 그대로 적용)"""
+    condition = Q(kind__in=[kind for kind, source in SEARCH_SOURCES.items() if source.visible is None])
+    for kind, source in SEARCH_SOURCES.items():
+        if source.visible is not None:
+            condition |= Q(kind=kind, object_id__in=source.visible(user).values('pk'))
+    return condition
+
+
+def _match(queryset, query: str):
+    """(검색어와 일치하는 문서 쿼리셋, 순위 표현식). 순위는 클수록 관련도가 높음"""
+    terms = _query_terms(query)
+    vendor = connection.vendor
+
+    if vendor == 'sqlite':
+        expression = _fts5_query(terms)
+        matched = queryset.filter(pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (expression,)))
+        # bm25 는 작을수록 관련도가 높으므로 부호를 바꿈
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, %s, 1.0) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = "search_searchdocument"."id"',
+            (TITLE_WEIGHT, expression),
+            output_field=FloatField(),
+        )
+        return matched, rank
+
+    if vendor == 'postgresql':
+        tsquery = "to_tsquery('simple'::regconfig, %s)"
+        expression = _tsquery(terms)
+        matched = queryset.filter(RawSQL(f'"search_searchdocument"."search_vector" @@ {tsquery}', (expression,), output_field=BooleanField()))
+        rank = RawSQL(f'ts_rank("search_searchdocument"."search_vector", {tsquery})', (expression,), output_field=FloatField())
+        return matched, rank
+
+    condition = Q()
+    for word in _words(query)[:MAX_QUERY_WORDS]:
+        condition &= Q(title__icontains=word) | Q(body__icontains=word)
+    return queryset.filter(condition), Value(0.0, output_field=FloatField())
+
+
+def search_documents(user, query: str, kind: Optional[str] = None, page=1) -> Optional[Dict]:
+    """
+    권한 필터 + 순위 정렬 + 페이지 단위 검색 결과.
+    반환값: {'page_obj': 현재 페이지(문서에 url/kind_label 부여), 'kind_counts': [(구분, 이름, 건수)], 'total': 전체 건수}
+    검색어에 단어가 없으면 None
+    """
+    if not _query_terms(query):
+        return None
+
+    matched, rank = _match(SearchDocument.objects.filter(visible_documents_q(user)), query)
+    counts = dict(matched.order_by().values_list('kind').annotate(count=Count('pk')))
+
+    results = matched
+    if kind in SEARCH_SOURCES:
+        results = results.filter(kind=kind)
+    results = results.annotate(rank=rank).order_by('-rank', '-updated_at', '-pk')
+
+    page_obj = Paginator(results, settings.SEARCH_PAGE_SIZE).get_page(page)
+    page_obj.object_list = list(page_obj.object_list)
+    for document in page_obj.object_list:
+        source = SEARCH_SOURCES[document.kind]
+        document.kind_label = source.label
+        document.url = reverse(source.url_name, args=[document.object_id])
+
+    return {
+        'page_obj': page_obj,
+        'kind_counts': [(key, source.label, counts.get(key, 0)) for key, source in SEARCH_SOURCES.items()],
+        'total': sum(counts.values()),
+    }
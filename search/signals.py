@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from assets.models import Contract, System
+from hooks.models import Incident
+from service.models import ServiceRequest
+from task.models import Task
+from worklog.models import Worklog
+
+from .services import index_instance, remove_instance
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Worklog)
+@receiver(post_save, sender=ServiceRequest)
+@receiver(post_save, sender=System)
+@receiver(post_save, sender=Contract)
+@receiver(post_save, sender=Incident)
+def index_search_document(sender, instance, raw=False, **kwargs):
+    """Keep the search document of the saved object in sync (fixtures are indexed by rebuild_search_index)."""
+    if raw:
+        return
+    index_instance(instance)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Worklog)
+@receiver(post_delete, sender=ServiceRequest)
+@receiver(post_delete, sender=System)
+@receiver(post_delete, sender=Contract)
+@receiver(post_delete, sender=Incident)
+def remove_search_document(sender, instance, **kwargs):
+    remove_instance(instance)
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from common.counters import invalidate_service_request_counts
+from .models import ServiceRequest
+
+
+@receiver(post_save, sender=ServiceRequest)
+@receiver(post_delete, sender=ServiceRequest)
+def invalidate_sr_counters(sender, instance, **kwargs):
+    """SR 상태/담당자 변경 시 사이드바 SR 건수 캐시 무효화"""
+    invalidate_service_request_counts()
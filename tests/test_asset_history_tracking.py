@@ -0,0 +1,93 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from assets.history_utils import build_update_histories, bulk_create_asset_history
+from assets.models import AssetHistory, Contract, System
+
+User = get_user_model()
+
+
+class AssetHistoryTrackingTests(TestCase):
+    def setUp(self) -> None:
+        self.owner = User.objects.create_user(username="owner")
+        self.system = System.objects.create(name="그룹웨어", status="OPER", manager=self.owner)
+
+    def _updates(self, asset):
+        return list(AssetHistory.objects.filter(system=asset, action="UPDATE").values_list("changed_fields", flat=True))
+
+    def test_loaded_instance_is_diffed_without_reselect(self) -> None:
+        system = System.objects.get(pk=self.system.pk)
+        system.status = "DEV"
+
+        with CaptureQueriesContext(connection) as ctx:
+            system.save()
+
+        self.assertFalse(any(q["sql"].startswith('SELECT "assets_system"') for q in ctx.captured_queries))
+        self.assertEqual(self._updates(system), [{"status": {"old": "OPER", "new": "DEV"}}])
+
+    def test_snapshot_follows_saves_and_foreign_keys(self) -> None:
+        other = User.objects.create_user(username="other")
+        system = System.objects.get(pk=self.system.pk)
+
+        system.save()  # 변경 없음
+        system.manager = other
+        system.save()
+        system.manager = None
+        system.save()
+
+        self.assertEqual(
+            self._updates(system),
+            [
+                {"manager": {"old": "other", "new": None}},
+                {"manager": {"old": "owner", "new": "other"}},
+            ],
+        )
+
+    def test_in_place_json_change_is_detected(self) -> None:
+        contract = Contract.objects.create(
+            name="유지보수", contract_type="MAINT", start_date=datetime.date(2024, 1, 1), end_date=datetime.date(2024, 12, 31)
+        )
+        contract = Contract.objects.get(pk=contract.pk)
+        contract.inspection_schedule.append("2024-06")
+        contract.save()
+
+        history = AssetHistory.objects.get(contract=contract, action="UPDATE")
+        self.assertEqual(history.changed_fields, {"inspection_schedule": {"old": "[]", "new": "['2024-06']"}})
+
+    def test_unloaded_instance_falls_back_to_database(self) -> None:
+        system = System(
+            pk=self.system.pk, name="그룹웨어2", code=self.system.code, status="OPER",
+            manager=self.owner, created_at=self.system.created_at,
+        )
+        system.save()
+
+        self.assertEqual(self._updates(system), [{"name": {"old": "그룹웨어", "new": "그룹웨어2"}}])
+
+    def test_link_histories_are_bulk_inserted(self) -> None:
+        contract = Contract.objects.create(
+            name="구축", contract_type="BUILD", start_date=datetime.date(2024, 1, 1), end_date=datetime.date(2024, 12, 31)
+        )
+        systems = [System.objects.create(name=f"시스템{i}") for i in range(3)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            contract.systems.add(*systems)
+
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "assets_assethistory"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(AssetHistory.objects.filter(action__in=["SYSTEM_ADD", "CONTRACT_ADD"]).count(), 6)
+
+    def test_bulk_update_path(self) -> None:
+        second = System.objects.create(name="메일", status="OPER")
+        systems = list(System.objects.filter(pk__in=[self.system.pk, second.pk]).order_by("pk"))
+        systems[0].status = "SUSP"
+
+        histories = build_update_histories("SYSTEM", systems, user=self.owner, comment="일괄 수정")
+        System.objects.bulk_update(systems, ["status"])
+        bulk_create_asset_history(histories)
+
+        self.assertEqual(len(histories), 1)
+        self.assertEqual(self._updates(self.system), [{"status": {"old": "OPER", "new": "SUSP"}}])
@@ -0,0 +1,107 @@
+import datetime
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from assets.models import Contract, Hardware, Software, System
+from assets.services import build_topology, get_topology_json
+
+User = get_user_model()
+
+
+class AssetTopologyTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.oper = System.objects.create(name="가-운영", status="OPER")
+        self.oper2 = System.objects.create(name="나-운영", status="OPER")
+        self.dev = System.objects.create(name="다-개발", status="DEV")
+        self.build = self._contract("구축", datetime.date(2024, 3, 1), self.oper2, self.oper)
+        self.maint = self._contract("유지보수", datetime.date(2024, 1, 1), self.oper)
+        self.dev_only = self._contract("개발계약", datetime.date(2024, 2, 1), self.dev)
+        self.build.related_contracts.add(self.maint, self.dev_only)
+        self.server = Hardware.objects.create(name="서버")
+        self.server.systems.add(self.oper)
+        Software.objects.create(name="미연결SW")
+
+    def _contract(self, name, start, *systems):
+        contract = Contract.objects.create(
+            name=name, contract_type="BUILD", start_date=start, end_date=datetime.date(2025, 1, 1)
+        )
+        contract.systems.add(*systems)
+        return contract
+
+    def _ids(self, items):
+        return [item["data"]["id"] for item in items]
+
+    def test_builds_graph_for_status_filter(self) -> None:
+        b, m, o, o2 = self.build.pk, self.maint.pk, self.oper.pk, self.oper2.pk
+
+        nodes, edges = build_topology(["OPER"])
+
+        self.assertEqual(
+            self._ids(nodes),
+            [f"con_{b}", f"con_{m}", f"hw_{self.server.pk}", f"sys_{o}", f"sys_{o2}"],
+        )
+        self.assertEqual(
+            self._ids(edges),
+            [
+                f"edge_con_{b}_sys_{o}",
+                f"edge_con_{b}_sys_{o2}",
+                f"edge_con_{m}_sys_{o}",
+                f"con_{min(b, m)}_rel_con_{max(b, m)}",
+                f"edge_hw_{self.server.pk}_sys_{o}",
+            ],
+        )
+        # 연관계약 엣지는 한 번만, 개발 시스템 계약과의 관계는 제외
+        self.assertEqual(edges[3]["data"]["source"], f"con_{m}")
+
+    def test_hide_unconnected_systems(self) -> None:
+        lonely = System.objects.create(name="라-미연결", status="OPER")
+
+        nodes, _ = build_topology(["OPER"], hide_unconnected=True)
+
+        self.assertNotIn(f"sys_{lonely.pk}", self._ids(nodes))
+        self.assertIn(f"sys_{self.oper.pk}", self._ids(nodes))
+
+    def test_query_count_does_not_grow_with_assets(self) -> None:
+        with self.assertNumQueries(7) as small:
+            build_topology([])
+        for i in range(10):
+            self._contract(f"추가{i}", datetime.date(2023, 1, 1), self.oper, self.dev)
+            Hardware.objects.create(name=f"장비{i}").systems.add(self.oper2)
+        with self.assertNumQueries(len(small.captured_queries)):
+            build_topology([])
+
+    def test_cached_json_invalidated_by_link_change(self) -> None:
+        get_topology_json(["OPER"])
+        with self.assertNumQueries(0):
+            cached = get_topology_json(["OPER"])
+
+        self.server.systems.add(self.oper2)
+
+        edges = json.loads(get_topology_json(["OPER"])["edges_json"])
+        self.assertIn(f"edge_hw_{self.server.pk}_sys_{self.oper2.pk}", self._ids(edges))
+        self.assertNotEqual(cached["edges_json"], json.dumps(edges))
+
+    def test_cache_invalidated_by_status_change(self) -> None:
+        get_topology_json(["OPER"])
+
+        self.dev.status = "OPER"
+        self.dev.save()
+
+        nodes = json.loads(get_topology_json(["OPER"])["nodes_json"])
+        self.assertIn(f"sys_{self.dev.pk}", self._ids(nodes))
+
+    def test_view_renders_cached_graph(self) -> None:
+        user = User.objects.create_user(username="viewer", password="secret")
+        user.profile.is_first_login = False
+        user.profile.save()
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("assets:topology"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["nodes_json"], get_topology_json(["OPER"])["nodes_json"])
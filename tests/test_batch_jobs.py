@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock, patch
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from batch import jobs
+from batch.models import BatchJob
+from reports.models import ReportReview
+
+
+class BatchJobQueueTests(TestCase):
+    def setUp(self) -> None:
+        self.admin = get_user_model().objects.create_user(username="admin", password="secret", is_staff=True)
+
+    def test_submit_deduplicates_active_jobs(self) -> None:
+        job, created = jobs.submit_job("generate_missing_reviews", ["--year", 2024, "--week", 26])
+        again, created_again = jobs.submit_job("generate_missing_reviews", ["--year", "2024", "--week", "26"])
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(job.pk, again.pk)
+
+    def test_claim_is_exclusive(self) -> None:
+        job, _ = jobs.submit_job("send_review_notifications")
+
+        claimed = jobs.claim_next_job("worker-a")
+
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, BatchJob.STATUS_RUNNING)
+        self.assertIsNone(jobs.claim_next_job("worker-b"))
+
+    def test_cancel_pending_job(self) -> None:
+        job, _ = jobs.submit_job("send_review_notifications")
+
+        job = jobs.request_cancel(job)
+
+        self.assertEqual(job.status, BatchJob.STATUS_CANCELLED)
+        self.assertIsNone(jobs.claim_next_job("worker-a"))
+
+    @patch("reports.management.commands.send_review_notifications.send_review_notification")
+    def test_run_job_records_output_and_progress(self, mock_send: MagicMock) -> None:
+        for week in (25, 26):
+            ReportReview.objects.create(user=self.admin, year=2024, week_number=week, review_content={})
+        jobs.submit_job("send_review_notifications")
+
+        job = jobs.run_job(jobs.claim_next_job("worker-a"))
+
+        self.assertEqual(job.status, BatchJob.STATUS_SUCCEEDED)
+        self.assertEqual((job.progress_current, job.progress_total), (2, 2))
+        self.assertIn("총 2건의 알림을 성공적으로 발송했습니다.", job.output)
+        self.assertEqual(mock_send.call_count, 2)
+
+    @patch("reports.management.commands.send_review_notifications.send_review_notification")
+    def test_running_job_stops_when_cancel_requested(self, mock_send: MagicMock) -> None:
+        ReportReview.objects.create(user=self.admin, year=2024, week_number=26, review_content={})
+        jobs.submit_job("send_review_notifications")
+        job = jobs.claim_next_job("worker-a")
+        jobs.request_cancel(job)
+
+        job = jobs.run_job(job)
+
+        self.assertEqual(job.status, BatchJob.STATUS_CANCELLED)
+        mock_send.assert_not_called()
+
+    def test_command_without_progress_stops_on_output_flush(self) -> None:
+        jobs.submit_job("check_notifications", ["--type=monitor"])
+        job = jobs.claim_next_job("worker-a")
+        jobs.request_cancel(job)
+        reporter = jobs.JobReporter(job, flush_interval=0)
+
+        with self.assertRaises(jobs.JobCancelled):
+            reporter.write("checking...\n")
+
+        job.refresh_from_db()
+        self.assertEqual(job.output, "checking...\n")
+
+    def test_heartbeat_keeps_silent_job_from_being_reaped(self) -> None:
+        jobs.submit_job("check_notifications", ["--type=monitor"])
+        job = jobs.claim_next_job("worker-a")
+        BatchJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - jobs.STALE_AFTER * 2)
+
+        jobs.JobHeartbeat(job).beat()
+
+        self.assertEqual(jobs.fail_stale_jobs(), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, BatchJob.STATUS_RUNNING)
+
+    @patch("batch.jobs.call_command")
+    def test_run_job_stops_heartbeat_thread(self, mock_call: MagicMock) -> None:
+        jobs.submit_job("check_notifications", ["--type=monitor"])
+
+        with patch.object(jobs.JobHeartbeat, "stop", autospec=True, side_effect=jobs.JobHeartbeat.stop) as mock_stop:
+            job = jobs.run_job(jobs.claim_next_job("worker-a"))
+
+        self.assertEqual(job.status, BatchJob.STATUS_SUCCEEDED)
+        heartbeat = mock_stop.call_args.args[0]
+        self.assertFalse(heartbeat.is_alive())
+
+
+    def test_worker_once_drains_queue(self) -> None:
+        first, _ = jobs.submit_job("send_review_notifications")
+        second, _ = jobs.submit_job("check_notifications", ["--type=monitor"])
+        jobs.request_cancel(second)
+
+        call_command("run_batch_worker", "--once", stdout=StringIO())
+
+        first.refresh_from_db()
+        self.assertEqual(first.status, BatchJob.STATUS_SUCCEEDED)
+        self.assertIn("발송할 리뷰 알림이 없습니다.", first.output)
+
+
+class BatchJobViewTests(TestCase):
+    def setUp(self) -> None:
+        self.admin = get_user_model().objects.create_user(username="admin", password="secret", is_staff=True)
+        self.admin.profile.is_first_login = False
+        self.admin.profile.save()
+        self.client.force_login(self.admin)
+
+    def test_submit_returns_immediately_with_job(self) -> None:
+        response = self.client.post(reverse("batch:generate_missing_reviews"), {"week": "2024-26"})
+
+        self.assertEqual(response.status_code, 202)
+        job = response.json()["job"]
+        self.assertEqual(job["status"], BatchJob.STATUS_PENDING)
+        self.assertEqual(job["args"], ["--year", "2024", "--week", "26", "--stale"])
+
+    def test_poll_returns_output_since_offset(self) -> None:
+        job = BatchJob.objects.create(command="send_review_notifications", output="line1\nline2\n")
+
+        response = self.client.get(reverse("batch:job_status", args=[job.pk]), {"offset": 6})
+
+        payload = response.json()["job"]
+        self.assertEqual(payload["output"], "line2\n")
+        self.assertEqual(payload["output_offset"], 12)
+
+    def test_cancel_endpoint(self) -> None:
+        job = BatchJob.objects.create(command="send_review_notifications")
+
+        response = self.client.post(reverse("batch:cancel_job", args=[job.pk]))
+
+        self.assertTrue(response.json()["success"])
+        self.assertEqual(response.json()["job"]["status"], BatchJob.STATUS_CANCELLED)
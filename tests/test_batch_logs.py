@@ -0,0 +1,95 @@
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from batch import views
+
+
+class ReadLogChunkTests(SimpleTestCase):
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def _write(self, text: str, mode: str = "a") -> None:
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write(text)
+
+    def test_returns_only_new_complete_lines(self) -> None:
+        self._write("첫째 줄\n둘째 줄\n")
+        content, offset, file_id, reset = views._read_log_chunk(self.path, None)
+        self.assertEqual(content, "첫째 줄\n둘째 줄\n")
+        self.assertFalse(reset)
+
+        self._write("셋째 줄\n작성 중")
+        content, offset, file_id, _ = views._read_log_chunk(self.path, offset, file_id)
+        self.assertEqual(content, "셋째 줄\n")
+
+        self._write("인 줄\n")
+        content, _, _, _ = views._read_log_chunk(self.path, offset, file_id)
+        self.assertEqual(content, "작성 중인 줄\n")
+
+    def test_line_longer_than_chunk_advances(self) -> None:
+        self._write("가" * 10 + "끝\n다음\n")  # 한 글자 3바이트, 10바이트마다 글자 경계가 어긋남
+
+        chunks, offset = [], 0
+        for _ in range(10):
+            content, offset, _, _ = views._read_log_chunk(self.path, offset, max_bytes=10)
+            chunks.append(content)
+
+        self.assertEqual("".join(chunks), "가" * 10 + "끝\n다음\n")
+        self.assertTrue(all(len(chunk.encode()) <= 10 for chunk in chunks))
+        self.assertEqual(offset, os.path.getsize(self.path))
+
+    def test_tail_starts_at_line_boundary(self) -> None:
+        line = "x" * 99 + "\n"
+        self._write(line * ((views.LOG_TAIL_BYTES // 100) + 50))
+
+        content, offset, _, _ = views._read_log_chunk(self.path, None)
+
+        self.assertLessEqual(len(content), views.LOG_TAIL_BYTES)
+        self.assertTrue(content.startswith("x"))
+        self.assertEqual(len(content) % 100, 0)
+        self.assertEqual(offset, os.path.getsize(self.path))
+
+    def test_truncated_file_resets_cursor(self) -> None:
+        self._write("old line\n" * 10)
+        _, offset, file_id, _ = views._read_log_chunk(self.path, None)
+
+        self._write("new\n", mode="w")
+        content, next_offset, _, reset = views._read_log_chunk(self.path, offset, file_id)
+
+        self.assertTrue(reset)
+        self.assertEqual(content, "new\n")
+        self.assertEqual(next_offset, 4)
+
+    def test_sse_event_format(self) -> None:
+        event = views._format_sse("log", "a\nb", "1:2/10")
+        self.assertEqual(event, "id: 1:2/10\nevent: log\ndata: a\ndata: b\n\n")
+
+
+class BatchLogStreamSettingTests(TestCase):
+    def setUp(self) -> None:
+        admin = get_user_model().objects.create_user(username="admin", password="secret", is_staff=True)
+        admin.profile.is_first_login = False
+        admin.profile.save()
+        self.client.force_login(admin)
+
+    def test_stream_is_disabled_by_default(self) -> None:
+        response = self.client.get(reverse("batch:stream_batch_logs"))
+        self.assertEqual(response.status_code, 404)
+
+        page = self.client.get(reverse("batch:operations"))
+        self.assertContains(page, "const LOG_STREAM_ENABLED = false;")
+
+    @override_settings(BATCH_LOG_STREAM_ENABLED=1)
+    def test_stream_opt_in(self) -> None:
+        response = self.client.get(reverse("batch:stream_batch_logs"))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        response.close()
+
+        page = self.client.get(reverse("batch:operations"))
+        self.assertContains(page, "const LOG_STREAM_ENABLED = true;")
@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from assets.models import Contract, System
+from dashboard.services import get_dashboard_stats, get_task_counters
+from service.models import ServiceRequest
+from task.models import Task
+
+User = get_user_model()
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username="me", password="secret")
+        self.user.profile.is_first_login = False
+        self.user.profile.save()
+        self.other = User.objects.create_user(username="other")
+        self.today = date(2024, 6, 10)
+
+    def _task(self, author, **kwargs):
+        return Task.objects.create(author=author, title="업무", **kwargs)
+
+    def test_task_counters_in_one_query(self) -> None:
+        own = self._task(self.user, status="in_progress", priority="urgent", due_date=self.today + timedelta(days=1))
+        own.assigned_to.add(self.user, self.other)  # 작성자이면서 담당자여도 한 번만 집계
+        assigned = self._task(self.other, status="todo", priority="low", due_date=self.today - timedelta(days=2))
+        assigned.assigned_to.add(self.user)
+        self._task(self.user, status="done", priority="high")
+        self._task(self.other, status="todo")
+
+        with self.assertNumQueries(1):
+            counters = get_task_counters(self.user, self.today)
+
+        self.assertEqual(counters["total_tasks"], 3)
+        self.assertEqual(counters["todo_tasks"], 1)
+        self.assertEqual(counters["in_progress_tasks"], 1)
+        self.assertEqual(counters["done_tasks"], 1)
+        self.assertEqual(counters["urgent_tasks"], 1)
+        self.assertEqual(counters["low_tasks"], 1)
+        self.assertEqual(counters["urgent_deadline_count"], 1)
+        self.assertEqual(counters["overdue_count"], 1)
+
+    def test_other_domains_and_cache(self) -> None:
+        ServiceRequest.objects.create(status="N", assignee=self.user)
+        ServiceRequest.objects.create(status="P", assignee=self.user)
+        ServiceRequest.objects.create(status="P", assignee=self.other)
+        mine = System.objects.create(name="A", code="A", manager=self.user)
+        System.objects.create(name="B", code="B")
+        contract = Contract.objects.create(
+            name="유지보수", contract_type="MAINT", start_date=date(2023, 7, 1), end_date=date(2024, 6, 30)
+        )
+        contract.systems.add(mine)
+        Contract.objects.create(name="만료", contract_type="ETC", start_date=date(2022, 1, 1), end_date=date(2022, 12, 31))
+
+        stats = get_dashboard_stats(self.user, self.today)
+
+        self.assertEqual(stats["sr_receipt_target_count"], 1)
+        self.assertEqual(stats["sr_processing_count"], 1)
+        self.assertEqual(stats["sr_total_count"], 3)
+        self.assertEqual(stats["total_systems"], 2)
+        self.assertEqual(stats["my_systems_count"], 1)
+        self.assertEqual(stats["active_contracts_count"], 1)
+        self.assertEqual(stats["my_contracts_count"], 1)
+        self.assertIsNone(stats["lead_time_status"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_dashboard_stats(self.user, self.today), stats)
+
+    def test_dashboard_query_count_does_not_grow_with_tasks(self) -> None:
+        self.client.force_login(self.user)
+        self._task(self.user)
+        response = self.client.get(reverse("dashboard"))
+        self.assertEqual(response.status_code, 200)
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse("dashboard"))
+        for i in range(20):
+            task = self._task(self.user if i % 2 else self.other, status="in_progress")
+            task.assigned_to.add(self.user)
+        cache.clear()
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(reverse("dashboard"))
+
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from common import gemini_cache
+from common.gemini_utils import extract_gemini_text, generate_gemini_content
+
+TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "gemini": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "gemini-test",
+    },
+    "gemini_stats": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "gemini-stats-test",
+    },
+}
+
+
+@override_settings(CACHES=TEST_CACHES, GEMINI_CACHE_ENABLED=1)
+class GeminiResponseCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        caches["gemini"].clear()
+        caches["gemini_stats"].clear()
+        self.client = MagicMock()
+        self.client.models.generate_content.return_value = MagicMock(text='{"summary": "ok"}')
+        self.config = {"temperature": 0.2}
+
+    def test_identical_prompt_is_served_from_cache(self) -> None:
+        first = generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        second = generate_gemini_content(self.client, "model-a", "prompt", self.config)
+
+        self.assertEqual(self.client.models.generate_content.call_count, 1)
+        self.assertEqual(extract_gemini_text(second), extract_gemini_text(first))
+        self.assertTrue(second.cached)
+        stats = gemini_cache.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 50.0)
+
+    def test_stats_are_kept_apart_from_responses(self) -> None:
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+
+        # 응답 캐시가 정리(cull/clear)되어도 통계는 남음
+        caches["gemini"].clear()
+        stats = gemini_cache.get_cache_stats()
+
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        # 로컬 메모리/파일 기반 incr 는 프로세스 간 원자성이 없으므로 근사치로 표시
+        self.assertTrue(stats["approximate"])
+
+    def test_key_depends_on_model_config_and_prompt(self) -> None:
+        base = gemini_cache.make_cache_key("model-a", "prompt", self.config)
+        self.assertEqual(base, gemini_cache.make_cache_key("model-a", "prompt", {"temperature": 0.2}))
+        self.assertNotEqual(base, gemini_cache.make_cache_key("model-b", "prompt", self.config))
+        self.assertNotEqual(base, gemini_cache.make_cache_key("model-a", "prompt", {"temperature": 0.3}))
+        self.assertNotEqual(base, gemini_cache.make_cache_key("model-a", "prompt!", self.config))
+
+    def test_force_refresh_bypasses_and_updates_cache(self) -> None:
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        self.client.models.generate_content.return_value = MagicMock(text='{"summary": "new"}')
+
+        generate_gemini_content(self.client, "model-a", "prompt", self.config, force_refresh=True)
+        cached = generate_gemini_content(self.client, "model-a", "prompt", self.config)
+
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+        self.assertEqual(cached.text, '{"summary": "new"}')
+        self.assertEqual(gemini_cache.get_cache_stats()["bypasses"], 1)
+
+    def test_invalid_response_is_not_cached(self) -> None:
+        self.client.models.generate_content.return_value = MagicMock(text="not json")
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        self.client.models.generate_content.return_value = MagicMock(text='{"summary": "ok"}')
+
+        retried = generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        cached = generate_gemini_content(self.client, "model-a", "prompt", self.config)
+
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+        self.assertEqual(retried.text, '{"summary": "ok"}')
+        self.assertEqual(cached.text, '{"summary": "ok"}')
+
+    def test_custom_validator(self) -> None:
+        self.client.models.generate_content.return_value = MagicMock(text="```json\n{}\n```")
+        for _ in range(2):
+            generate_gemini_content(self.client, "model-a", "prompt", self.config, validate=lambda text: "{" in text)
+
+        self.assertEqual(self.client.models.generate_content.call_count, 1)
+
+    @override_settings(GEMINI_CACHE_ENABLED=0)
+    def test_disabled_cache_always_calls_api(self) -> None:
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        generate_gemini_content(self.client, "model-a", "prompt", self.config)
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+        self.assertFalse(gemini_cache.get_cache_stats()["enabled"])
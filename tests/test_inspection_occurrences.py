@@ -0,0 +1,96 @@
+import datetime
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from assets.models import Contract, InspectionOccurrence, RegularInspection, System
+from assets.services import build_inspection_dashboard, compute_inspection_occurrences
+
+
+class InspectionOccurrenceTests(TestCase):
+    def setUp(self) -> None:
+        self.web = System.objects.create(name="웹", status="OPER")
+        self.db = System.objects.create(name="DB", status="OPER")
+        self.contract = Contract.objects.create(
+            name="유지보수", contract_type="MAINT",
+            start_date=datetime.date(2024, 11, 15), end_date=datetime.date(2025, 2, 10),
+            is_regular_inspection=True, inspection_schedule=[1, 12],
+        )
+        self.contract.systems.add(self.web, self.db)
+
+    def _inspect(self, system, month):
+        return RegularInspection.objects.create(
+            contract=self.contract, system=system, inspection_date=datetime.date.fromisoformat(f"{month}-05"),
+            inspection_month=month, result="이상 없음",
+        )
+
+    def _rows(self):
+        return list(
+            InspectionOccurrence.objects.filter(contract=self.contract)
+            .order_by("year", "month").values_list("year", "month", "is_within_period", "is_planned", "inspected_count")
+        )
+
+    def test_compute_covers_period_and_inspected_months(self) -> None:
+        rows = compute_inspection_occurrences(
+            [(1, datetime.date(2024, 11, 15), datetime.date(2025, 1, 3), [12])],
+            [(1, 10), (1, 11)],
+            [(1, "2024-12", 10), (1, "2024-12", 10), (1, "2024-12", 99), (1, "2025-03", 11), (1, "잘못된값", 10)],
+        )
+
+        self.assertEqual(
+            [(r["year"], r["month"], r["is_within_period"], r["is_planned"], r["inspected_count"]) for r in rows],
+            [(2024, 11, True, False, 0), (2024, 12, True, True, 1), (2025, 1, True, False, 0), (2025, 3, False, False, 1)],
+        )
+
+    def test_maintained_by_signals(self) -> None:
+        self._inspect(self.web, "2024-12")
+        self._inspect(self.db, "2024-12")
+        self.assertEqual(self._rows()[1], (2024, 12, True, True, 2))
+
+        self.db.status = "SUSP"
+        self.db.save()
+        self.assertEqual(self._rows()[1], (2024, 12, True, True, 1))
+
+        self.contract.systems.remove(self.web)
+        self.assertEqual(self._rows()[1], (2024, 12, True, True, 0))
+
+        self.contract.inspection_schedule = [2]
+        self.contract.save()
+        self.assertEqual([row[3] for row in self._rows()], [False, False, False, True])
+
+        self.contract.is_regular_inspection = False
+        self.contract.save()
+        self.assertEqual(self._rows(), [])
+
+    def test_rebuild_command_matches_incremental_state(self) -> None:
+        self._inspect(self.web, "2025-01")
+        self._inspect(self.db, "2025-06")  # 기간 밖 점검
+        incremental = self._rows()
+        InspectionOccurrence.objects.all().delete()
+
+        call_command("rebuild_inspection_occurrences", stdout=io.StringIO())
+
+        self.assertEqual(self._rows(), incremental)
+        self.assertIn((2025, 6, False, False, 1), incremental)
+
+    def test_dashboard_aggregates_in_fixed_queries(self) -> None:
+        self._inspect(self.web, "2025-01")
+        for i in range(5):
+            contract = Contract.objects.create(
+                name=f"추가{i}", contract_type="MAINT", start_date=datetime.date(2025, 1, 1),
+                end_date=datetime.date(2025, 12, 31), is_regular_inspection=True, inspection_schedule=[1, 6],
+            )
+            contract.systems.add(self.db)
+
+        with self.assertNumQueries(5):
+            context = build_inspection_dashboard(2025, 1, today=datetime.date(2025, 3, 1))
+
+        self.assertEqual(context["year_range"], [2025, 2024])
+        self.assertEqual(context["stats"], {"total": 11, "done": 1, "undone": 10, "total_systems": 6, "progress_rate": 9.1})
+        self.assertEqual(context["monthly_stats"], {"total": 6, "done": 1, "undone": 5})
+        row = next(item for item in context["dashboard_data"] if item["contract"] == self.contract)
+        january = row["months"][0]
+        self.assertTrue(january["is_planned"] and january["is_done"])
+        self.assertEqual([i.system for i in january["inspections"]], [self.web])
+        self.assertFalse(row["months"][2]["is_within_period"])
@@ -0,0 +1,85 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common import counters
+from monitor.models import LogCategory, LogEntry, LogSubcategory, OperationLog, SubcategoryEntry
+from monitor.services import load_operation_log_matrix
+
+
+class OperationLogMatrixTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(username="duty", password="secret")
+        self.user.profile.is_first_login = False
+        self.user.profile.save()
+        # 마이그레이션으로 생성된 기본 카테고리는 제외
+        LogCategory.objects.update(is_active=False)
+        self.categories = [
+            LogCategory.objects.create(name=f"카테고리{i}", code=f"c{i}", order=i) for i in range(3)
+        ]
+        self.inactive = LogCategory.objects.create(name="미사용", code="off", order=9, is_active=False)
+        self.sub = LogSubcategory.objects.create(category=self.categories[0], name="하위", code="s0")
+
+    def _make_logs(self, days: int) -> list:
+        logs = []
+        for day in range(1, days + 1):
+            log = OperationLog.objects.create(date=date(2024, 5, day), duty_user=self.user)
+            for category in self.categories:
+                entry = LogEntry.objects.create(operation_log=log, category=category, is_checked=True)
+                if category == self.categories[0]:
+                    SubcategoryEntry.objects.create(log_entry=entry, subcategory=self.sub, is_checked=True)
+            logs.append(log)
+        return logs
+
+    def test_matrix_is_dense_and_matches_model_checks(self) -> None:
+        complete, partial, empty = self._make_logs(3)
+        LogEntry.objects.filter(operation_log=partial, category=self.categories[2]).delete()
+        LogEntry.objects.filter(operation_log=empty).delete()
+        LogEntry.objects.create(operation_log=empty, category=self.inactive, is_checked=True)
+
+        # 점검일지, 카테고리, 로그 항목, 하위 카테고리 항목
+        with self.assertNumQueries(4):
+            matrix = load_operation_log_matrix(OperationLog.objects.order_by("date"))
+            for row in matrix.rows:
+                for entry in row.entries:
+                    if entry:
+                        list(entry.subcategory_entries.all())
+
+        self.assertEqual([c.id for c in matrix.categories], [c.id for c in self.categories])
+        for row in matrix.rows:
+            self.assertEqual(len(row.entries), len(self.categories))
+            self.assertEqual(row.ready, row.log.check_complete())
+            self.assertEqual(row.started, row.log.check_start())
+        self.assertIsNone(matrix.entries_map[partial.id][self.categories[2].id])
+        self.assertEqual(matrix.ready_map, {complete.id: True, partial.id: False, empty.id: False})
+
+    def _count_queries(self, url: str) -> int:
+        # 사이드바 카운터 캐시 적중 여부에 따라 쿼리 수가 달라지지 않도록 비움
+        caches[counters.CACHE_ALIAS].clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_list_and_detail_query_count_is_constant(self) -> None:
+        self.client.force_login(self.user)
+        logs = self._make_logs(2)
+        list_url = reverse("operation_log_list") + "?month=2024-05"
+        detail_url = reverse("operation_log_detail", args=[logs[0].pk])
+        small_list = self._count_queries(list_url)
+        small_detail = self._count_queries(detail_url)
+
+        for i in range(3, 8):
+            LogCategory.objects.create(name=f"카테고리{i}", code=f"c{i}", order=i)
+        for day in range(3, 32):
+            log = OperationLog.objects.create(date=date(2024, 5, day), duty_user=self.user)
+            for category in LogCategory.objects.filter(is_active=True):
+                LogEntry.objects.create(operation_log=log, category=category, is_checked=True)
+
+        self.assertEqual(self._count_queries(list_url), small_list)
+        self.assertEqual(self._count_queries(detail_url), small_detail)
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from notifications.models import Notification
+from notifications.utils import check_due_date_notifications, check_worklog_reminders
+from task.models import Task
+from worklog.models import Worklog
+
+User = get_user_model()
+
+
+class WorklogReminderTests(TestCase):
+    def _make_users(self, count: int, prefix: str) -> list:
+        return [User.objects.create_user(username=f"{prefix}{i}") for i in range(count)]
+
+    def test_reminds_only_users_without_worklog_or_reminder(self) -> None:
+        year, week, _ = timezone.localdate().isocalendar()
+        written, reminded, pending = self._make_users(3, "u")
+        inactive = User.objects.create_user(username="gone", is_active=False)
+        Worklog.objects.create(author=written, year=year, week_number=week)
+        Notification.objects.create(user=reminded, notification_type="worklog_reminder", title="t", message="m")
+
+        self.assertEqual(check_worklog_reminders(), 1)
+        self.assertEqual(check_worklog_reminders(), 0)
+
+        reminded_users = set(
+            Notification.objects.filter(notification_type="worklog_reminder").values_list("user__username", flat=True)
+        )
+        self.assertEqual(reminded_users, {reminded.username, pending.username})
+        self.assertNotIn(inactive.username, reminded_users)
+
+    def test_last_week_reminder_does_not_suppress(self) -> None:
+        user = User.objects.create_user(username="late")
+        old = Notification.objects.create(user=user, notification_type="worklog_reminder", title="t", message="m")
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=7))
+
+        self.assertEqual(check_worklog_reminders(), 1)
+
+    def test_query_count_does_not_grow_with_headcount(self) -> None:
+        self._make_users(3, "small")
+        with CaptureQueriesContext(connection) as small:
+            check_worklog_reminders()
+        Notification.objects.all().delete()
+
+        self._make_users(40, "large")
+        with CaptureQueriesContext(connection) as large:
+            created = check_worklog_reminders()
+
+        self.assertEqual(created, 43)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+
+class DueDateNotificationTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user(username="author")
+        self.assignee = User.objects.create_user(username="assignee")
+        today = timezone.localdate()
+        self.upcoming = Task.objects.create(author=self.author, title="임박", due_date=today + timedelta(days=2))
+        self.overdue = Task.objects.create(author=self.author, title="초과", due_date=today - timedelta(days=1))
+        Task.objects.create(author=self.author, title="완료", due_date=today, status="done")
+        Task.objects.create(author=self.author, title="여유", due_date=today + timedelta(days=10))
+        for task in (self.upcoming, self.overdue):
+            task.assigned_to.add(self.assignee)
+
+    def test_creates_due_and_overdue_notifications_once_per_day(self) -> None:
+        self.assertEqual(check_due_date_notifications(), 4)
+        self.assertEqual(check_due_date_notifications(), 0)
+
+        due = Notification.objects.filter(notification_type="task_due")
+        overdue = Notification.objects.filter(notification_type="task_overdue")
+        self.assertEqual(set(due.values_list("task_id", flat=True)), {self.upcoming.pk})
+        self.assertEqual(set(overdue.values_list("task_id", flat=True)), {self.overdue.pk})
+        self.assertEqual(set(due.values_list("user_id", flat=True)), {self.author.pk, self.assignee.pk})
+        self.assertIn("2일 남았습니다", due.get(user=self.author).title)
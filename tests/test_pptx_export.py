@@ -0,0 +1,48 @@
+import io
+from unittest import mock
+
+from django.test import SimpleTestCase
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from reports.services import pptx_export
+from reports.services.pptx_export import build_weekly_report_pptx, clear_pptx_template_cache, load_pptx_template
+
+HEADER_LABELS = ["담당", "금주 실적", "차주 계획"]
+
+
+def _entries(count):
+    body = "\n".join(f"• **업무 {i}** 진행" for i in range(4))
+    return [{"author": f"작성자{i}", "this_week": body, "next_week": body} for i in range(count)]
+
+
+def _picture_blobs(slide):
+    return [shape.image.blob for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+
+
+class PptxExportTests(SimpleTestCase):
+    def setUp(self) -> None:
+        clear_pptx_template_cache()
+
+    def test_template_parsed_once_per_process(self) -> None:
+        with mock.patch.object(pptx_export, "_parse_template", wraps=pptx_export._parse_template) as parse:
+            first = load_pptx_template()
+            build_weekly_report_pptx(_entries(3), "제목", HEADER_LABELS)
+            build_weekly_report_pptx(_entries(3), "제목", HEADER_LABELS)
+        self.assertEqual(parse.call_count, 1)
+        self.assertIs(load_pptx_template(), first)
+
+    def test_cloned_slides_keep_rows_title_and_images(self) -> None:
+        prs = Presentation(io.BytesIO(build_weekly_report_pptx(_entries(30), "6월 2주차 개발팀 주간보고", HEADER_LABELS)))
+        slides = list(prs.slides)
+        self.assertGreater(len(slides), 1)
+
+        authors = []
+        for slide in slides:
+            self.assertEqual(slide.shapes.title.text, "6월 2주차 개발팀 주간보고")
+            table = next(shape.table for shape in slide.shapes if shape.has_table)
+            self.assertEqual(table.cell(0, 0).text, "담당")
+            authors.extend(table.cell(row, 0).text for row in range(1, len(table.rows)))
+            # 복제 슬라이드의 이미지가 원본과 같은 순서/내용으로 연결
+            self.assertEqual(_picture_blobs(slide), _picture_blobs(slides[0]))
+        self.assertEqual(authors, [f"작성자{i}" for i in range(30)])
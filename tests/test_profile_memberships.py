@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from accounts.models import prefetch_team_memberships
+from teams.models import Team, TeamMembership
+
+User = get_user_model()
+
+
+class ProfileMembershipCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.owner = User.objects.create_user(username="owner")
+        self.team_a = Team.objects.create(name="A팀", created_by=self.owner)
+        self.team_b = Team.objects.create(name="B팀", created_by=self.owner)
+
+    def _fresh(self, user):
+        return User.objects.select_related("profile").get(pk=user.pk)
+
+    def test_leader_team_takes_precedence(self) -> None:
+        user = User.objects.create_user(username="lead")
+        TeamMembership.objects.create(team=self.team_a, user=user, role="member")
+        TeamMembership.objects.create(team=self.team_b, user=user, role="leader")
+
+        profile = self._fresh(user).profile
+        with self.assertNumQueries(1):
+            self.assertEqual(profile.primary_team, self.team_b)
+            self.assertEqual(profile.current_team_role, "leader")
+            self.assertEqual(profile.department_display, "B팀")
+
+    def test_without_membership_falls_back_to_profile_role(self) -> None:
+        user = User.objects.create_user(username="solo")
+        user.profile.team_role = "admin"
+        user.profile.save()
+
+        profile = self._fresh(user).profile
+        self.assertIsNone(profile.primary_team)
+        self.assertEqual(profile.current_team_role, "admin")
+        self.assertEqual(profile.department_display, "미배정")
+
+    def test_prefetch_loads_all_users_in_one_query(self) -> None:
+        users = [User.objects.create_user(username=f"user{i}") for i in range(5)]
+        for i, user in enumerate(users[:4]):
+            TeamMembership.objects.create(team=self.team_a if i % 2 else self.team_b, user=user)
+
+        loaded = list(User.objects.filter(pk__in=[u.pk for u in users]).select_related("profile").order_by("pk"))
+        with self.assertNumQueries(1):
+            prefetch_team_memberships(loaded)
+        with self.assertNumQueries(0):
+            names = [user.profile.department_display for user in loaded]
+            roles = [user.profile.current_team_role for user in loaded]
+
+        self.assertEqual(names, ["B팀", "A팀", "B팀", "A팀", "미배정"])
+        self.assertEqual(roles[:4], ["member"] * 4)
+
+    def test_refresh_from_db_clears_cache(self) -> None:
+        user = User.objects.create_user(username="mover")
+        profile = self._fresh(user).profile
+        self.assertIsNone(profile.primary_team)
+
+        TeamMembership.objects.create(team=self.team_a, user=user)
+        profile.refresh_from_db()
+        self.assertEqual(profile.primary_team, self.team_a)
@@ -0,0 +1,81 @@
+"""
+주차 단위 핵심 조회의 실행 계획 회귀 테스트
+SQLite 는 EXPLAIN QUERY PLAN 의 'SCAN <테이블>', PostgreSQL 은 'Seq Scan on <테이블>' 이 나오면
+전체 스캔으로 보고 실패합니다. PostgreSQL 은 행이 적으면 인덱스가 있어도 순차 스캔을 고르므로
+enable_seqscan 을 끄고 사용할 수 있는 인덱스가 있는지만 확인합니다.
+"""
+import datetime
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+
+from app.services.report_review import _compute_weeks, _worklog_window_queryset
+from reports.models import ReportReview, WeeklyReport
+from teams.models import TeamMembership
+from worklog.models import Worklog
+from worklog.services import _weeks_q
+
+User = get_user_model()
+
+YEAR, WEEK = 2024, 20
+
+
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username="me")
+
+    def setUp(self) -> None:
+        if connection.vendor not in ("sqlite", "postgresql"):
+            self.skipTest(f"{connection.vendor} 실행 계획은 검사하지 않습니다.")
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertNoFullScan(self, queryset, *tables: str) -> None:
+        plan = queryset.explain()
+        for table in tables:
+            if connection.vendor == "sqlite":
+                pattern = rf"\bSCAN (TABLE )?{table}\b"
+            else:
+                pattern = rf"\bSeq Scan on {table}\b"
+            self.assertIsNone(re.search(pattern, plan), f"{table} 전체 스캔:\n{plan}")
+
+    def test_report_week_worklogs(self) -> None:
+        # 리포트 스냅샷: 해당 주차 전체 워크로그
+        self.assertNoFullScan(Worklog.objects.filter(year=YEAR, week_number=WEEK), "worklog_worklog")
+
+    def test_review_window_worklogs(self) -> None:
+        # 배치 리뷰 대상 판정: 4주 범위 워크로그
+        queryset = _worklog_window_queryset(_compute_weeks(datetime.date(2024, 5, 17))).filter(
+            author_id__in=[self.user.pk]
+        )
+        self.assertNoFullScan(queryset, "worklog_worklog")
+
+    def test_batch_review_targets(self) -> None:
+        queryset = User.objects.filter(
+            teams__isnull=False, worklogs__year=YEAR, worklogs__week_number=WEEK
+        ).distinct()
+        self.assertNoFullScan(queryset, "worklog_worklog")
+
+    def test_week_reviews(self) -> None:
+        # 리포트 상세: 해당 주차 리뷰가 있는 사용자
+        queryset = ReportReview.objects.filter(year=YEAR, week_number=WEEK).values_list("user", flat=True)
+        self.assertNoFullScan(queryset, "reports_reportreview")
+
+    def test_team_week_report(self) -> None:
+        self.assertNoFullScan(
+            WeeklyReport.objects.filter(year=YEAR, week_number=WEEK, team=1), "reports_weeklyreport"
+        )
+
+    def test_locked_weeks(self) -> None:
+        user_teams = TeamMembership.objects.filter(user=self.user).values("team_id")
+        queryset = WeeklyReport.objects.filter(
+            _weeks_q([(YEAR, WEEK), (YEAR, WEEK - 1)]),
+            Q(team__isnull=True) | Q(team_id__in=user_teams),
+            editable=False,
+        ).values_list("year", "week_number")
+        self.assertNoFullScan(queryset, "reports_weeklyreport")
@@ -0,0 +1,87 @@
+import io
+import shutil
+import tempfile
+import zipfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from batch import jobs
+from batch.models import BatchJob
+from reports.models import WeeklyReport
+from reports.services.report_pack import build_report_pack, pack_reports, parse_week, report_pack_path
+from teams.models import Team, TeamMembership
+from worklog.models import Worklog
+
+User = get_user_model()
+
+
+class ReportPackTests(TestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root, REPORT_PACK_WORKERS=1)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.admin = User.objects.create_user(username="admin", password="secret", is_staff=True)
+        self.admin.profile.is_first_login = False
+        self.admin.profile.save()
+        self.dev = Team.objects.create(name="개발팀", created_by=self.admin)
+        self.ops = Team.objects.create(name="운영팀", created_by=self.admin)
+        member = User.objects.create_user(username="kim")
+        TeamMembership.objects.create(team=self.dev, user=member)
+        for year, week in [(2023, 52), (2024, 1), (2024, 2), (2024, 3)]:
+            for team in (self.dev, self.ops):
+                WeeklyReport.objects.create(year=year, week_number=week, title="주간보고", team=team, created_by=self.admin)
+            Worklog.objects.create(author=member, year=year, week_number=week, this_week_work=f"{week}주차 업무")
+
+    def test_week_range_spans_years_and_filters_team(self) -> None:
+        self.assertEqual(parse_week("2024-W02"), (2024, 2))
+        with self.assertRaises(ValueError):
+            parse_week("2024-60")
+
+        reports = pack_reports((2023, 52), (2024, 2), team_id=self.dev.pk)
+
+        self.assertEqual([(r.year, r.week_number) for r in reports], [(2023, 52), (2024, 1), (2024, 2)])
+        self.assertEqual(pack_reports((2023, 52), (2024, 2)).count(), 6)
+
+    def test_build_pack_writes_all_files_and_reports_progress(self) -> None:
+        reports = pack_reports((2024, 1), (2024, 2), team_id=self.dev.pk)
+        output = report_pack_path((2024, 1), (2024, 2), self.dev.pk)
+        progress = []
+
+        file_count = build_report_pack([r.pk for r in reports], output, progress=lambda *p: progress.append(p))
+
+        self.assertEqual(file_count, 4)
+        self.assertEqual(progress, [(0, 2), (1, 2), (2, 2)])
+        with zipfile.ZipFile(output) as archive:
+            names = archive.namelist()
+            self.assertEqual(len(names), 4)
+            self.assertTrue(all(name.startswith(("2024-W01/", "2024-W02/")) for name in names))
+            xlsx_name = next(name for name in names if name.startswith("2024-W02/") and name.endswith(".xlsx"))
+            sheet = load_workbook(io.BytesIO(archive.read(xlsx_name))).active
+            self.assertEqual(sheet["B2"].value, "• 2주차 업무")
+
+    def test_batch_job_and_download(self) -> None:
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse("batch:export_report_pack"),
+            {"team_id": self.ops.pk, "start_week": "2024-3", "end_week": "2023-52"},
+        )
+        self.assertEqual(response.status_code, 202)
+        job = BatchJob.objects.get(pk=response.json()["job"]["id"])
+        self.assertEqual(job.args, ["2023-52", "2024-3", "--team", str(self.ops.pk)])
+
+        job = jobs.run_job(jobs.claim_next_job("worker-a"))
+        self.assertEqual(job.status, BatchJob.STATUS_SUCCEEDED, job.output)
+        self.assertEqual((job.progress_current, job.progress_total), (4, 4))
+        self.assertIsNotNone(job.to_dict()["download_url"])
+
+        response = self.client.get(job.download_url)
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as archive:
+            self.assertEqual(len(archive.namelist()), 8)
@@ -0,0 +1,92 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from reports.models import WeeklyReport
+from reports.services.report_snapshot import get_report_snapshot
+from teams.models import Team, TeamMembership
+from worklog.models import Worklog
+
+User = get_user_model()
+
+YEAR, WEEK = 2024, 20
+
+
+class ReportSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.manager = User.objects.create_user(username="manager", password="secret")
+        self.manager.profile.is_first_login = False
+        self.manager.profile.save()
+        self.team = Team.objects.create(name="개발팀", created_by=self.manager)
+        self.report = WeeklyReport.objects.create(
+            year=YEAR, week_number=WEEK, title="주간보고", team=self.team, created_by=self.manager
+        )
+
+        self.kim = self._member("kim", "김", "철수", "과장")
+        self.lee = self._member("lee", "이", "영희", "대리")
+        outsider = User.objects.create_user(username="outsider")
+        Worklog.objects.create(author=outsider, year=YEAR, week_number=WEEK, this_week_work="외부 업무")
+        self.kim_log = Worklog.objects.create(
+            author=self.kim, year=YEAR, week_number=WEEK, display_order=2,
+            this_week_work="## 배포\n**긴급** 패치 적용", next_week_plan="",
+        )
+        Worklog.objects.create(
+            author=self.lee, year=YEAR, week_number=WEEK, display_order=1,
+            this_week_work="<p>테스트 <strong>완료</strong></p>", next_week_plan="- 회고",
+        )
+
+    def _member(self, username, last, first, position):
+        user = User.objects.create_user(username=username)
+        profile = user.profile
+        profile.last_name_ko, profile.first_name_ko, profile.position = last, first, position
+        profile.save()
+        TeamMembership.objects.create(team=self.team, user=user)
+        return user
+
+    def test_entries_are_team_filtered_ordered_and_precomputed(self) -> None:
+        snapshot = get_report_snapshot(self.report)
+
+        self.assertEqual([entry.author_name for entry in snapshot.entries], ["이영희", "김철수"])
+        lee, kim = snapshot.entries
+        self.assertEqual(lee.display_name, "이영희(대리)")
+        self.assertEqual(lee.meta_text, "대리 / 개발팀")
+        self.assertEqual(lee.this_week_pptx, "테스트 **완료**")
+        self.assertEqual(lee.next_week_plain, "• 회고")
+        self.assertEqual(kim.this_week_plain, "• 배포\n• 긴급 패치 적용")
+        self.assertEqual(kim.next_week_pptx, "작성된 계획이 없습니다.")
+        self.assertIn("<h2", kim.this_week_html)
+
+    def test_cache_reused_until_worklog_changes(self) -> None:
+        first = get_report_snapshot(self.report)
+
+        # 버전 확인 1회만 실행
+        with self.assertNumQueries(1):
+            cached = get_report_snapshot(self.report)
+        self.assertEqual([e.author_name for e in cached.entries], [e.author_name for e in first.entries])
+
+        self.kim_log.this_week_work = "변경된 업무"
+        self.kim_log.save()
+        refreshed = get_report_snapshot(self.report)
+        self.assertNotEqual(refreshed.version, first.version)
+        self.assertEqual(refreshed.entries[1].this_week_plain, "• 변경된 업무")
+
+    def test_views_and_exports_use_snapshot(self) -> None:
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse("weekly_report_detail", args=[self.report.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "<strong>완료</strong>", html=False)
+
+        response = self.client.get(reverse("export_weekly_report_excel", args=[self.report.pk]))
+        self.assertEqual(response.status_code, 200)
+        sheet = load_workbook(io.BytesIO(b"".join(response.streaming_content))).active
+        self.assertEqual([sheet["A2"].value, sheet["A3"].value, sheet["A4"].value], ["이영희(대리)", "김철수(과장)", None])
+
+        response = self.client.get(reverse("export_weekly_report_pptx", args=[self.report.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"PK"))
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from app.services import review_batch
+from common.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TokenBucketTests(TestCase):
+    def test_allows_burst_then_paces_calls(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=60, capacity=2, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_zero_rate_is_unlimited(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=0, clock=clock, sleep=clock.sleep)
+        for _ in range(10):
+            bucket.acquire()
+        self.assertEqual(clock.now, 0.0)
+
+
+class RunReviewBatchTests(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.users = [User.objects.create_user(username=f"user{i}") for i in range(3)]
+
+    @patch("app.services.review_batch.time.sleep")
+    @patch("app.services.review_batch.review_last_4_weeks")
+    def test_retries_handled_exceptions_with_backoff(self, mock_review: MagicMock, mock_sleep: MagicMock) -> None:
+        mock_review.side_effect = [TimeoutError("timeout"), {"summary": "ok"}, {"summary": "ok"}, {"summary": "ok"}]
+
+        summary = review_batch.run_review_batch(
+            self.users, concurrency=1, rate_per_minute=0, max_retries=2, backoff_seconds=1
+        )
+
+        self.assertEqual(summary.success_count, 3)
+        self.assertEqual(summary.retry_count, 1)
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertTrue(all(call.kwargs["raise_errors"] for call in mock_review.call_args_list))
+
+    @patch("app.services.review_batch.time.sleep")
+    @patch("app.services.review_batch.review_last_4_weeks")
+    def test_gives_up_after_max_retries(self, mock_review: MagicMock, _mock_sleep: MagicMock) -> None:
+        mock_review.side_effect = TimeoutError("timeout")
+
+        summary = review_batch.run_review_batch(
+            self.users[:1], concurrency=1, rate_per_minute=0, max_retries=2, backoff_seconds=0
+        )
+
+        self.assertEqual(summary.fail_count, 1)
+        self.assertEqual(summary.results[0].attempts, 3)
+        self.assertEqual(summary.results[0].error, "timeout")
+
+    @patch("app.services.review_batch.review_last_4_weeks")
+    def test_fallback_error_counts_as_failure(self, mock_review: MagicMock) -> None:
+        mock_review.return_value = {"summary": "AI 점검실패", "error": "empty_response"}
+
+        summary = review_batch.run_review_batch(self.users[:1], concurrency=1, rate_per_minute=0)
+
+        self.assertEqual(summary.fail_count, 1)
+        self.assertEqual(summary.results[0].attempts, 1)
+
+    def test_latency_percentiles(self) -> None:
+        summary = review_batch.ReviewBatchSummary(
+            results=[
+                review_batch.ReviewJobResult(user_id=i, username=str(i), success=True, attempts=1, latency=float(i))
+                for i in range(1, 11)
+            ],
+            elapsed=30.0,
+        )
+        stats = summary.latency_percentiles()
+        self.assertEqual(stats["p50"], 5.0)
+        self.assertEqual(stats["p90"], 9.0)
+        self.assertEqual(stats["max"], 10.0)
+        self.assertEqual(summary.throughput_per_minute, 20.0)
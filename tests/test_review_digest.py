@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from app.services import report_review
+from reports.models import ReportReview
+from worklog.models import Worklog
+
+
+class FindReviewsToRefreshTests(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.anchor = date(2024, 6, 24)  # Monday of ISO week 26
+        self.fresh, self.edited, self.missing = (
+            User.objects.create_user(username=name) for name in ("fresh", "edited", "missing")
+        )
+        for user in (self.fresh, self.edited, self.missing):
+            Worklog.objects.create(author=user, year=2024, week_number=26, this_week_work="실적", next_week_plan="계획")
+        for user in (self.fresh, self.edited):
+            self._save_review(user)
+
+    def _save_review(self, user) -> None:
+        windows = report_review._compute_weeks(self.anchor)
+        digest = report_review.compute_input_digest(report_review._load_worklog_map(user, windows), windows)
+        ReportReview.objects.create(user=user, year=2024, week_number=26, review_content={}, input_digest=digest)
+
+    def test_detects_missing_and_edited_reviews(self) -> None:
+        Worklog.objects.filter(author=self.edited, week_number=26).update(this_week_work="수정된 실적")
+
+        missing, stale = report_review.find_reviews_to_refresh(
+            [self.fresh.id, self.edited.id, self.missing.id], self.anchor
+        )
+
+        self.assertEqual(missing, {self.missing.id})
+        self.assertEqual(stale, {self.edited.id})
+
+    def test_worklog_added_in_earlier_week_marks_review_stale(self) -> None:
+        Worklog.objects.create(author=self.fresh, year=2024, week_number=24, this_week_work="추가", next_week_plan="")
+
+        _missing, stale = report_review.find_reviews_to_refresh([self.fresh.id], self.anchor)
+
+        self.assertEqual(stale, {self.fresh.id})
+
+    def test_worklog_outside_window_is_ignored(self) -> None:
+        Worklog.objects.create(author=self.fresh, year=2024, week_number=22, this_week_work="오래됨", next_week_plan="")
+
+        _missing, stale = report_review.find_reviews_to_refresh([self.fresh.id], self.anchor)
+
+        self.assertEqual(stale, set())
+
+    def test_legacy_review_without_digest_uses_timestamps(self) -> None:
+        review = ReportReview.objects.get(user=self.fresh)
+        ReportReview.objects.filter(pk=review.pk).update(input_digest="")
+        Worklog.objects.filter(author=self.fresh).update(updated_at=review.updated_at - timedelta(hours=1))
+
+        _missing, stale = report_review.find_reviews_to_refresh([self.fresh.id], self.anchor)
+        self.assertEqual(stale, set())
+
+        Worklog.objects.filter(author=self.fresh).update(updated_at=review.updated_at + timedelta(hours=1))
+        _missing, stale = report_review.find_reviews_to_refresh([self.fresh.id], self.anchor)
+        self.assertEqual(stale, {self.fresh.id})
+
+    @patch("app.services.report_review.generate_gemini_content", return_value=MagicMock(text="not json"))
+    @patch("app.services.report_review.get_gemini_client", return_value=MagicMock())
+    def test_failed_review_is_retried(self, _client, _generate) -> None:
+        result = report_review.review_last_4_weeks(self.missing, as_of=self.anchor)
+
+        self.assertEqual(result["error"], "malformed_json")
+        self.assertEqual(ReportReview.objects.get(user=self.missing).input_digest, "")
+        _missing, stale = report_review.find_reviews_to_refresh([self.missing.id, self.fresh.id], self.anchor)
+        self.assertEqual(stale, {self.missing.id})
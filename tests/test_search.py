@@ -0,0 +1,113 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from assets.models import System
+from hooks.models import Incident
+from search.models import SearchDocument
+from search.services import ngram_tokens, search_documents
+from service.models import ServiceRequest
+from task.models import Task
+from worklog.models import Worklog
+
+User = get_user_model()
+
+
+class SearchTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="user", password="secret")
+        self.user.profile.is_first_login = False
+        self.user.profile.save()
+        self.other = User.objects.create_user(username="other")
+
+    def _titles(self, query, user=None, **kwargs):
+        results = search_documents(user or self.user, query, **kwargs)
+        return [document.title for document in results["page_obj"]]
+
+    def test_ngram_tokens(self) -> None:
+        self.assertEqual(ngram_tokens("서버장애 DB_A 점"), "서버 버장 장애 애 db b a 점")
+        self.assertEqual(ngram_tokens(None), "")
+
+    def test_korean_substring_and_ranking(self) -> None:
+        ServiceRequest.objects.create(req_title="계정 요청", req_details="메일서버장애 조치 요청")
+        System.objects.create(name="메일서버", description="사내 메일")
+        Incident.objects.create(title="DB 응답 지연", fingerprint="fp-1", oname="db01")
+
+        # 제목 일치가 본문 일치보다 앞
+        self.assertEqual(self._titles("서버"), ["메일서버 (SAM-001)", "계정 요청"])
+        self.assertEqual(self._titles("버장애"), ["계정 요청"])
+        self.assertEqual(self._titles("메일 조치"), ["계정 요청"])
+        self.assertEqual(self._titles("애"), ["계정 요청"])
+        self.assertEqual(self._titles("DB01"), ["DB 응답 지연"])
+        self.assertEqual(self._titles("서장"), [])
+        self.assertIsNone(search_documents(self.user, "!!"))
+
+    def test_permission_filter(self) -> None:
+        own = Task.objects.create(author=self.user, title="배포 점검")
+        assigned = Task.objects.create(author=self.other, title="배포 준비")
+        hidden = Task.objects.create(author=self.other, title="배포 회고")
+        assigned.assigned_to.add(self.user)
+        Worklog.objects.create(author=self.user, year=2024, week_number=5, this_week_work="<p>배포 진행</p>")
+        Worklog.objects.create(author=self.other, year=2024, week_number=5, this_week_work="배포 진행")
+
+        results = search_documents(self.user, "배포")
+
+        self.assertEqual(
+            sorted(document.url for document in results["page_obj"]),
+            sorted([
+                reverse("task_detail", args=[own.pk]),
+                reverse("task_detail", args=[assigned.pk]),
+                reverse("worklog_detail", args=[Worklog.objects.get(author=self.user).pk]),
+            ]),
+        )
+        self.assertNotIn(hidden.title, self._titles("회고"))
+        self.assertEqual(self._titles("회고", user=self.other), ["배포 회고"])
+        counts = {key: count for key, _, count in results["kind_counts"]}
+        self.assertEqual((counts["task"], counts["worklog"], results["total"]), (2, 1, 3))
+
+    def test_index_follows_save_and_delete(self) -> None:
+        task = Task.objects.create(author=self.user, title="백업 정책")
+        task.title = "복구 정책"
+        task.save()
+
+        self.assertEqual(self._titles("백업"), [])
+        self.assertEqual(self._titles("복구"), ["복구 정책"])
+
+        task.delete()
+        self.assertEqual(self._titles("복구"), [])
+        self.assertFalse(SearchDocument.objects.exists())
+
+    @override_settings(SEARCH_PAGE_SIZE=2)
+    def test_kind_filter_and_pagination(self) -> None:
+        for i in range(3):
+            System.objects.create(name=f"모니터링{i}")
+        Incident.objects.create(title="모니터링 경보", fingerprint="fp-2")
+
+        results = search_documents(self.user, "모니터링", kind="system", page=2)
+
+        self.assertEqual(results["page_obj"].paginator.count, 3)
+        self.assertEqual(len(results["page_obj"].object_list), 1)
+        self.assertEqual(results["total"], 4)
+
+    def test_rebuild_command(self) -> None:
+        System.objects.create(name="그룹웨어")
+        Task.objects.create(author=self.user, title="그룹웨어 점검")
+        SearchDocument.objects.all().delete()
+
+        call_command("rebuild_search_index", stdout=io.StringIO())
+
+        self.assertEqual(len(self._titles("그룹웨어")), 2)
+        call_command("rebuild_search_index", kind=["system"], stdout=io.StringIO())
+        self.assertEqual(SearchDocument.objects.count(), 2)
+
+    def test_view(self) -> None:
+        System.objects.create(name="결재시스템")
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("search"), {"q": "결재"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse("assets:system_detail", args=[System.objects.get().pk]))
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.contrib.admin.sites import site
+from django.test import RequestFactory, TestCase
+
+from common import counters
+from common.context_processors import service_request_counts
+from notifications.context_processors import notifications
+from notifications.models import Notification
+from notifications.utils import mark_notifications_as_read
+from service.models import ServiceRequest
+
+
+class SidebarCounterTests(TestCase):
+    def setUp(self) -> None:
+        caches[counters.CACHE_ALIAS].clear()
+        self.user = get_user_model().objects.create_user(username="worker")
+        self.other = get_user_model().objects.create_user(username="other")
+        request = RequestFactory().get("/")
+        request.user = self.user
+        self.request = request
+
+    def test_context_processors_hit_cache_without_queries(self) -> None:
+        ServiceRequest.objects.create(status="N", assignee=self.user)
+        ServiceRequest.objects.create(status="A", assignee=self.other)
+        Notification.objects.create(user=self.user, notification_type="task_due", title="t", message="m")
+
+        first = service_request_counts(self.request)
+        notifications(self.request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(service_request_counts(self.request), first)
+            context = notifications(self.request)
+
+        self.assertEqual(first["count_sr_reception"], 1)
+        self.assertEqual(first["count_sr_approval"], 1)
+        self.assertEqual(context["unread_notifications_count"], 1)
+
+    def test_service_request_changes_invalidate_counts(self) -> None:
+        sr = ServiceRequest.objects.create(status="N", assignee=self.user)
+        self.assertEqual(service_request_counts(self.request)["count_sr_reception"], 1)
+
+        sr.status = "P"
+        sr.save()
+        counts = service_request_counts(self.request)
+        self.assertEqual(counts["count_sr_reception"], 0)
+        self.assertEqual(counts["count_sr_processing"], 1)
+
+        sr.delete()
+        self.assertEqual(service_request_counts(self.request)["count_sr_processing"], 0)
+
+    def test_notification_changes_invalidate_counts(self) -> None:
+        self.assertEqual(notifications(self.request)["unread_notifications_count"], 0)
+
+        Notification.objects.create(user=self.user, notification_type="task_due", title="t", message="m")
+        self.assertEqual(notifications(self.request)["unread_notifications_count"], 1)
+
+        mark_notifications_as_read(self.user)
+        self.assertEqual(notifications(self.request)["unread_notifications_count"], 0)
+
+    def test_anonymous_user_has_no_counters(self) -> None:
+        self.request.user = AnonymousUser()
+        with self.assertNumQueries(0):
+            self.assertEqual(service_request_counts(self.request), {})
+            self.assertEqual(notifications(self.request)["unread_notifications_count"], 0)
+
+    def test_admin_actions_on_filtered_changelist_invalidate_counts(self) -> None:
+        Notification.objects.create(user=self.user, notification_type="task_due", title="t", message="m")
+        self.assertEqual(notifications(self.request)["unread_notifications_count"], 1)
+        admin = site._registry[Notification]
+
+        with patch.object(admin, "message_user"):
+            # 읽지 않음(is_read=False)으로 필터된 목록에서 읽음 처리
+            admin.mark_as_read(self.request, Notification.objects.filter(is_read=False))
+            self.assertEqual(notifications(self.request)["unread_notifications_count"], 0)
+
+            admin.mark_as_unread(self.request, Notification.objects.filter(is_read=True))
+            self.assertEqual(notifications(self.request)["unread_notifications_count"], 1)
@@ -0,0 +1,137 @@
+import io
+
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from assets.models import AssetHistory, System
+from assets.services import SystemImportError, import_systems
+from search.services import search_documents
+
+User = get_user_model()
+
+
+class SystemImportTests(TestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_user(username="admin", password="secret")
+        self.admin.profile.is_first_login = False
+        self.admin.profile.save()
+        self.kim = User.objects.create_user(username="kim")
+        self.kim.profile.last_name_ko, self.kim.profile.first_name_ko = "김", "철수"
+        self.kim.profile.save()
+        self.groupware = System.objects.create(name="그룹웨어", system_type="SAM", status="OPER")  # SAM-001
+        System.objects.create(name="보안관제", system_type="SEC")  # SEC-001
+
+    def _sheet(self, rows):
+        return pd.DataFrame(rows, columns=["시스템코드", "시스템명", "구분", "설명", "상태", "담당자"])
+
+    def test_applies_creates_updates_and_row_errors(self) -> None:
+        df = self._sheet([
+            ["SAM-001", "그룹웨어", "일반", None, "중단", "김철수"],
+            [None, "신규보안", "보안", "설명", None, "kim"],
+            ["SAM-010", "코드지정", None, None, "개발중", None],
+            [None, "신규일반", None, None, None, "없는사람"],
+            [None, None, None, None, None, None],
+            ["SAM-010", "중복", None, None, None, None],
+            ["SEC-001", "보안관제", "보안", None, "운영중", None],
+        ])
+
+        result = import_systems(df, user=self.admin)
+
+        self.assertEqual((result.created_count, result.updated_count, result.unchanged_count), (3, 1, 1))
+        self.assertEqual([(row.row_number, row.action) for row in result.errors], [(6, "error"), (7, "error")])
+        self.groupware.refresh_from_db()
+        self.assertEqual((self.groupware.status, self.groupware.manager), ("SUSP", self.kim))
+        self.assertEqual(System.objects.get(name="신규보안").code, "SEC-002")
+        self.assertEqual(System.objects.get(name="신규보안").manager, self.kim)
+        # 엑셀에 지정된 SAM-010 다음 번호로 채번
+        self.assertEqual(System.objects.get(name="신규일반").code, "SAM-011")
+        self.assertIsNone(System.objects.get(name="신규일반").manager)
+        update = AssetHistory.objects.get(system=self.groupware, comment="엑셀 일괄 수정")
+        self.assertEqual(
+            update.changed_fields,
+            {"status": {"old": "OPER", "new": "SUSP"}, "manager": {"old": None, "new": "kim"}},
+        )
+        self.assertEqual(AssetHistory.objects.filter(comment="엑셀 일괄 등록").count(), 3)
+
+    def test_query_count_does_not_grow_with_rows(self) -> None:
+        def run(count, status) -> int:
+            df = self._sheet([["SAM-001", "그룹웨어", None, None, status, "kim"]] + [
+                [None, f"시스템{count}-{i}", None, None, None, "김철수"] for i in range(count)
+            ])
+            with CaptureQueriesContext(connection) as ctx:
+                import_systems(df, user=self.admin)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(5, "중단"), run(50, "폐기"))
+
+    def test_dry_run_does_not_write(self) -> None:
+        df = self._sheet([["SAM-001", "그룹웨어", None, None, "폐기", None], [None, "신규", None, None, None, None]])
+        histories = AssetHistory.objects.count()
+
+        result = import_systems(df, user=self.admin, dry_run=True)
+
+        self.assertEqual([row.action for row in result.rows], ["update", "create"])
+        self.assertEqual(result.rows[1].code, "SAM-002")
+        self.assertEqual(System.objects.get(pk=self.groupware.pk).status, "OPER")
+        self.assertEqual(System.objects.count(), 2)
+        self.assertEqual(AssetHistory.objects.count(), histories)
+
+    def test_imported_systems_are_searchable(self) -> None:
+        df = self._sheet([["SAM-001", "전자결재", None, None, None, None], [None, "문서중앙화", None, None, None, None]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            import_systems(df, user=self.admin)
+
+        def titles(query):
+            return [document.title for document in search_documents(self.admin, query)["page_obj"]]
+
+        self.assertEqual(titles("중앙화"), ["문서중앙화 (SAM-002)"])
+        self.assertEqual(titles("전자결재"), ["전자결재 (SAM-001)"])
+        self.assertEqual(titles("그룹웨어"), [])
+
+    def test_invalid_field_rows_are_reported_not_written(self) -> None:
+        long_name = "가" * 101
+        df = self._sheet([
+            [None, long_name, None, None, None, None],
+            ["SAM-001", long_name, None, None, None, None],
+            ["X" * 51, "긴코드", None, None, None, None],
+            [None, "정상", None, None, None, None],
+        ])
+
+        preview = import_systems(df, user=self.admin, dry_run=True)
+        result = import_systems(df, user=self.admin)
+
+        for outcome in (preview, result):
+            self.assertEqual([row.action for row in outcome.rows], ["error", "error", "error", "create"])
+            self.assertIn("시스템명", outcome.rows[0].error)
+            self.assertIn("시스템코드", outcome.rows[2].error)
+        # 오류 행은 채번하지 않음
+        self.assertEqual(result.rows[3].code, "SAM-002")
+        self.assertEqual(System.objects.get(pk=self.groupware.pk).name, "그룹웨어")
+        self.assertTrue(System.objects.filter(name="정상").exists())
+
+    def test_missing_name_column(self) -> None:
+        with self.assertRaises(SystemImportError):
+            import_systems(pd.DataFrame({"시스템코드": ["SAM-001"]}))
+
+    def test_view_preview_and_apply(self) -> None:
+        buffer = io.BytesIO()
+        self._sheet([[None, "업로드시스템", "보안", None, None, None]]).to_excel(buffer, index=False)
+        self.client.force_login(self.admin)
+
+        def upload(**data):
+            excel = SimpleUploadedFile("systems.xlsx", buffer.getvalue())
+            return self.client.post(reverse("assets:system_bulk_update"), {"excel_file": excel, **data})
+
+        preview = upload(dry_run="on")
+        self.assertTemplateUsed(preview, "assets/system_import_preview.html")
+        self.assertFalse(System.objects.filter(name="업로드시스템").exists())
+
+        response = upload()
+        self.assertRedirects(response, reverse("assets:system_list"), fetch_redirect_response=False)
+        self.assertEqual(System.objects.get(name="업로드시스템").code, "SEC-002")
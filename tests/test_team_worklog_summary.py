@@ -0,0 +1,70 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common import counters
+from reports.views import group_worklogs_by_team
+from teams.models import Team, TeamMembership
+from worklog.models import Worklog
+
+User = get_user_model()
+
+YEAR, WEEK = 2024, 20
+
+
+class TeamWorklogSummaryTests(TestCase):
+    def setUp(self) -> None:
+        self.viewer = User.objects.create_user(username="viewer", password="secret")
+        self.viewer.profile.is_first_login = False
+        self.viewer.profile.save()
+        self.team_a = Team.objects.create(name="A팀", created_by=self.viewer)
+        self.team_b = Team.objects.create(name="B팀", created_by=self.viewer)
+
+    def _make_authors(self, count: int, start: int = 0) -> None:
+        for i in range(start, start + count):
+            user = User.objects.create_user(username=f"author{i:03d}")
+            if i % 10 == 0:
+                pass  # 소속 팀 없음 -> 미분류
+            elif i % 10 == 1:
+                TeamMembership.objects.create(team=self.team_a, user=user, role="leader")
+                TeamMembership.objects.create(team=self.team_b, user=user)
+            else:
+                TeamMembership.objects.create(team=self.team_a if i % 2 else self.team_b, user=user)
+            Worklog.objects.create(author=user, year=YEAR, week_number=WEEK, this_week_work="업무")
+
+    def _worklogs(self):
+        return Worklog.objects.filter(year=YEAR, week_number=WEEK).select_related("author", "author__profile")
+
+    def test_groups_200_authors_in_constant_queries(self) -> None:
+        self._make_authors(200)
+
+        # 워크로그(+작성자/프로필) 1회, 팀 소속(+팀) 1회
+        with self.assertNumQueries(2):
+            summary = group_worklogs_by_team(self._worklogs())
+
+        self.assertEqual(len(summary["미분류"]), 20)
+        self.assertEqual(sum(len(members) for members in summary.values()), 220)  # 두 팀 소속 20명은 양쪽에 포함
+        leader = next(m for m in summary["A팀"] if m["worklog"].author.username == "author001")
+        self.assertEqual(leader["role"], "팀장")
+        self.assertEqual(
+            next(m for m in summary["B팀"] if m["worklog"].author.username == "author001")["role"], "멤버"
+        )
+
+    def test_view_query_count_does_not_grow_with_authors(self) -> None:
+        self.client.force_login(self.viewer)
+        url = reverse("team_worklog_summary") + f"?year={YEAR}&week_number={WEEK}"
+
+        def measure() -> int:
+            caches[counters.CACHE_ALIAS].clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries)
+
+        self._make_authors(5)
+        small = measure()
+        self._make_authors(195, start=5)
+        self.assertEqual(measure(), small)
@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+
+from common import text_normalize
+from common.text_normalize import clear_text_cache, html_to_text, markdown_to_plain_text, markdown_to_pptx_text
+
+
+class TextNormalizeTests(SimpleTestCase):
+    def setUp(self) -> None:
+        clear_text_cache()
+
+    def test_plain_text_bullets_and_long_line_split(self) -> None:
+        long_line = (
+            "서버 정기 점검과 보안 패치를 모두 완료했습니다. 백업 정책과 보관 주기를 전면 검토하고, "
+            "장애 대응 절차를 문서화했습니다; 다음 주에는 전 부서 대상 모의 훈련을 진행할 예정입니다."
+        )
+        text = f"## 배포\n**긴급** 패치 적용<br>1. `hotfix` 반영\n\n- {long_line}"
+
+        self.assertEqual(
+            markdown_to_plain_text(text),
+            "• 배포\n• 긴급 패치 적용\n• hotfix 반영\n"
+            "• 서버 정기 점검과 보안 패치를 모두 완료했습니다.백업 정책과 보관 주기를 전면 검토하고,\n"
+            "• 장애 대응 절차를 문서화했습니다;다음 주에는 전 부서 대상 모의 훈련을 진행할 예정입니다.",
+        )
+        self.assertEqual(markdown_to_plain_text(None), "")
+
+    def test_pptx_text_keeps_bold(self) -> None:
+        text = '<p>테스트 <strong>완료</strong></p><p><span style="font-weight: bold">중요</span> &amp; `코드`</p>\n\n\n\n# 끝'
+
+        self.assertEqual(markdown_to_pptx_text(text), "테스트 **완료**\n**중요** & 코드\n\n끝")
+
+    def test_html_to_text_for_prompts(self) -> None:
+        self.assertEqual(html_to_text("<div>가</div><br><br>나&lt;다</p>"), "가\n나<다")
+        self.assertEqual(html_to_text(""), "")
+
+    def test_results_are_memoized(self) -> None:
+        text = "- 동일한 본문"
+        markdown_to_plain_text(text)
+        markdown_to_plain_text(text)
+
+        info = text_normalize._markdown_to_plain_text.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
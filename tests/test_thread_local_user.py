@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from assets.models import AssetHistory, System
+from common.middleware import get_current_user
+
+User = get_user_model()
+
+
+class ThreadLocalUserTests(TestCase):
+    def test_user_does_not_leak_past_request(self) -> None:
+        user = User.objects.create_user(username="viewer", password="secret")
+        user.profile.is_first_login = False
+        user.profile.save()
+        self.client.force_login(user)
+
+        self.client.get(reverse("assets:system_list"))
+
+        self.assertIsNone(get_current_user())
+        # 요청 밖(배치/셸)에서 생긴 이력에 직전 요청 사용자가 기록되지 않아야 함
+        system = System.objects.create(name="배치 생성")
+        self.assertIsNone(AssetHistory.objects.get(system=system, action="CREATE").user)
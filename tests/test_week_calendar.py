@@ -0,0 +1,51 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from common.week_calendar import WeekKey, month_week_label, week_info, weeks_in_year
+from reports.models import WeeklyReport
+from worklog.models import Worklog
+
+
+class WeekCalendarTests(SimpleTestCase):
+    def test_week_info_matches_iso_calendar(self) -> None:
+        week = week_info(2024, 20)
+
+        self.assertEqual(week.start, datetime.date(2024, 5, 13))
+        self.assertEqual(week.end, datetime.date(2024, 5, 17))
+        self.assertEqual(week.label, "5월 2주차")
+
+    def test_label_follows_month_of_monday(self) -> None:
+        # 2020-W53: 12/28(월)~1/1(금) -> 12월 기준
+        self.assertEqual(month_week_label(2020, 53), "12월 4주차")
+        # 2024-W01: 2024/1/1(월)
+        self.assertEqual(month_week_label(2024, 1), "1월 1주차")
+        # 2024-W44: 10/28(월)~11/1(금)
+        self.assertEqual(month_week_label(2024, 44), "10월 4주차")
+
+    def test_week_count_per_year(self) -> None:
+        self.assertEqual(weeks_in_year(2020), 53)
+        self.assertEqual(weeks_in_year(2021), 52)
+        self.assertEqual(week_info(2020, 53).start, datetime.date(2020, 12, 28))
+        with self.assertRaises(ValueError):
+            week_info(2021, 53)
+        with self.assertRaises(ValueError):
+            week_info(2021, 0)
+
+    def test_week_key_navigation(self) -> None:
+        key = WeekKey(2021, 1)
+
+        self.assertEqual(key.previous(), WeekKey(2020, 53))
+        self.assertEqual(WeekKey(2020, 53).next(), key)
+        self.assertEqual(key.shift(52), WeekKey(2022, 1))
+        self.assertEqual(WeekKey.from_date(datetime.date(2021, 1, 3)), WeekKey(2020, 53))
+        self.assertEqual(str(WeekKey(2024, 5)), "2024-W05")
+        self.assertLess(WeekKey(2020, 53), key)
+
+    def test_models_share_calendar(self) -> None:
+        worklog = Worklog(year=2024, week_number=44)
+        report = WeeklyReport(year=2024, week_number=44)
+
+        self.assertEqual(worklog.month_week_display, report.month_week_display)
+        self.assertEqual(report.week_end_date, datetime.date(2024, 11, 1))
+        self.assertEqual(worklog.week_start_date, report.week_start_date)
@@ -0,0 +1,73 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common import counters
+from worklog.models import Worklog
+from worklog.services import load_worklog_history, week_choices_json
+
+User = get_user_model()
+
+
+class WorklogHistoryTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="me", password="secret")
+        self.user.profile.is_first_login = False
+        self.user.profile.save()
+        other = User.objects.create_user(username="other")
+        Worklog.objects.create(author=other, year=2020, week_number=53, next_week_plan="남의 계획")
+
+    def _log(self, year, week):
+        return Worklog.objects.create(
+            author=self.user, year=year, week_number=week,
+            this_week_work=f"{year}-{week} 실적", next_week_plan=f"{year}-{week} 계획",
+        )
+
+    def test_pairs_each_week_with_iso_predecessor_in_one_query(self) -> None:
+        self._log(2020, 52)  # 기간 밖이지만 2020-53 의 전주
+        self._log(2020, 53)
+        self._log(2021, 1)
+        self._log(2021, 3)  # 2021-2 없음
+
+        with self.assertNumQueries(1):
+            history = load_worklog_history(self.user.pk, (2020, 53), (2021, 3))
+
+        self.assertEqual(
+            [(h["worklog"].year, h["worklog"].week_number, h["previous_week_plan"]) for h in history],
+            [(2021, 3, ""), (2021, 1, "2020-53 계획"), (2020, 53, "2020-52 계획")],
+        )
+
+    def test_week_choices_follow_iso_week_count(self) -> None:
+        data = json.loads(week_choices_json((2020, 2021)))
+
+        self.assertEqual(len(data["2020"]), 53)
+        self.assertEqual(len(data["2021"]), 52)
+        self.assertEqual(data["2021"][0], {"week": 1, "display": "1주차 (01.04~01.08)"})
+
+    def test_history_views_query_count_does_not_grow(self) -> None:
+        self.client.force_login(self.user)
+        params = {"start_year": 2019, "start_week": 1, "end_year": 2021, "end_week": 52}
+        urls = [
+            reverse("my_worklog_history"),
+            reverse("personal_report_history"),
+        ]
+
+        def measure(url, extra=None) -> int:
+            caches[counters.CACHE_ALIAS].clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url, {**params, **(extra or {})})
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries)
+
+        self._log(2020, 10)
+        small = [measure(urls[0]), measure(urls[1], {"user_id": self.user.pk})]
+        for week in range(11, 40):
+            self._log(2020, week)
+        large = [measure(urls[0]), measure(urls[1], {"user_id": self.user.pk})]
+
+        self.assertEqual(large, small)
@@ -0,0 +1,62 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from reports.models import WeeklyReport
+from teams.models import Team, TeamMembership
+from worklog.models import Worklog
+from worklog.services import load_week_statuses, locked_weeks
+
+User = get_user_model()
+
+WEEKS = [(2024, 21), (2024, 20), (2024, 19)]
+
+
+class WorklogWeekStatusTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="me", password="secret")
+        self.user.profile.is_first_login = False
+        self.user.profile.save()
+        self.my_team = Team.objects.create(name="개발팀", created_by=self.user)
+        self.other_team = Team.objects.create(name="운영팀", created_by=self.user)
+        TeamMembership.objects.create(team=self.my_team, user=self.user)
+
+    def _report(self, week, team, editable):
+        return WeeklyReport.objects.create(
+            year=2024, week_number=week, title="주간보고", team=team, created_by=self.user, editable=editable
+        )
+
+    def test_lock_is_resolved_per_team(self) -> None:
+        # 21주차: 다른 팀만 마감 -> 입력 가능 (먼저 생성되어 .first() 로는 잘못 마감 처리되던 경우)
+        self._report(21, self.other_team, editable=False)
+        self._report(21, self.my_team, editable=True)
+        # 20주차: 내 팀 마감
+        self._report(20, self.my_team, editable=False)
+        # 19주차: 전체(팀 미지정) 리포트 마감
+        self._report(19, None, editable=False)
+
+        self.assertEqual(locked_weeks(self.user, WEEKS), {(2024, 20), (2024, 19)})
+
+    def test_statuses_loaded_in_two_queries(self) -> None:
+        worklog = Worklog.objects.create(author=self.user, year=2024, week_number=20, this_week_work="업무")
+        Worklog.objects.create(author=User.objects.create_user(username="other"), year=2024, week_number=21)
+        self._report(20, self.my_team, editable=False)
+
+        with self.assertNumQueries(2):
+            statuses = load_week_statuses(self.user, WEEKS)
+
+        self.assertEqual([s["worklog_instance"] for s in statuses], [None, worklog, None])
+        self.assertEqual([s["editable"] for s in statuses], [True, False, True])
+        self.assertEqual(statuses[1]["week_start_date"], datetime.date(2024, 5, 13))
+        self.assertEqual(statuses[1]["month_week_display"], "5월 2주차")
+
+    def test_list_view_uses_resolver(self) -> None:
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("worklog_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["weeks_data"]), 6)
+        self.assertTrue(all(week["editable"] for week in response.context["weeks_data"]))
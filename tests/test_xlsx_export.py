@@ -0,0 +1,65 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from assets.models import System
+from common.xlsx_export import BODY_STYLE, HEADER_STYLE, XlsxColumn, write_xlsx
+
+User = get_user_model()
+
+
+class WriteXlsxTests(SimpleTestCase):
+    def test_rows_are_consumed_lazily_with_named_styles(self) -> None:
+        consumed = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield (f"이름{i}", i)
+
+        buffer = io.BytesIO()
+        write_xlsx(buffer, "가" * 40, [XlsxColumn("이름", 20), XlsxColumn("번호")], rows())
+
+        self.assertEqual(consumed, [0, 1, 2])
+        ws = load_workbook(buffer).active
+        self.assertEqual(ws.title, "가" * 31)
+        self.assertEqual([[c.value for c in row] for row in ws.iter_rows()], [["이름", "번호"], ["이름0", 0], ["이름1", 1], ["이름2", 2]])
+        self.assertEqual(ws["A1"].style, HEADER_STYLE)
+        self.assertTrue(ws["A1"].font.bold)
+        self.assertEqual(ws["B3"].style, BODY_STYLE)
+        self.assertEqual(ws.column_dimensions["A"].width, 20)
+
+
+class SystemExportViewTests(TestCase):
+    def test_streams_filtered_systems(self) -> None:
+        user = User.objects.create_user(username="admin", password="secret")
+        user.profile.is_first_login = False
+        user.profile.save()
+        System.objects.create(name="그룹웨어", code="GW", manager=user, status="OPER")
+        System.objects.create(name="ERP", code="ERP", system_type="SEC", status="DEV")
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("assets:system_export"), {"q": "ERP"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        ws = load_workbook(io.BytesIO(b"".join(response.streaming_content))).active
+        self.assertEqual([c.value for c in ws[1]], ["시스템명", "시스템코드", "구분", "설명", "담당자", "상태"])
+        self.assertEqual([c.value for c in ws[2]], ["ERP", "ERP", "보안", None, None, "개발중"])
+        self.assertEqual(ws.max_row, 2)
+
+    def test_rows_follow_name_ordering(self) -> None:
+        user = User.objects.create_user(username="viewer", password="secret")
+        user.profile.is_first_login = False
+        user.profile.save()
+        for name in ("다-메일", "가-그룹웨어", "나-ERP"):
+            System.objects.create(name=name)
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("assets:system_export"))
+
+        ws = load_workbook(io.BytesIO(b"".join(response.streaming_content))).active
+        self.assertEqual([row[0].value for row in ws.iter_rows(min_row=2)], ["가-그룹웨어", "나-ERP", "다-메일"])
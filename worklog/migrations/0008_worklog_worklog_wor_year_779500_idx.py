@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('worklog', '0007_delete_worklogtask'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='worklog',
+            index=models.Index(fields=['year', 'week_number', 'author'], name='worklog_wor_year_779500_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.contrib.auth.models import User
 import datetime
 
+from common.week_calendar import month_week_label, week_info
+
 class Worklog(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='worklogs')
     year = models.IntegerField("년도")
@@ -14,6 +16,10 @@ class Worklog(models.Model):
 
     class Meta:
         unique_together = ('author', 'year', 'week_number')
+        # 주차 단위 조회(리포트 스냅샷, 리뷰 대상 집계)는 작성자 없이 (year, week_number) 로 먼저 좁힙니다.
+        indexes = [
+            models.Index(fields=['year', 'week_number', 'author']),
+        ]
         ordering = ['display_order', 'author__profile__last_name_ko', 'author__username']
 
     def __str__(self):
@@ -22,12 +28,12 @@ class Worklog(models.Model):
     @property
     def week_start_date(self):
         """ISO year, week number를 기반으로 해당 주의 월요일 날짜를 반환합니다."""
-        return datetime.date.fromisocalendar(self.year, self.week_number, 1)
+        return week_info(self.year, self.week_number).start
 
     @property
     def week_end_date(self):
         """해당 주의 금요일 날짜를 반환합니다."""
-        return self.week_start_date + datetime.timedelta(days=4)
+        return week_info(self.year, self.week_number).end
 
     @property
     def next_week_start_date(self):
@@ -42,34 +48,7 @@ class Worklog(models.Model):
     @property
     def month_week_display(self):
         """'7월 1주차'와 같은 형식으로 월별 주차를 반환합니다."""
-        start_date = self.week_start_date
-        end_date = self.week_end_date
-        
-        # 주의 시작과 끝이 같은 달인 경우
-        if start_date.month == end_date.month:
-            # 해당 월의 첫 번째 월요일을 찾아서 몇 번째 주인지 계산
-            first_monday = start_date.replace(day=1)
-            while first_monday.weekday() != 0:  # 0 = 월요일
-                first_monday += datetime.timedelta(days=1)
-            
-            week_diff = (start_date - first_monday).days // 7 + 1
-            return f"{start_date.month}월 {week_diff}주차"
-        else:
-            # 주가 두 달에 걸쳐있는 경우, 더 많은 날이 포함된 달 기준
-            if start_date.day <= 3:  # 월요일~수요일이 이전 달
-                month = end_date.month
-                first_monday = end_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (end_date - first_monday).days // 7 + 1
-            else:  # 목요일~일요일이 다음 달
-                month = start_date.month
-                first_monday = start_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (start_date - first_monday).days // 7 + 1
-            
-            return f"{month}월 {week_diff}주차"
+        return month_week_label(self.year, self.week_number)
 
     @staticmethod
     def get_current_week_info():
@@ -0,0 +1,120 @@
+"""
+주간업무 조회용 로더
+- 개인 이력 화면(my_worklog_history, personal_report_history)에서 각 주차와 전주 계획을 짝지어 보여줄 때,
+  기간 시작 전주까지 포함해 한 번의 정렬된 쿼리로 가져온 뒤 메모리에서 전주 워크로그를 찾습니다.
+- 주간업무 목록(WorklogListView)의 여러 주차 작성 여부와 입력마감 여부를 주차 수와 무관하게 한 번에 조회합니다.
+"""
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+
+from common.week_calendar import WeekKey, week_info, weeks_in_year
+from reports.models import WeeklyReport
+from teams.models import TeamMembership
+
+from .models import Worklog
+
+Week = Tuple[int, int]  # (ISO 연도, 주차)
+
+
+def previous_week(year: int, week_number: int) -> Week:
+    return tuple(WeekKey(year, week_number).previous())
+
+
+def week_range_q(start: Week, end: Week) -> Q:
+    """(연도, 주차) 기준 start 이상 end 이하 조건"""
+    (start_year, start_week), (end_year, end_week) = start, end
+    return (
+        (Q(year__gt=start_year) | Q(year=start_year, week_number__gte=start_week))
+        & (Q(year__lt=end_year) | Q(year=end_year, week_number__lte=end_week))
+    )
+
+
+def load_worklog_history(author_id: int, start: Week, end: Week) -> List[Dict]:
+    """
+    기간 내 워크로그를 최신 주차부터 [{'worklog', 'previous_week_plan'}] 로 반환합니다.
+    바로 앞 ISO 주차의 워크로그가 있을 때만 그 차주 계획을 전주 계획으로 사용합니다. (쿼리 1회)
+    """
+    try:
+        query_start = previous_week(*start)
+    except ValueError:
+        query_start = start
+    worklogs = list(
+        Worklog.objects.filter(week_range_q(query_start, end), author_id=author_id).order_by('-year', '-week_number')
+    )
+    by_week = {(log.year, log.week_number): log for log in worklogs}
+
+    history = []
+    for log in worklogs:
+        if (log.year, log.week_number) < tuple(start):
+            break
+        previous = by_week.get(previous_week(log.year, log.week_number))
+        history.append({
+            'worklog': log,
+            'previous_week_plan': previous.next_week_plan if previous else '',
+        })
+    return history
+
+
+@lru_cache(maxsize=8)
+def week_choices_json(years: Tuple[int, ...]) -> str:
+    """연도별 주차 선택 목록 (JavaScript 용 JSON). 연도 목록이 같으면 프로세스 안에서 재사용합니다."""
+    week_data = {}
+    for year in years:
+        week_data[year] = []
+        for week_num in range(1, weeks_in_year(year) + 1):
+            week = week_info(year, week_num)
+            display_text = f"{week_num}주차 ({week.start.strftime('%m.%d')}~{week.end.strftime('%m.%d')})"
+            week_data[year].append({'week': week_num, 'display': display_text})
+    return json.dumps(week_data)
+
+
+def _weeks_q(weeks: Iterable[Week]) -> Q:
+    q = Q(pk__in=[])
+    for year, week_number in weeks:
+        q |= Q(year=year, week_number=week_number)
+    return q
+
+
+def locked_weeks(user: User, weeks: Iterable[Week]) -> set:
+    """
+    입력이 마감된 주차 집합. 사용자가 소속된 팀의 리포트나 팀 지정 없는(전체) 리포트 중
+    하나라도 마감(editable=False)되었으면 해당 주차의 워크로그는 수정할 수 없습니다. (쿼리 1회)
+    """
+    weeks = list(weeks)
+    if not weeks:
+        return set()
+    user_teams = TeamMembership.objects.filter(user=user).values('team_id')
+    closed = WeeklyReport.objects.filter(
+        _weeks_q(weeks),
+        Q(team__isnull=True) | Q(team_id__in=user_teams),
+        editable=False,
+    ).values_list('year', 'week_number')
+    return set(closed)
+
+
+def load_week_statuses(user: User, weeks: Iterable[Week]) -> List[Dict]:
+    """주차별 작성한 워크로그와 입력 가능 여부 (워크로그 1회 + 리포트 1회 조회)"""
+    weeks = list(weeks)
+    worklogs = {
+        (log.year, log.week_number): log
+        for log in Worklog.objects.filter(_weeks_q(weeks), author=user).order_by()
+    }
+    locked = locked_weeks(user, weeks)
+
+    statuses = []
+    for year, week_number in weeks:
+        week = week_info(year, week_number)
+        statuses.append({
+            'year': year,
+            'week_number': week_number,
+            'month_week_display': week.label,
+            'worklog_instance': worklogs.get((year, week_number)),
+            'week_start_date': week.start,
+            'week_end_date': week.end,
+            'editable': (year, week_number) not in locked,
+        })
+    return statuses
@@ -6,13 +6,13 @@ from django.urls import reverse, reverse_lazy
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView
 from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
-from django.db.models import Q
 from .models import Worklog, WorklogFile
 from reports.models import WeeklyReport, WeeklyReportPersonalComment
 from .forms import WorklogForm, WorklogFileForm
+from .services import load_week_statuses, load_worklog_history, locked_weeks, week_choices_json
 from task.models import Task
+from common.week_calendar import week_info
 from app.services import generate_writing_guide
-import json
 
 
 def get_previous_personal_comment_data(user, year, week_number):
@@ -68,54 +68,14 @@ def my_worklog_history(request):
     current_year = datetime.date.today().year
     year_choices = list(range(current_year - 3, current_year + 1))
 
-    # 연도별 주차 정보 생성 (for JavaScript)
-    week_data = {}
-    for year in year_choices:
-        week_data[year] = []
-        for week_num in range(1, 54):
-            try:
-                week_start = datetime.date.fromisocalendar(year, week_num, 1)
-                if week_start.year != year and week_num > 1:
-                    continue
-                week_end = week_start + datetime.timedelta(days=4)
-                display_text = f"{week_num}주차 ({week_start.strftime('%m.%d')}~{week_end.strftime('%m.%d')})"
-                week_data[year].append({'week': week_num, 'display': display_text})
-            except ValueError:
-                break
-
-    worklogs_data = []
-    worklogs = Worklog.objects.filter(
-        author=request.user
-    ).order_by('-year', '-week_number')
-
-    # 기간 필터링
-    worklogs = worklogs.filter(
-        Q(year__gt=int(start_year)) |
-        Q(year=int(start_year), week_number__gte=int(start_week))
+    # 기간 내 워크로그와 전주 계획 (쿼리 1회)
+    worklogs_data = load_worklog_history(
+        request.user.pk, (int(start_year), int(start_week)), (int(end_year), int(end_week))
     )
-    worklogs = worklogs.filter(
-        Q(year__lt=int(end_year)) |
-        Q(year=int(end_year), week_number__lte=int(end_week))
-    )
-
-    for log in worklogs:
-        prev_week_date = log.week_start_date - datetime.timedelta(days=7)
-        prev_year, prev_week, _ = prev_week_date.isocalendar()
-        
-        previous_worklog = Worklog.objects.filter(
-            author=request.user,
-            year=prev_year,
-            week_number=prev_week
-        ).first()
-        
-        worklogs_data.append({
-            'worklog': log,
-            'previous_week_plan': previous_worklog.next_week_plan if previous_worklog else ''
-        })
 
     context = {
         'year_choices': year_choices,
-        'week_data_json': json.dumps(week_data),
+        'week_data_json': week_choices_json(tuple(year_choices)),
         'start_year': start_year,
         'start_week': start_week,
         'end_year': end_year,
@@ -162,28 +122,8 @@ class WorklogListView(LoginRequiredMixin, ListView):
         # 중복 제거 및 정렬
         weeks_to_display = sorted(list(set(weeks_to_display)), reverse=True)
 
-        # 각 주차별로 Worklog 존재 여부 확인
-        weeks_data = []
-        for year, week_num in weeks_to_display:
-            worklog = Worklog.objects.filter(author=user, year=year, week_number=week_num).first()
-            temp_worklog = Worklog(year=year, week_number=week_num) # for display
-            week_start_date = datetime.date.fromisocalendar(year, week_num, 1)
-            week_end_date = week_start_date + datetime.timedelta(days=4)
-            weekly_report = WeeklyReport.objects.filter(year=year, week_number=week_num).first()
-            editable = True
-            if weekly_report:
-                editable = weekly_report.editable
-     
-
-            weeks_data.append({
-                'year': year,
-                'week_number': week_num,
-                'month_week_display': temp_worklog.month_week_display,
-                'worklog_instance': worklog,
-                'week_start_date': week_start_date,
-                'week_end_date': week_end_date,
-                'editable' : editable
-            })
+        # 주차별 작성 여부와 입력마감 여부 (주차 수와 무관하게 2회 조회)
+        weeks_data = load_week_statuses(user, weeks_to_display)
 
         context['weeks_data'] = weeks_data
         context['title'] = "주간업무"
@@ -233,37 +173,10 @@ class WorklogCreateView(LoginRequiredMixin, CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        start_date = datetime.date.fromisocalendar(self.kwargs.get('year'), self.kwargs.get('week_number'), 1)
-        end_date = start_date + datetime.timedelta(days=4)
-        month_week_display = ''
-
-            # 주의 시작과 끝이 같은 달인 경우
-        if start_date.month == end_date.month:
-            # 해당 월의 첫 번째 월요일을 찾아서 몇 번째 주인지 계산
-            first_monday = start_date.replace(day=1)
-            while first_monday.weekday() != 0:  # 0 = 월요일
-                first_monday += datetime.timedelta(days=1)
-            
-            week_diff = (start_date - first_monday).days // 7 + 1
-            month_week_display = f"{start_date.month}월 {week_diff}주차"
-        else:
-            # 주가 두 달에 걸쳐있는 경우, 더 많은 날이 포함된 달 기준
-            if start_date.day <= 3:  # 월요일~수요일이 이전 달
-                month = end_date.month
-                first_monday = end_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (end_date - first_monday).days // 7 + 1
-            else:  # 목요일~일요일이 다음 달
-                month = start_date.month
-                first_monday = start_date.replace(day=1)
-                while first_monday.weekday() != 0:
-                    first_monday += datetime.timedelta(days=1)
-                week_diff = (start_date - first_monday).days // 7 + 1
-            
-            month_week_display = f"{month}월 {week_diff}주차"    
+        week = week_info(self.kwargs.get('year'), self.kwargs.get('week_number'))
+        start_date, end_date = week.start, week.end
 
-        context['title'] = month_week_display
+        context['title'] = week.label
         context['start_date'] = start_date
         context['end_date'] = end_date
 
@@ -416,9 +329,8 @@ class WorklogDetailView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        weekly_report = WeeklyReport.objects.filter(year=self.object.year, week_number=self.object.week_number).first()
-        print(weekly_report)
-        context['editable'] = weekly_report.editable if weekly_report else True
+        week = (self.object.year, self.object.week_number)
+        context['editable'] = week not in locked_weeks(self.request.user, [week])
         context['file_form'] = WorklogFileForm()
         context['files'] = self.object.files.all()
         return context